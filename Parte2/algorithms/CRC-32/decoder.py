@@ -1,110 +1,81 @@
 #!/usr/bin/env python3
 # CRC32 - Receptor
-# Uso:
-#   python decoder.py in/msg1_crc32.txt in/msg2_crc32.txt --verbose
+# Uso (como módulo desde la raíz del repositorio, donde está el núcleo coding/):
+#   python -m Parte2.algorithms.CRC-32.decoder archivo1.txt archivo2.txt --verbose
+#   python -m Parte2.algorithms.CRC-32.decoder <bits> --backend=zlib   (table, slicing8 o zlib; también con CRC32_BACKEND)
+#   python -m Parte2.algorithms.CRC-32.decoder - < trama_grande.txt   (lee stdin por pedazos con memoria constante; solo imprime el status)
+#   python -m Parte2.algorithms.CRC-32.decoder <bits> --variant=crc16   (crc8, crc16, crc16-arc, crc32, crc32c, crc64, crc64-ecma)
+#   python -m Parte2.algorithms.CRC-32.decoder <bits> --correct=1   (corrige errores de 1 bit; --correct=2 hasta 2 bits)
+#   python -m Parte2.algorithms.CRC-32.decoder --stream   (una trama o un JSON {"trama": ..., "id": ...} por línea en stdin,
+#       un resultado JSON por línea en stdout)
+import sys
 
-import sys, os
+from coding.bitconv import is_binary
+from coding.cli import run_stream, stream_field
+from coding.crc import CRC_VARIANTS, DEFAULT_VARIANT, decode_crc, set_crc_backend, verify_crc_file
 
-def is_binary(s: str) -> bool:
-    return len(s) > 0 and all(c in "01" for c in s)
-
-def binary_to_bytes(binary_str: str, byte_size: int = 8):
-    """Convierte string binario a lista de enteros (bytes)"""
-    bytes_list = []
-    for i in range(0, len(binary_str), byte_size):
-        block = binary_str[i:i + byte_size]
-        if len(block) == byte_size:  # Solo procesar bloques completos
-            bytes_list.append(int(block, 2))
-    return bytes_list
-
-def create_crc_table():
-    poly = 0xedb88320
-    table = []
-    for i in range(256):
-        c = i
-        for j in range(8):
-            if c & 1:
-                c = poly ^ (c >> 1)
-            else:
-                c = c >> 1
-        table.append(c & 0xffffffff)
-    return table
-
-crc_table = create_crc_table()
-
-def crc32(data):
-    crc = 0xffffffff
-    for byte in data:
-        crc = crc_table[(crc ^ byte) & 0xff] ^ (crc >> 8)
-    return crc ^ 0xffffffff
-
-def verify_crc(received_message: str, verbose: bool = False):
-    """
-    Verifica un mensaje con CRC32
-    Retorna (status, original_data, info)
-    status: "OK", "ERROR" 
-    original_data: datos originales sin CRC
-    info: información adicional para debug
-    """
-    
-    checksum_bits = 32
-    if len(received_message) < checksum_bits:
-        return "ERROR", "", "Mensaje demasiado corto para contener CRC"
-    
-    data_part = received_message[:-checksum_bits]
-    received_crc_str = received_message[-checksum_bits:]
-    received_crc = int(received_crc_str, 2)
-    if verbose:
-        print(f"Mensaje recibido: {received_message}")
-        print(f"Longitud total: {len(received_message)} bits")
-        print(f"Parte de datos: {data_part} ({len(data_part)} bits)")
-        print(f"CRC recibido: {received_crc_str} ({received_crc})")
-    
-    # Convertir datos a bytes
-    if len(data_part) % 8 != 0:
-        return "ERROR", "", "Los datos no son múltiplo de 8 bits"
-    
-    data_bytes = binary_to_bytes(data_part)
-    
-    if verbose:
-        print(f"Bytes de datos: {data_bytes}")
-        print(f"Bytes en hex: {[hex(b) for b in data_bytes]}")
-    
-    # Calcular CRC de los datos recibidos
-    calculated_crc = crc32(data_bytes)
-    if verbose:
-        print(f"CRC calculado: {calculated_crc}")
-    # Comparar CRCs
-    if calculated_crc == received_crc:
-        status = "OK"
-        info = "CRCs coinciden"
-    else:
-        status = "ERROR"
-        info = f"CRCs no coinciden: calculado {calculated_crc}; recibido {received_crc}"
-    
-    return status, data_part, info
-
-def read_bits_file(path: str) -> str:
-    """Lee un archivo y retorna su contenido binario"""
-    with open(path, "r", encoding="utf-8") as f:
-        for line in f:
-            s = "".join(line.strip().split())
-            if s:
-                return s
-    return ""
+def stream(variant: str = None, correct: int = 0, inp=sys.stdin, out=sys.stdout):
+    """--stream: "crc_variant"/"crc_correct" de la línea JSON, si vienen, reemplazan los de la línea de comandos"""
+    def decode(bits: str, obj: dict) -> dict:
+        line_variant = stream_field(obj, "crc_variant", variant, (str,))
+        line_correct = stream_field(obj, "crc_correct", correct, (int,))
+        if line_correct not in (0, 1, 2):
+            raise ValueError(f"crc_correct debe ser 0, 1 o 2: {line_correct}")
+        status, original_data, fix_pos, info = decode_crc(bits, variant=line_variant, correct=line_correct)
+        result = {"algo": "crc", "status": status,
+                  "data_bits": original_data if status != "ERROR" else "", "info": info}
+        if fix_pos:
+            result["fix"] = {"pos": fix_pos}
+        return result
+    run_stream(decode, "crc", inp, out)
 
 def main():
     verbose = False
+    as_stream = False
+    variant = None
+    correct = 0
     bitstring = None
     
     for arg in sys.argv[1:]:
         if arg == "--verbose":
             verbose = True
+        elif arg.startswith("--backend="):
+            try:
+                set_crc_backend(arg.split("=", 1)[1])
+            except ValueError as e:
+                print(f"Error: {e}", file=sys.stderr)
+                sys.exit(1)
+        elif arg.startswith("--variant="):
+            variant = arg.split("=", 1)[1]
+        elif arg.startswith("--correct="):
+            correct = int(arg.split("=", 1)[1])
+        elif arg == "--stream":
+            as_stream = True
         else:
             bitstring = arg.strip()
+
+    if variant is not None and variant not in CRC_VARIANTS:
+        print(f"Error: variante no soportada: {variant} (usar {', '.join(CRC_VARIANTS)})", file=sys.stderr)
+        sys.exit(1)
+
+    if correct not in (0, 1, 2):
+        print("Error: --correct debe ser 0, 1 o 2", file=sys.stderr)
+        sys.exit(1)
+
+    if as_stream:
+        stream(variant, correct)
+        return
+
+    if bitstring == "-":
+        if variant not in (None, DEFAULT_VARIANT):
+            print("Error: la lectura por pedazos solo soporta CRC-32", file=sys.stderr)
+            sys.exit(1)
+        status, info = verify_crc_file(sys.stdin)
+        print(status if status == "OK" else f"ERROR - {info}")
+        sys.exit(0 if status == "OK" else 1)
     
     if not bitstring:
-        print("Uso: python CRC_decoder.py \"<cadena_binaria>\" [--verbose]", file=sys.stderr)
+        print("Uso: python CRC_decoder.py \"<cadena_binaria>\" [--verbose] [--backend=table|slicing8|zlib] [--variant=crc32|...] [--correct=1|2] | - | --stream", file=sys.stderr)
         sys.exit(1)
     
     if not is_binary(bitstring):
@@ -114,10 +85,15 @@ def main():
     if verbose:
         print("\n=== Procesando cadena binaria ===")
     
-    status, original_data, info = verify_crc(bitstring, verbose)
+    status, original_data, fix_pos, info = decode_crc(bitstring, verbose, variant, correct)
     
     if status == "OK":
         print(f"{original_data}")
+    elif status == "FIX":
+        print("FIX")
+        print(f"{original_data}")
+        if verbose:
+            print(f"  Bits corregidos: {fix_pos}")
     else:
         print(f"ERROR - Se detectaron errores")
         if verbose:
@@ -126,4 +102,4 @@ def main():
     print("\n")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
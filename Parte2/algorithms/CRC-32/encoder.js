@@ -2,6 +2,7 @@
 // CRC32 - Transmisor
 // Uso:
 //   node encoder.js tests/msg1.txt tests/msg2.txt --verbose
+//   node encoder.js 0110100001101001 --variant=crc16   (crc8, crc16, crc16-arc, crc32, crc32c, crc64, crc64-ecma)
 
 const fs = require('fs');
 const path = require('path');
@@ -40,6 +41,76 @@ function crc32(byte_array, checksum = 0) {
     return (checksum ^ 0xFFFFFFFF) >>> 0;
 }
 
+// ---------- CRC parametrizable ----------
+// Mismas variantes que el decoder: (width, poly, init, xorout, refin, refout).
+// Se calcula con BigInt para soportar hasta 64 bits; CRC-32 usa la tabla de arriba.
+const DEFAULT_VARIANT = 'crc32';
+const CRC_VARIANTS = {
+    'crc8':       { width: 8,  poly: 0x07n, init: 0x00n, xorout: 0x00n, refin: false, refout: false },
+    'crc16':      { width: 16, poly: 0x1021n, init: 0xFFFFn, xorout: 0x0000n, refin: false, refout: false },
+    'crc16-arc':  { width: 16, poly: 0x8005n, init: 0x0000n, xorout: 0x0000n, refin: true, refout: true },
+    'crc32':      { width: 32, poly: 0x04C11DB7n, init: 0xFFFFFFFFn, xorout: 0xFFFFFFFFn, refin: true, refout: true },
+    'crc32c':     { width: 32, poly: 0x1EDC6F41n, init: 0xFFFFFFFFn, xorout: 0xFFFFFFFFn, refin: true, refout: true },
+    'crc64':      { width: 64, poly: 0x42F0E1EBA9EA3693n, init: 0xFFFFFFFFFFFFFFFFn, xorout: 0xFFFFFFFFFFFFFFFFn, refin: true, refout: true },
+    'crc64-ecma': { width: 64, poly: 0x42F0E1EBA9EA3693n, init: 0n, xorout: 0n, refin: false, refout: false },
+};
+
+function reflectBits(value, width) {
+    let r = 0n;
+    for (let i = 0; i < width; i++) {
+        r = (r << 1n) | (value & 1n);
+        value >>= 1n;
+    }
+    return r;
+}
+
+// Tablas de 256 entradas por variante, se arman la primera vez que se usan
+const variantTables = new Map();
+
+function variantTable(name) {
+    let values = variantTables.get(name);
+    if (values) return values;
+    const { width, poly, refin } = CRC_VARIANTS[name];
+    const w = BigInt(width);
+    const mask = (1n << w) - 1n;
+    values = new Array(256);
+    if (refin) {
+        const rpoly = reflectBits(poly, width);
+        for (let i = 0; i < 256; i++) {
+            let c = BigInt(i);
+            for (let j = 0; j < 8; j++) c = (c & 1n) ? (c >> 1n) ^ rpoly : c >> 1n;
+            values[i] = c;
+        }
+    } else {
+        const top = 1n << (w - 1n);
+        for (let i = 0; i < 256; i++) {
+            let c = BigInt(i) << (w - 8n);
+            for (let j = 0; j < 8; j++) c = (c & top) ? ((c << 1n) ^ poly) & mask : (c << 1n) & mask;
+            values[i] = c;
+        }
+    }
+    variantTables.set(name, values);
+    return values;
+}
+
+function crcVariant(byte_array, name) {
+    const { width, init, xorout, refin, refout } = CRC_VARIANTS[name];
+    const values = variantTable(name);
+    const w = BigInt(width);
+    const mask = (1n << w) - 1n;
+    let crc;
+    if (refin) {
+        crc = reflectBits(init, width);
+        for (const byte of byte_array) crc = values[Number((crc ^ BigInt(byte)) & 0xFFn)] ^ (crc >> 8n);
+    } else {
+        crc = init;
+        const shift = w - 8n;
+        for (const byte of byte_array) crc = values[Number(((crc >> shift) ^ BigInt(byte)) & 0xFFn)] ^ ((crc << 8n) & mask);
+    }
+    if (refin !== refout) crc = reflectBits(crc, width);
+    return crc ^ xorout;
+}
+
 function binaryToBytes(binaryStr) {
     const bitsPerByte = 8;
     let padding = (bitsPerByte - binaryStr.length % bitsPerByte) % bitsPerByte;
@@ -58,7 +129,7 @@ function binaryToBytes(binaryStr) {
     return {bytes, padded};
 }
 
-function encodeWithCrc(dataBits, verbose = false) {
+function encodeWithCrc(dataBits, verbose = false, variant = DEFAULT_VARIANT) {
     if (verbose) {
         console.log(`Mensaje original: ${dataBits} (${dataBits.length} bits)`);
     }
@@ -67,9 +138,10 @@ function encodeWithCrc(dataBits, verbose = false) {
     const {bytes: dataBytes, padded: paddedData} = binaryToBytes(dataBits);
     
     // Calcular CRC
-    const crcValue = crc32(dataBytes);
+    const width = CRC_VARIANTS[variant].width;
+    const crcValue = variant === DEFAULT_VARIANT ? crc32(dataBytes) : crcVariant(dataBytes, variant);
     
-    const crcBits = crcValue.toString(2).padStart(32, '0');
+    const crcBits = crcValue.toString(2).padStart(width, '0');
     
     // Mensaje completo = datos con padding + CRC
     const fullMessage = paddedData + crcBits;
@@ -90,6 +162,12 @@ function encodeWithCrc(dataBits, verbose = false) {
 
 // ===== main =====
 const verbose = process.argv.includes('--verbose');
+const variantArg = process.argv.find(a => a.startsWith('--variant='));
+const variant = variantArg ? variantArg.split('=')[1] : DEFAULT_VARIANT;
+
+if (!CRC_VARIANTS[variant]) {
+    fail(`Variante no soportada: ${variant} (usar ${Object.keys(CRC_VARIANTS).join(', ')})`);
+}
 
 const args = process.argv.filter(a => !a.startsWith('--'));
 if (args.length >= 3) {
@@ -100,14 +178,14 @@ if (args.length >= 3) {
         process.exit(1);
     }
 
-    const result = encodeWithCrc(bits, verbose);
+    const result = encodeWithCrc(bits, verbose, variant);
 
     // Debug solo si verbose
     if (verbose) {
         console.error(`Mensaje original: ${bits.length} bits`);
-        console.error(`Mensaje con CRC32: ${result.fullMessage.length} bits`);
-        console.error(`Overhead: ${result.fullMessage.length - bits.length} bits (32 bits de CRC + padding)`);
-        console.error(`CRC-32: ${result.crcBits}`);
+        console.error(`Mensaje con ${variant}: ${result.fullMessage.length} bits`);
+        console.error(`Overhead: ${result.fullMessage.length - bits.length} bits (${result.crcBits.length} bits de CRC + padding)`);
+        console.error(`${variant}: ${result.crcBits}`);
         console.error(`Mensaje final enviado:`);
     }
 
@@ -117,7 +195,7 @@ if (args.length >= 3) {
     process.exit(0);
 }
 
-console.error('Uso: node CRC_encoder.js "<cadena_binaria>" [--verbose]');
+console.error(`Uso: node CRC_encoder.js "<cadena_binaria>" [--verbose] [--variant=${Object.keys(CRC_VARIANTS).join('|')}]`);
 process.exit(1);
 
 
@@ -1,137 +1,90 @@
 #!/usr/bin/env python3
 # Fletcher Checksum - Receptor
-# Uso:
-#   python decoder.py in/msg1_fletcher16.txt in/msg2_fletcher16.txt --verbose --block-size=16
-
+# Uso (como módulo desde la raíz del repositorio, donde está el núcleo coding/):
+#   python -m Parte2.algorithms.FletcherChecksum.decoder archivo1.txt archivo2.txt --verbose --block-size=16
+#   python -m Parte2.algorithms.FletcherChecksum.decoder <bits> --variant=fletcher32 --order=sum1_sum2   (variantes en FLETCHER_VARIANTS)
+#   python -m Parte2.algorithms.FletcherChecksum.decoder <bits> --adler   (Adler-32: bloques de 8 bits, módulo 65521)
+#   python -m Parte2.algorithms.FletcherChecksum.decoder - [--block-size=8]   (trama por pedazos desde stdin, memoria constante)
+#   python -m Parte2.algorithms.FletcherChecksum.decoder --stream [--block-size=8]   (una trama o un JSON {"trama": ..., "id": ...,
+#       "variant"/"order"/"block_size": ...} por línea en stdin, un resultado JSON por línea)
 import sys, os
 
-def is_binary(s: str) -> bool:
-    return len(s) > 0 and all(c in "01" for c in s)
-
-def text_to_binary(text: str) -> str:
-    return ''.join(f'{ord(c):08b}' for c in text)
-
-def binary_to_text(binary_str: str) -> str:
-    chars = []
-    for i in range(0, len(binary_str), 8):
-        byte = binary_str[i:i+8]
-        if len(byte) == 8:
-            chars.append(chr(int(byte, 2)))
-    return ''.join(chars)
-
-def bytes_to_blocks(binary_str: str, block_size: int):
-    """Convierte string binario a lista de enteros (bloques)"""
-    blocks = []
-    for i in range(0, len(binary_str), block_size):
-        block = binary_str[i:i + block_size]
-        if len(block) == block_size:
-            blocks.append(int(block, 2))
-    return blocks
-
-def fletcher16_8(data):
-    """Fletcher 16 sobre bloques de 8 bits"""
-    sum1 = 0  
-    sum2 = 0 
-    modulus = 255  # para sumas parciales
-    for b in data:
-        sum1 = (sum1 + b) % modulus
-        sum2 = (sum2 + sum1) % modulus
-    # El checksum final es sum2 << 8 | sum1, pero en 16 bits
-    return sum1, sum2, (sum2 << 8) | sum1
-
-def fletcher_checksum(data, block_size: int):
-    """Calcula Fletcher checksum"""
-    modulus = (1 << block_size) - 1  # 2^block_size - 1
-    sum1 = 0  
-    sum2 = 0  
-    for byte_val in data:
-        sum1 = (sum1 + byte_val) % modulus
-        sum2 = (sum2 + sum1) % modulus
-    return sum1, sum2
-
-def verify_fletcher(received_message: str, block_size: int = 16, verbose: bool = False):
-    if len(received_message) < block_size * 2:
-        return "ERROR", "", "Mensaje demasiado corto para contener checksum"
-    
-    # Los últimos block_size*2 bits son el checksum
-    checksum_bits = block_size * 2
-    data_part = received_message[:-checksum_bits]
-    received_checksum_str = received_message[-checksum_bits:]
-    # Ahora el orden es [sum2][sum1]
-    received_sum2_str = received_checksum_str[:block_size]
-    received_sum1_str = received_checksum_str[block_size:]
-    received_sum2 = int(received_sum2_str, 2)
-    received_sum1 = int(received_sum1_str, 2)
-    if verbose:
-        print(f"Mensaje recibido: {received_message}")
-        print(f"Longitud total: {len(received_message)} bits")
-        print(f"Parte de datos: {data_part} ({len(data_part)} bits)")
-        print(f"Checksum recibido: sum1={received_sum1_str} ({received_sum1}), sum2={received_sum2_str} ({received_sum2})")
-    
-    # Convertir datos a bloques
-    if len(data_part) % block_size != 0:
-        return "ERROR", "", f"Los datos no son múltiplo de {block_size} bits"
-    
-    data_blocks = bytes_to_blocks(data_part, block_size)
-    
-    if verbose:
-        print(f"Bloques de datos: {data_blocks}")
-        print(f"Bloques en hex: {[hex(b) for b in data_blocks]}")
-    
-    # Calcular checksum de los datos recibidos
-    calculated_sum1, calculated_sum2 = fletcher_checksum(data_blocks, block_size)
-    if verbose:
-        print(f"Checksum calculado: sum1={calculated_sum1}, sum2={calculated_sum2}")
-    # Comparar checksums
-    if calculated_sum1 == received_sum1 and calculated_sum2 == received_sum2:
-        status = "OK"
-        info = "Checksums coinciden"
-    else:
-        status = "ERROR"
-        info = f"Checksums no coinciden: calculado sum1={calculated_sum1}, sum2={calculated_sum2}; recibido sum1={received_sum1}, sum2={received_sum2}"
-    
-    return status, data_part, info
-
-def read_bits_file(path: str) -> str:
-    """Lee un archivo y retorna su contenido binario"""
-    with open(path, "r", encoding="utf-8") as f:
-        for line in f:
-            s = "".join(line.strip().split())
-            if s:
-                return s
-    return ""
-
-def infer_block_size_from_filename(filename: str) -> int:
-    """Intenta inferir el tamaño de bloque del nombre del archivo"""
-    if 'fletcher8' in filename:
-        return 8
-    elif 'fletcher32' in filename:
-        return 32
-    else:
-        return 16 
+from coding.bitconv import is_binary, text_to_binary
+from coding.cli import read_bits_file, run_stream, stream_field
+from coding.fletcher import ChecksumVerifier, fletcher_verifier, variant_for_block_size, verify_fletcher_file
+
+def line_verifier(obj: dict, default: ChecksumVerifier) -> ChecksumVerifier:
+    """Verificador de una línea de --stream: "variant"/"order" (o "block_size") del JSON, si vienen"""
+    variant = stream_field(obj, "variant", None, (str,))
+    order = stream_field(obj, "order", None, (str,))
+    block_size = stream_field(obj, "block_size", None, (int,))
+    if variant is None and block_size is not None:
+        variant = variant_for_block_size(block_size)
+    if variant is None and order is None:
+        return default
+    return fletcher_verifier(variant or default.variant, order or default.order)
+
+def algo_name(variant: str) -> str:
+    return "adler" if variant == "adler32" else "fletcher"
+
+def stream(verifier: ChecksumVerifier = None, inp=sys.stdin, out=sys.stdout):
+    """--stream: cada línea se verifica con line_verifier (el de la línea de comandos si el JSON no trae variante)"""
+    default = verifier or fletcher_verifier()
+    def decode(bits: str, obj: dict) -> dict:
+        verifier = line_verifier(obj, default)
+        status, original_data, info = verifier.verify(bits)
+        return {"algo": algo_name(verifier.variant), "status": status, "variant": verifier.variant,
+                "block_size": verifier.block_size, "data_bits": original_data if status == "OK" else "", "info": info}
+    run_stream(decode, algo_name(default.variant), inp, out)
 
 def main():
     verbose = False
-    block_size = 8 
+    block_size = None
+    variant = None
+    order = None
     files = []
+    as_stream = False
     
+    # Las opciones se leen una sola vez; la variante no depende del archivo ni del largo
     for arg in sys.argv[1:]:
         if arg == "--verbose":
             verbose = True
+        elif arg == "--stream":
+            as_stream = True
+        elif arg == "--adler":
+            variant = "adler32"
+        elif arg == "--fletcher16_8":
+            variant = "fletcher16"  # Fletcher-16 estándar: bloques de 8 bits
+        elif arg.startswith("--variant="):
+            variant = arg.split("=", 1)[1]
+        elif arg.startswith("--order="):
+            order = arg.split("=", 1)[1]
         elif arg.startswith("--block-size="):
             block_size = int(arg.split("=")[1])
-        elif arg == "--fletcher16_8":
-            continue  
         else:
             files.append(arg)
     
-    # Validar tamaño de bloque
-    if block_size and block_size not in [4, 8, 16, 32]:
-        print("Error: El tamaño de bloque debe ser 4, 8, 16 o 32 bits", file=sys.stderr)
+    # Validar variante (o tamaño de bloque) y orden
+    try:
+        if variant is None:
+            variant = variant_for_block_size(block_size or 8)
+        verifier = fletcher_verifier(variant, order)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
+
+    if as_stream:
+        stream(verifier)
+        return
+
+    if files == ["-"]:
+        status, info = verify_fletcher_file(sys.stdin, verifier.new_state(), order=verifier.order)
+        print(status if status == "OK" else f"ERROR - {info}")
+        sys.exit(0 if status == "OK" else 1)
     
     if len(files) < 1:
-        print("Uso: python fletcher_decoder.py <archivo1> [archivo2 ...] [--verbose] [--block-size=8|16|32]", file=sys.stderr)
+        print("Uso: python fletcher_decoder.py <archivo1> [archivo2 ...] [--verbose] [--block-size=4|8|16|32] "
+              "[--variant=fletcher8|fletcher16|fletcher32|fletcher64|adler32] [--adler] [--order=sum2_sum1|sum1_sum2] | --stream | -", file=sys.stderr)
         print("Los archivos pueden estar en cualquier carpeta (out/, in/, tests/, etc.)", file=sys.stderr)
         sys.exit(1)
     
@@ -150,51 +103,18 @@ def main():
                 print(f"{file_path}: El contenido no es binario, se asume texto ASCII y se convierte a binario.")
             bits = text_to_binary(bits)
 
-        # Inferir tamaño de bloque si no se especificó
-        current_block_size = block_size or (infer_block_size_from_filename(file_path) if is_file else 16)
-
         if verbose:
             print(f"\n=== Procesando {file_path if is_file else '[cadena directa]'} ===")
-            print(f"Tamaño de bloque: {current_block_size} bits")
+            print(f"Variante: {verifier.variant} (bloques de {verifier.block_size} bits, orden {verifier.order})")
 
-        # Modo especial: Fletcher-16 sobre bloques de 8 bits (estándar)
-        if '--fletcher16_8' in sys.argv or (current_block_size == 8 and len(bits) == 48):
-            filename = os.path.basename(file_path) if is_file else '[cadena directa]'
-            data_blocks = bytes_to_blocks(bits[:-16], 8)
-            sum1, sum2, checksum_calc = fletcher16_8(data_blocks)
-            checksum_recv = int(bits[-16:], 2)
-            if checksum_calc == checksum_recv:
-                print("OK")
-                print(bits[:-16])
-            else:
-                print("ERROR FLETCHER")
-                print("Checksum invalido")
-            if verbose:
-                print(f"{filename} -> {'OK' if checksum_calc == checksum_recv else 'ERROR - Se detectaron errores'}")
-                print(f"  Datos recibidos (sin checksum): {bits[:-16]}")
-                print(f"  Detalle de verificación Fletcher 16 (bloques de 8 bits):")
-                print(f"    Dato (bloque 8 bits)   Sum1   Sum2")
-                sum1_step = 0  
-                sum2_step = 0 
-                for block in data_blocks:
-                    sum1_step = (sum1_step + block) % 255
-                    sum2_step = (sum2_step + sum1_step) % 255
-                    print(f"    {format(block, '08b')} ({block})   {format(sum1_step, '08b')} ({sum1_step})   {format(sum2_step, '08b')} ({sum2_step})")
-                calc_bits = format(checksum_calc, '016b')
-                recv_bits = format(checksum_recv, '016b')
-                if checksum_calc == checksum_recv:
-                    print(f"  Checksum = {calc_bits} = {recv_bits}. OK")
-                else:
-                    print(f"  Checksum = {calc_bits} != {recv_bits}. ERROR")
+        status, original_data, info = verifier.verify(bits, verbose)
+        # Salida simple para integración con servidor/cliente
+        if status == "OK":
+            print("OK")
+            print(original_data)
         else:
-            status, original_data, info = verify_fletcher(bits, current_block_size, verbose)
-            # Salida simple para integración con servidor/cliente
-            if status == "OK":
-                print("OK")
-                print(original_data)
-            else:
-                print("ERROR FLETCHER")
-                print(info)
+            print("ERROR ADLER" if verifier.variant == "adler32" else "ERROR FLETCHER")
+            print(info)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
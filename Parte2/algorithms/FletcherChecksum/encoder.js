@@ -2,6 +2,8 @@
 // Uso:
 //   node encoder.js tests/msg1.txt tests/msg2.txt --verbose --block-size=16
 //   node encoder.js tests/msg1.txt --block-size=8
+//   node encoder.js tests/msg1.txt --adler     (Adler-32: sumas de 16 bits módulo 65521, sum1 empieza en 1)
+//   node encoder.js tests/msg1.txt --variant=fletcher32 --order=sum1_sum2
 
 // Convierte un string binario a bloques de tamaño blockSize
 function binaryToBytes(binaryStr, blockSize) {
@@ -17,7 +19,7 @@ function binaryToBytes(binaryStr, blockSize) {
 }
 
 // Implementación principal del encoder Fletcher
-function encodeWithFletcher(dataBits, blockSize = 8, verbose = false) {
+function encodeWithFletcher(dataBits, blockSize = 8, verbose = false, order = 'sum2_sum1') {
     if (verbose) {
         console.log(`Mensaje original: ${dataBits} (${dataBits.length} bits)`);
     }
@@ -55,7 +57,7 @@ function encodeWithFletcher(dataBits, blockSize = 8, verbose = false) {
     // Mostrar cómo se arma el checksum
     const sum1Bits = sum1.toString(2).padStart(blockSize, '0');
     const sum2Bits = sum2.toString(2).padStart(blockSize, '0');
-    const checksumBits = sum2Bits + sum1Bits; // [sum2][sum1]
+    const checksumBits = order === 'sum1_sum2' ? sum1Bits + sum2Bits : sum2Bits + sum1Bits; // [sum2][sum1] por defecto
     if (verbose) {
         console.log(`\nChecksum:`);
         console.log(`  sum1: ${sum1} (${sum1Bits})`);
@@ -81,6 +83,37 @@ function encodeWithFletcher(dataBits, blockSize = 8, verbose = false) {
     };
 }
 
+// Adler-32: mismo esquema [datos][sum2][sum1], sobre bytes, con módulo primo 65521,
+// sum1 (A) empezando en 1 y cada suma en 16 bits
+const ADLER_MODULUS = 65521;
+
+function encodeWithAdler(dataBits, verbose = false, order = 'sum2_sum1') {
+    const { blocks: dataBlocks } = binaryToBytes(dataBits, 8);
+    let sum1 = 1;
+    let sum2 = 0;
+    for (let i = 0; i < dataBlocks.length; i++) {
+        sum1 = (sum1 + dataBlocks[i]) % ADLER_MODULUS;
+        sum2 = (sum2 + sum1) % ADLER_MODULUS;
+    }
+    const sum1Bits = sum1.toString(2).padStart(16, '0');
+    const sum2Bits = sum2.toString(2).padStart(16, '0');
+    const checksumBits = order === 'sum1_sum2' ? sum1Bits + sum2Bits : sum2Bits + sum1Bits;
+    const dataBin = dataBlocks.map(block => block.toString(2).padStart(8, '0')).join('');
+    if (verbose) {
+        console.log(`\n--- Adler-32 (${dataBlocks.length} bytes) ---`);
+        console.log(`  sum1 (A): ${sum1}`);
+        console.log(`  sum2 (B): ${sum2}`);
+        console.log(`  Checksum (${order}): ${checksumBits} (B << 16 | A = 0x${(sum2 * 65536 + sum1).toString(16).padStart(8, '0')})`);
+    }
+    return {
+        originalBits: dataBits,
+        dataBin: dataBin,
+        checksumBits: checksumBits,
+        fullMessage: dataBin + checksumBits,
+        blockSize: 8
+    };
+}
+
 const fs = require('fs');
 const path = require('path');
 
@@ -102,12 +135,21 @@ function textToBinary(text) {
 const rawArgs = process.argv.slice(2);
 const verbose = rawArgs.includes('--verbose');
 
-// Forzar siempre bloques de 8 bits para Fletcher
-const blockSize = 8;
-
-// Validar tamaño de bloque
-if (![4, 8, 16, 32].includes(blockSize)) {
-    fail('El tamaño de bloque debe ser 4, 8, 16 o 32 bits');
+// Variante -> tamaño de bloque (igual que FLETCHER_VARIANTS en decoder.py); por defecto bloques de 8 bits
+const FLETCHER_VARIANTS = { fletcher8: 4, fletcher16: 8, fletcher32: 16, fletcher64: 32, adler32: 8 };
+const variantArg = rawArgs.find(a => a.startsWith('--variant='));
+const variant = rawArgs.includes('--adler') ? 'adler32' : (variantArg ? variantArg.split('=')[1] : 'fletcher16');
+const adler = variant === 'adler32';
+const blockSize = FLETCHER_VARIANTS[variant];
+const orderArg = rawArgs.find(a => a.startsWith('--order='));
+const order = orderArg ? orderArg.split('=')[1] : 'sum2_sum1';
+
+// Validar variante y orden
+if (!blockSize) {
+    fail(`Variante no soportada: ${variant} (${Object.keys(FLETCHER_VARIANTS).join(', ')})`);
+}
+if (!['sum2_sum1', 'sum1_sum2'].includes(order)) {
+    fail(`Orden no soportado: ${order} (sum2_sum1 o sum1_sum2)`);
 }
 
 // Directorio de salida
@@ -146,17 +188,17 @@ if (args.length >= 1) {
         if (verbose) {
             console.log(`\n=== Procesando ${isFile ? inputArg : '[cadena directa]'} ===`);
         }
-        const result = encodeWithFletcher(bits, blockSize, verbose);
+        const result = adler ? encodeWithAdler(bits, verbose, order) : encodeWithFletcher(bits, blockSize, verbose, order);
 
         if (isFile) {
             const base = path.basename(inputArg, path.extname(inputArg));
-            const outFile = path.join(outDir, `${base}_fletcher${blockSize}.txt`);
+            const outFile = path.join(outDir, adler ? `${base}_adler32.txt` : `${base}_fletcher${blockSize}.txt`);
             fs.writeFileSync(outFile, result.fullMessage + '\n');
             if (verbose) {
                 console.log(`✓ Archivo generado: ${outFile}`);
                 console.log(`  Mensaje original: ${bits.length} bits`);
                 console.log(`  Mensaje con Fletcher: ${result.fullMessage.length} bits`);
-                console.log(`  Overhead: ${result.fullMessage.length - bits.length} bits (${blockSize*2} bits de checksum + padding)`);
+                console.log(`  Overhead: ${result.fullMessage.length - bits.length} bits (${result.checksumBits.length} bits de checksum + padding)`);
             } else {
                 console.log(`✓ Archivo generado: ${outFile}`);
             }
@@ -169,5 +211,5 @@ if (args.length >= 1) {
     process.exit(0);
 } else {
     // Si se llega aquí, no hubo archivos válidos
-    fail('Uso: node fletcher_encoder.js <archivo1> [archivo2 ...] [--verbose] [--block-size=8|16|32]');
+    fail('Uso: node fletcher_encoder.js <archivo1> [archivo2 ...] [--verbose] [--variant=fletcher8|fletcher16|fletcher32|fletcher64|adler32] [--adler] [--order=sum2_sum1|sum1_sum2]');
 }
\ No newline at end of file
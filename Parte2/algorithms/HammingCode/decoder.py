@@ -1,100 +1,78 @@
 #!/usr/bin/env python3
 # Código Hamming - Receptor
-# Uso:
-#   python decoder.py in/msg1_ok.txt in/msg2_err1.txt --verbose
-#   python decoder.py 1011001 [--verbose]
-
+# Uso (como módulo desde la raíz del repositorio, donde está el núcleo coding/):
+#   python -m Parte2.algorithms.HammingCode.decoder archivo1.txt archivo2.txt --verbose
+#   python -m Parte2.algorithms.HammingCode.decoder 1011001 [--verbose]
+#   python -m Parte2.algorithms.HammingCode.decoder 1011001 --block=7   (bloques (7,4), (15,11), (31,26) o (63,57))
+#   python -m Parte2.algorithms.HammingCode.decoder 01100110 --secded   (Hamming extendido: último bit = paridad global; DOUBLE si hay dos errores)
+#   python -m Parte2.algorithms.HammingCode.decoder --stream   (una trama o un JSON {"trama": ..., "id": ...} por línea en stdin,
+#       un resultado JSON por línea en stdout)
 import sys, os, json
 
-def is_binary(s: str) -> bool:
-    return len(s) > 0 and all(c in "01" for c in s)
-
-def is_pow2(x: int) -> bool:
-    return x > 0 and (x & (x - 1)) == 0
-
-def infer_r_from_n(n: int) -> int:
-    r = 0
-    while (1 << r) < (n + 1):
-        r += 1
-    return r
-
-def decode_hamming(codeword: str, verbose: bool=False):
-    n = len(codeword)
-    r = infer_r_from_n(n)
-
-    # La posición del array empieza en 1
-    code = [0] * (n + 1) 
-    for i, ch in enumerate(codeword, start=1):
-        code[i] = int(ch)
-
-    syndrome = 0 # código de error
-    if verbose:
-        print(f"n={n}, r={r}")
-        print("Trama recibida:", codeword)
-
-    for i in range(r):
-        p = 1 << i
-        parity = 0
-        for pos in range(1, n + 1):
-            if pos & p:
-                parity ^= code[pos]
-        if parity != 0:
-            syndrome |= p
-
-    if verbose:
-        print(f"Síndrome (dec)={syndrome}, (bin)={syndrome:0{r}b}")
-
-    fixed_pos = None
-    fixed_code = None
-
-    if syndrome == 0:
-        status = "OK"
-    elif 1 <= syndrome <= n:
-        code[syndrome] ^= 1  
-        fixed_pos = syndrome
-        fixed_code = "".join(str(bit) for bit in code[1:])
-        if verbose:
-            print(f"Se corrige bit en posición {syndrome}.")
-            print(f"Trama corregida: {fixed_code}")
-        status = "FIX"
+from coding.bitconv import is_binary
+from coding.cli import read_bits_file, read_bits_stdin, run_stream, stream_field
+from coding.hamming import BLOCK_CODES, decode_hamming, layout_cache
+
+def result_json(bits: str, status: str, msg: str, pos, fixed_code, block: int = None, secded: bool = False) -> dict:
+    n = len(bits)
+    payload = {
+        "algo": "hamming",
+        "status": status,
+        "data_bits": msg,
+        "n": n,
+        "fix": None
+    }
+    if secded:
+        payload["secded"] = True
+    if block:
+        payload["block"] = block  # fix.pos es la lista de posiciones corregidas
     else:
-        status = "DROP"
-
-    # Extraer solo datos (posiciones que NO son potencias de 2)
-    data_bits = []
-    for pos in range(1, n + 1):
-        if not is_pow2(pos):
-            data_bits.append(str(code[pos]))
-    message = "".join(data_bits)
-
-    return status, message, fixed_pos, fixed_code
-
-def read_bits_file(path: str) -> str:
-    with open(path, "r", encoding="utf-8") as f:
-        for line in f:
-            s = "".join(line.strip().split())
-            if s:
-                return s
-    return ""
-
-def read_bits_stdin() -> str:
-    data = sys.stdin.read()
-    return "".join(data.strip().split())
+        payload["r"] = layout_cache.get(n - 1 if secded and n else n).r
+        payload["syndrome"] = 0 if status in ("OK", "DOUBLE") else (pos or 0)
+    if status == "FIX":
+        payload["fix"] = {"pos": pos, "codeword": fixed_code}
+    return payload
+
+def stream(block: int = None, secded: bool = False, inp=sys.stdin, out=sys.stdout):
+    """--stream: "block"/"secded" de la línea JSON, si vienen, reemplazan los de la línea de comandos"""
+    def decode(bits: str, obj: dict) -> dict:
+        line_block = stream_field(obj, "block", block, (int,))
+        line_secded = stream_field(obj, "secded", secded, (bool,))
+        return result_json(bits, *decode_hamming(bits, block=line_block, secded=line_secded),
+                           block=line_block, secded=line_secded)
+    run_stream(decode, "hamming", inp, out)
 
 def main():
     verbose = False
     as_json = False
+    as_stream = False
+    block = None
+    secded = False
     tokens = []
     for a in sys.argv[1:]:
         if a == "--verbose":
             verbose = True
         elif a == "--json":
             as_json = True
+        elif a == "--stream":
+            as_stream = True
+        elif a == "--secded":
+            secded = True
+        elif a.startswith("--block="):
+            block = int(a.split("=")[1])
         else:
             tokens.append(a)
 
+    if block is not None and block not in BLOCK_CODES:
+        print(f"Error: el bloque debe ser {', '.join(map(str, BLOCK_CODES))}", file=sys.stderr)
+        sys.exit(1)
+
+    if as_stream:
+        stream(block, secded)
+        return
+
     if len(tokens) < 1:
-        print("Uso: python decoder.py <bits|archivo1|- > [archivo2 ...] [--verbose] [--json]", file=sys.stderr)
+        print("Uso: python decoder.py <bits|archivo1|- > [archivo2 ...] [--verbose] [--json] [--block=7|15|31|63] [--secded] | --stream", file=sys.stderr)
         sys.exit(1)
 
     any_processed = False
@@ -120,22 +98,10 @@ def main():
             print(f"{label}: contenido no binario (solo 0/1 en una línea).", file=sys.stderr)
             continue
 
-        status, msg, pos, fixed_code = decode_hamming(bits, verbose=verbose)
+        status, msg, pos, fixed_code = decode_hamming(bits, verbose=verbose, block=block, secded=secded)
 
         if as_json:
-            n = len(bits)
-            r = infer_r_from_n(n)
-            payload = {
-                "algo": "hamming",
-                "status": status,
-                "data_bits": msg,
-                "n": n,
-                "r": r,
-                "syndrome": 0 if status == "OK" else (pos or 0),
-                "fix": None
-            }
-            if status == "FIX":
-                payload["fix"] = {"pos": pos, "codeword": fixed_code}
+            payload = result_json(bits, status, msg, pos, fixed_code, block, secded)
             print(json.dumps(payload, ensure_ascii=False))
         else:
             if status == "OK":
@@ -145,7 +111,7 @@ def main():
                 print("FIX")
                 print(msg)
             else:
-                print("DROP")
+                print(status)  # DROP o DOUBLE
 
         any_processed = True
 
@@ -154,4 +120,4 @@ def main():
         sys.exit(1)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -11,6 +11,12 @@
 //   node encoder.js 1011001
 //   node encoder.js 1011001 --verbose
 //
+//   # Por bloques (7,4), (15,11), (31,26) o (63,57): cada bloque corrige su propio error
+//   node encoder.js 1011001 --block=7
+//
+//   # Hamming extendido (SECDED): agrega a cada palabra un bit de paridad global
+//   node encoder.js 1011001 --secded
+//
 
 const fs = require('fs');
 const path = require('path');
@@ -32,7 +38,7 @@ function fail(msg) {
     process.exit(1);
 }
 
-function encodeHamming(dataBits, { verbose = false } = {}) {
+function encodeHamming(dataBits, { verbose = false, secded = false } = {}) {
     const m = dataBits.length;
     const r = minimumR(m);
     const n = m + r;
@@ -76,17 +82,45 @@ function encodeHamming(dataBits, { verbose = false } = {}) {
         }
     }
 
-    const codeword = code.slice(1).join('');
+    let codeword = code.slice(1).join('');
+    if (secded) {
+        // Paridad global: XOR de toda la palabra, permite detectar dos errores
+        const overall = codeword.split('').reduce((acc, b) => acc ^ Number(b), 0);
+        if (verbose) console.log(`Paridad global → ${overall}`);
+        codeword += overall;
+    }
     if (verbose) {
         console.log('Trama codificada final:', codeword);
     }
     return codeword;
 }
 
+// Bloques soportados: n -> k (bits de datos por bloque)
+const BLOCK_CODES = { 7: 4, 15: 11, 31: 26, 63: 57 };
+
+// Parte los datos en grupos de k bits y codifica cada uno como un bloque (n, k).
+// El último grupo puede tener menos de k bits: queda como un bloque acortado.
+function encodeHammingBlocks(dataBits, n, { verbose = false, secded = false } = {}) {
+    const k = BLOCK_CODES[n];
+    const blocks = [];
+    for (let i = 0; i < dataBits.length; i += k) {
+        if (verbose) console.log(`--- Bloque ${blocks.length + 1} (${n},${k}) ---`);
+        blocks.push(encodeHamming(dataBits.slice(i, i + k), { verbose, secded }));
+    }
+    return blocks.join('');
+}
+
 // ===== main =====
 const rawArgs = process.argv.slice(2);
 const verbose = rawArgs.includes('--verbose');
-const args = rawArgs.filter(a => a !== '--verbose');
+const secded = rawArgs.includes('--secded');
+const blockArg = rawArgs.find(a => a.startsWith('--block='));
+const block = blockArg ? parseInt(blockArg.split('=')[1], 10) : null;
+const args = rawArgs.filter(a => a !== '--verbose' && a !== '--secded' && a !== blockArg);
+
+if (blockArg && !BLOCK_CODES[block]) {
+    fail(`Bloque no soportado: ${blockArg.split('=')[1]} (usar ${Object.keys(BLOCK_CODES).join(', ')})`);
+}
 
 if (args.length >= 1) {
     let processed = 0;
@@ -111,7 +145,9 @@ if (args.length >= 1) {
             }
         }
 
-        const trama = encodeHamming(bits, { verbose });
+        const trama = block
+            ? encodeHammingBlocks(bits, block, { verbose, secded })
+            : encodeHamming(bits, { verbose, secded });
         console.log(trama);
 
         processed++;
@@ -123,4 +159,4 @@ if (args.length >= 1) {
     process.exit(0);
 }
 
-fail('Uso: node encoder.js <bits|archivo1> [archivo2 ...] [--verbose]');
+fail('Uso: node encoder.js <bits|archivo1> [archivo2 ...] [--verbose] [--block=7|15|31|63] [--secded]');
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# Verifica los backends de CRC-32 (slicing-by-8 y zlib) contra la implementación
+# original (create_crc_table + crc32) y compara MB/s según el tamaño del payload.
+# Con --frame-mbits mide además una trama grande: verify_crc, Crc32Verifier por
+# pedazos y segmentos en varios procesos unidos con crc32_combine.
+# Uso (desde Parte2):
+#   python benchmarks/bench_crc.py
+#   python benchmarks/bench_crc.py --sizes 16,1024,1048576
+#   python benchmarks/bench_crc.py --sizes "" --frame-mbits 8 --workers 4
+
+import os
+import sys
+import time
+import random
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.decoders import load_decoder, crc_segment
+
+def timed(fn):
+    t0 = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - t0
+
+def bench_large_frame(crc, mbits, workers, rng):
+    """Una trama de mbits megabits verificada de tres formas; todas deben dar OK"""
+    nbytes = mbits * 1_000_000 // 8
+    data = rng.getrandbits(nbytes * 8).to_bytes(nbytes, "big")
+    data_bits = format(int.from_bytes(data, "big"), f"0{len(data) * 8}b")
+    frame = data_bits + format(crc.CRC_BACKENDS["zlib"](data), "032b")
+    chunk = crc.CHUNK_CHARS
+    segment = -(-len(data) // workers) * 8  # bits por segmento, múltiplo de 8
+
+    def incremental():
+        verifier = crc.Crc32Verifier()
+        for i in range(0, len(frame), chunk):
+            verifier.update(frame[i:i + chunk])
+        return verifier.finalize()[0]
+
+    def segmented(map_fn):
+        segments = [data_bits[i:i + segment] for i in range(0, len(data_bits), segment)]
+        ok = crc.crc32_join(map_fn(crc_segment, segments)) == int(frame[-32:], 2)
+        return "OK" if ok else "ERROR"
+
+    print(f"\nTrama de {len(frame)} bits ({len(data)} bytes de datos), backend {crc.crc_backend}:")
+    rows = [("verify_crc (trama completa)", lambda: crc.verify_crc(frame)[0]),
+            (f"Crc32Verifier (pedazos de {chunk} bits)", incremental),
+            (f"crc32_segments ({workers} segmentos, 1 proceso)", lambda: segmented(map))]
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        list(ex.map(crc_segment, ["00000000"] * workers))  # arranque de los workers
+        rows.append((f"crc32_segments ({workers} procesos)", lambda: segmented(ex.map)))
+        for label, fn in rows:
+            status, secs = timed(fn)
+            if status != "OK":
+                print(f"{label}: status {status}", file=sys.stderr)
+                sys.exit(1)
+            print(f"  {label:<44} {secs * 1e3:>9.1f} ms")
+
+def check_parity(crc, rng, max_len=300):
+    """Todos los backends dan el mismo CRC que crc32 con la tabla original"""
+    reference = crc.CRC_BACKENDS["table"]
+    table = crc.create_crc_table()
+    if table != crc.crc_table or table != crc.slicing_tables[0]:
+        return "create_crc_table() no coincide con las tablas del módulo"
+    for name, params in crc.CRC_VARIANTS.items():
+        got = crc.crc_variant(name).compute(b"123456789")
+        if got != params["check"]:
+            return f"{name}: CRC de '123456789' {got:#x} != {params['check']:#x}"
+    generic = crc.crc_variant(crc.DEFAULT_VARIANT)
+    lengths = list(range(max_len + 1)) + [1000, 4096, 4097, 65536 + 3]
+    for n in lengths:
+        data = bytes(rng.getrandbits(8) for _ in range(n))
+        expected = reference(data)
+        if generic.compute(data) != expected:
+            return f"CrcEngine de crc32 difiere con {n} bytes"
+        for name, fn in crc.CRC_BACKENDS.items():
+            got = fn(data)
+            if got != expected:
+                return f"{name} difiere con {n} bytes: {got:#010x} != {expected:#010x}"
+        # verify_crc con cada backend (bits de datos + CRC)
+        bits = "".join(format(b, "08b") for b in data) + format(expected, "032b")
+        for name in crc.CRC_BACKENDS:
+            crc.set_crc_backend(name)
+            if crc.verify_crc(bits)[0] != "OK":
+                return f"verify_crc con {name} rechaza una trama válida de {n} bytes"
+    return None
+
+def main():
+    ap = argparse.ArgumentParser(description="Backends de CRC-32: tabla original vs. slicing-by-8 vs. zlib")
+    ap.add_argument("--sizes", default="8,64,256,1024,4096,65536,1048576", help="Tamaños de payload (bytes)")
+    ap.add_argument("--min-time", type=float, default=0.2, help="Segundos mínimos por medición")
+    ap.add_argument("--frame-mbits", type=int, default=0, help="Megabits de la trama grande (0 para omitir)")
+    ap.add_argument("--workers", type=int, default=os.cpu_count() or 2, help="Procesos para crc32_segments")
+    ap.add_argument("--seed", type=int, default=1)
+    args = ap.parse_args()
+
+    crc = load_decoder("crc")
+    rng = random.Random(args.seed)
+    original_backend = crc.crc_backend
+
+    error = check_parity(crc, rng)
+    if error:
+        print(error, file=sys.stderr)
+        sys.exit(1)
+    print("OK: table, slicing8, zlib y CrcEngine dan el mismo CRC; las variantes coinciden con el catálogo")
+    crc.set_crc_backend(original_backend)
+
+    names = list(crc.CRC_BACKENDS)
+    print(f"{'Bytes':>9}" + "".join(f" {name + ' (MB/s)':>16}" for name in names) + f" {'slicing8/table':>15}")
+    for size in (int(x) for x in args.sizes.split(",") if x):
+        data = rng.randbytes(size) if hasattr(rng, "randbytes") else bytes(rng.getrandbits(8) for _ in range(size))
+        rates = {}
+        for name in names:
+            fn = crc.CRC_BACKENDS[name]
+            loops = 0
+            t0 = time.perf_counter()
+            while True:
+                fn(data)
+                loops += 1
+                elapsed = time.perf_counter() - t0
+                if elapsed >= args.min_time:
+                    break
+            rates[name] = size * loops / elapsed / 1e6
+        speedup = rates["slicing8"] / rates["table"]
+        print(f"{size:>9}" + "".join(f" {rates[name]:>16.2f}" for name in names) + f" {speedup:>14.1f}x")
+
+    if args.frame_mbits:
+        bench_large_frame(crc, args.frame_mbits, args.workers, rng)
+
+if __name__ == "__main__":
+    main()
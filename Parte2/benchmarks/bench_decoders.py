@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+# Benchmark: tramas/seg del decoder en proceso vs. un subprocess por trama
+# Uso (desde Parte2):
+#   python benchmarks/bench_decoders.py
+#   python benchmarks/bench_decoders.py --frames 2000 --subprocess-frames 100
+
+import os
+import sys
+import csv
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.decoders import algorithms, decode_frame, decode_subprocess
+
+def load_frames(path, per_algo):
+    """Toma las tramas enviadas (con ruido) de un client_report.csv"""
+    frames = {a: [] for a in algorithms}
+    with open(path, newline='', encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            algo = row["Algoritmo"]
+            if algo in frames and len(frames[algo]) < per_algo:
+                frames[algo].append(row["MensajeEnviado"])
+    return frames
+
+def bench(fn, algo, tramas):
+    t0 = time.perf_counter()
+    for t in tramas:
+        fn(algo, t)
+    elapsed = time.perf_counter() - t0
+    return len(tramas) / elapsed if elapsed else float("inf")
+
+def main():
+    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    ap = argparse.ArgumentParser(description="Compara tramas/seg del decoder en proceso vs. subprocess")
+    ap.add_argument("--csv", default=os.path.join(base_dir, "client_report.csv"), help="client_report.csv con tramas de prueba")
+    ap.add_argument("--frames", type=int, default=1000, help="Tramas por algoritmo (modo en proceso)")
+    ap.add_argument("--subprocess-frames", type=int, default=50, help="Tramas por algoritmo (modo subprocess)")
+    args = ap.parse_args()
+
+    frames = load_frames(args.csv, max(args.frames, args.subprocess_frames))
+
+    print(f"{'Algoritmo':<10} {'En proceso (tramas/s)':>22} {'Subprocess (tramas/s)':>22} {'Speedup':>9}")
+    for algo, tramas in frames.items():
+        if not tramas:
+            continue
+        # Verificar que ambos modos coinciden antes de medir
+        for t in tramas[:args.subprocess_frames]:
+            a = decode_frame(algo, t)
+            b = decode_subprocess(algo, t)
+            if a[:2] != b[:2]:
+                print(f"[{algo}] Diferencia entre modos para {t}: {a} != {b}", file=sys.stderr)
+                sys.exit(1)
+
+        fps_inproc = bench(decode_frame, algo, tramas[:args.frames])
+        fps_sub = bench(decode_subprocess, algo, tramas[:args.subprocess_frames])
+        print(f"{algo:<10} {fps_inproc:>22.1f} {fps_sub:>22.1f} {fps_inproc / fps_sub:>8.0f}x")
+
+if __name__ == "__main__":
+    main()
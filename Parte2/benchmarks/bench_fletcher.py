@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# Verifica las dos rutas rápidas de Fletcher (módulo diferido en Python y productos
+# con NumPy) contra la implementación original (un módulo por bloque) para bloques
+# de 4, 8, 16 y 32 bits, y compara tiempos con tramas de hasta 10^6 bloques.
+# También verifica FletcherState (update por pedazos, combine de segmentos,
+# FletcherVerifier, ChecksumVerifier de cada variante y orden) y Adler-32 contra
+# zlib.adler32.
+# Uso (desde Parte2):
+#   python benchmarks/bench_fletcher.py
+#   python benchmarks/bench_fletcher.py --blocks 1000,1000000 --block-sizes 8,32
+
+import os
+import sys
+import time
+import random
+import zlib
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.decoders import load_decoder, fletcher_segment
+import coding
+
+def timed(fn, min_time):
+    """Segundos por llamada (mínimo min_time segundos de mediciones)"""
+    loops = 0
+    t0 = time.perf_counter()
+    while True:
+        fn()
+        loops += 1
+        elapsed = time.perf_counter() - t0
+        if elapsed >= min_time:
+            return elapsed / loops
+
+def random_blocks(fletcher, rng, n, block_size):
+    """n bloques aleatorios como los arma verify_fletcher (bytes o array)"""
+    bits = format(rng.getrandbits(n * block_size), f"0{n * block_size}b") if n else ""
+    return fletcher.bytes_to_blocks(bits, block_size)
+
+def check_parity(fletcher, rng):
+    """Las dos rutas dan (sum1, sum2) idénticos a fletcher_checksum_reference"""
+    paths = {"deferred": fletcher.fletcher_sums_deferred, "checksum": fletcher.fletcher_checksum}
+    if coding.numpy_available():
+        paths["numpy"] = fletcher.fletcher_sums_numpy
+    for block_size in (4, 8, 16, 32):
+        k = fletcher.FLETCHER_DEFER_BLOCKS[block_size]
+        lengths = list(range(200)) + [k - 1, k, k + 1, 2 * k + 7, 70000]
+        for n in lengths:
+            data = random_blocks(fletcher, rng, n, block_size)
+            expected = fletcher.fletcher_checksum_reference(data, block_size)
+            # Bloques con el valor máximo (= módulo), el peor caso para desbordes
+            worst = fletcher.bytes_to_blocks("1" * n * block_size, block_size)
+            worst_expected = fletcher.fletcher_checksum_reference(worst, block_size)
+            for name, fn in paths.items():
+                if fn(data, block_size) != expected or fn(worst, block_size) != worst_expected:
+                    return f"{name} difiere con {n} bloques de {block_size} bits"
+    return check_states(fletcher, rng)
+
+def check_states(fletcher, rng):
+    """Por pedazos, por segmentos unidos con combine y en una sola llamada dan lo mismo"""
+    for block_size, adler in [(4, False), (8, False), (16, False), (32, False), (8, True)]:
+        name = "adler32" if adler else f"fletcher{block_size * 2}"
+        for n in (0, 1, 2, 3, 50, 1000, 5000):
+            bits = format(rng.getrandbits(n * block_size), f"0{n * block_size}b") if n else ""
+            blocks = fletcher.bytes_to_blocks(bits, block_size)
+            expected = fletcher.new_state(block_size, adler).update(blocks)
+            if adler and (expected.sum2 << 16 | expected.sum1) != zlib.adler32(blocks):
+                return f"adler32 difiere de zlib.adler32 con {n} bytes"
+            cuts = sorted(rng.randrange(n + 1) * block_size for _ in range(3))
+            segments = [bits[a:b] for a, b in zip([0] + cuts, cuts + [len(bits)])]
+            incremental = fletcher.new_state(block_size, adler)
+            for segment in segments:
+                incremental.update(fletcher.bytes_to_blocks(segment, block_size))
+            joined = fletcher.fletcher_join(map(fletcher_segment, segments, [block_size] * 4, [adler] * 4),
+                                            block_size, adler)
+            if incremental.digest() != expected.digest() or joined.digest() != expected.digest():
+                return f"{name}: update por pedazos o combine difiere con {n} bloques"
+            verifier = fletcher.FletcherVerifier(fletcher.new_state(block_size, adler))
+            frame = bits + expected.checksum_bits()
+            for i in range(0, len(frame), 7):  # pedazos que no coinciden con los bloques
+                verifier.update(frame[i:i + 7])
+            if verifier.finalize()[0] != "OK":
+                return f"{name}: FletcherVerifier rechaza una trama válida de {n} bloques"
+            variant = "adler32" if adler else fletcher.variant_for_block_size(block_size)
+            for order in fletcher.FLETCHER_ORDERS:
+                if fletcher.fletcher_verifier(variant, order).verify(bits + expected.checksum_bits(order))[0] != "OK":
+                    return f"{variant} ({order}) rechaza una trama válida de {n} bloques"
+    return None
+
+def main():
+    ap = argparse.ArgumentParser(description="Fletcher: módulo por bloque vs. módulo diferido vs. NumPy")
+    ap.add_argument("--blocks", default="16,256,4096,65536,1000000", help="Cantidad de bloques por trama")
+    ap.add_argument("--block-sizes", default="4,8,16,32", help="Tamaños de bloque (bits)")
+    ap.add_argument("--min-time", type=float, default=0.2, help="Segundos mínimos por medición")
+    ap.add_argument("--seed", type=int, default=1)
+    args = ap.parse_args()
+
+    fletcher = load_decoder("fletcher")
+    rng = random.Random(args.seed)
+
+    error = check_parity(fletcher, rng)
+    if error:
+        print(error, file=sys.stderr)
+        sys.exit(1)
+    paths = "módulo diferido" + (" y NumPy" if coding.numpy_available() else " (NumPy no está instalado)")
+    print(f"OK: {paths} dan las mismas sumas que la implementación original (bloques de 4/8/16/32 bits)")
+    print("OK: FletcherState por pedazos y por segmentos (combine) coincide; Adler-32 coincide con zlib")
+
+    header = f"{'Bits':>5} {'Bloques':>9} {'original (ms)':>14} {'diferido (ms)':>14}"
+    if coding.numpy_available():
+        header += f" {'numpy (ms)':>11}"
+    print(header + f" {'mejor/orig.':>12}")
+    for block_size in (int(x) for x in args.block_sizes.split(",") if x):
+        for n in (int(x) for x in args.blocks.split(",") if x):
+            data = random_blocks(fletcher, rng, n, block_size)
+            times = [timed(lambda: fletcher.fletcher_checksum_reference(data, block_size), args.min_time),
+                     timed(lambda: fletcher.fletcher_sums_deferred(data, block_size), args.min_time)]
+            if coding.numpy_available():
+                times.append(timed(lambda: fletcher.fletcher_sums_numpy(data, block_size), args.min_time))
+            speedup = times[0] / min(times[1:])
+            print(f"{block_size:>5} {n:>9}" + "".join(f" {t * 1e3:>14.3f}" for t in times[:2])
+                  + "".join(f" {t * 1e3:>11.3f}" for t in times[2:]) + f" {speedup:>11.1f}x")
+
+if __name__ == "__main__":
+    main()
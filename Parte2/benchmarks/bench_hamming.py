@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+# Benchmark: decode_hamming (ruta rápida con enteros) vs. la implementación original
+# por posición, para tramas de 50 a 100k bits. También mide el modo por bloques
+# (7,4), (15,11), (31,26) y (63,57) contra la ruta de una sola palabra, con tramas
+# aleatorias y con tramas sin errores (--clean-lengths, el caso más común).
+# Uso (desde Parte2):
+#   python benchmarks/bench_hamming.py
+#   python benchmarks/bench_hamming.py --lengths 50,1000,100000 --frames 20 --blocks 7,63
+#   python benchmarks/bench_hamming.py --lengths "" --clean-lengths 40,120,1000
+
+import os
+import sys
+import time
+import random
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.decoders import load_decoder
+
+def make_frames(n, count, rng):
+    """Tramas aleatorias de n bits: mezcla de síndromes OK, FIX y DROP"""
+    return ["".join(rng.choice("01") for _ in range(n)) for _ in range(count)]
+
+def make_clean_frames(hamming, n, count, rng, block=None):
+    """Tramas de n bits sin errores: tramas aleatorias OK o ya corregidas por el decoder"""
+    frames = []
+    while len(frames) < count:
+        frame = make_frames(n, 1, rng)[0]
+        status, _, _, fixed = hamming.decode_hamming(frame, block=block)
+        if status in ("OK", "FIX"):
+            frames.append(fixed or frame)
+    return frames
+
+def best_of(fns, frames, reps, rounds=7):
+    """
+    Mejor de varias mediciones (µs por trama) de cada fn con sus tramas. Las rutas se
+    miden intercaladas en cada ronda, así el ruido de la máquina afecta a todas por igual.
+    """
+    best = [float("inf")] * len(fns)
+    for _ in range(rounds):
+        for i, (fn, fs) in enumerate(zip(fns, frames)):
+            best[i] = min(best[i], bench(fn, fs, reps) * 1e6)
+    return best
+
+def bench(fn, frames, reps=1):
+    t0 = time.perf_counter()
+    for _ in range(reps):
+        for f in frames:
+            fn(f)
+    return (time.perf_counter() - t0) / (reps * len(frames))
+
+def main():
+    ap = argparse.ArgumentParser(description="Compara la ruta rápida de Hamming con la original")
+    ap.add_argument("--lengths", default="50,100,500,1000,5000,10000,50000,100000",
+                    help="Largos de trama en bits, separados por coma")
+    ap.add_argument("--frames", type=int, default=20, help="Tramas distintas por largo")
+    ap.add_argument("--blocks", default="7,15,31,63", help="Bloques a medir (vacío para omitir)")
+    ap.add_argument("--clean-lengths", default="40,120,1000",
+                    help="Largos de las tramas sin errores para comparar el modo bloques (vacío para omitir)")
+    ap.add_argument("--seed", type=int, default=1)
+    args = ap.parse_args()
+
+    hamming = load_decoder("hamming")
+    rng = random.Random(args.seed)
+
+    lengths = [int(x) for x in args.lengths.split(",") if x]
+    if lengths:
+        print(f"{'Bits':>8} {'Original (µs)':>15} {'Rápida (µs)':>13} {'Speedup':>9}")
+    for n in lengths:
+        frames = make_frames(n, args.frames, rng)
+        # La salida debe ser idéntica antes de medir
+        for f in frames:
+            if hamming.decode_hamming(f) != hamming.decode_hamming_reference(f):
+                print(f"Diferencia para una trama de {n} bits", file=sys.stderr)
+                sys.exit(1)
+
+        t_ref = bench(hamming.decode_hamming_reference, frames)
+        t_fast = bench(hamming.decode_hamming, frames, reps=max(1, 20000 // n))
+        print(f"{n:>8} {t_ref * 1e6:>15.1f} {t_fast * 1e6:>13.1f} {t_ref / t_fast:>8.0f}x")
+
+    blocks = [int(x) for x in args.blocks.split(",") if x]
+    if not blocks:
+        return
+    rng = random.Random(args.seed)
+    header = f"{'Bits':>8} {'1 palabra (µs)':>15}" + "".join(f" {f'({b},{hamming.BLOCK_CODES[b]}) µs':>13}" for b in blocks)
+    if lengths:
+        print()
+        print(header)
+    for n in lengths:
+        frames = make_frames(n, args.frames, rng)
+        for b in blocks:
+            for f in frames:
+                if hamming.decode_hamming(f, block=b) != hamming.decode_hamming_blocks_reference(f, b):
+                    print(f"Diferencia en modo bloques ({b}) para una trama de {n} bits", file=sys.stderr)
+                    sys.exit(1)
+        reps = max(1, 20000 // n)
+        row = f"{n:>8} {bench(hamming.decode_hamming, frames, reps) * 1e6:>15.1f}"
+        for b in blocks:
+            t = bench(lambda f: hamming.decode_hamming(f, block=b), frames, reps)
+            row += f" {t * 1e6:>13.1f}"
+        print(row)
+
+
+    # Tramas sin errores: el modo bloques debe andar a la par de una sola palabra
+    clean_lengths = [int(x) for x in args.clean_lengths.split(",") if x]
+    if not clean_lengths:
+        return
+    print()
+    print("Tramas sin errores (mejor de 7 mediciones intercaladas)")
+    print(header + f" {'peor/1 palabra':>15}")
+    for n in clean_lengths:
+        fns = [hamming.decode_hamming]
+        frames = [make_clean_frames(hamming, n, args.frames, rng)]
+        for b in blocks:
+            fs = make_clean_frames(hamming, n, args.frames, rng, block=b)
+            for f in fs:
+                if hamming.decode_hamming(f, block=b) != hamming.decode_hamming_blocks_reference(f, b):
+                    print(f"Diferencia en modo bloques ({b}) para una trama de {n} bits", file=sys.stderr)
+                    sys.exit(1)
+            fns.append(lambda f, b=b: hamming.decode_hamming(f, block=b))
+            frames.append(fs)
+        single, *times = best_of(fns, frames, max(1, 20000 // n))
+        print(f"{n:>8} {single:>15.2f}" + "".join(f" {t:>13.2f}" for t in times)
+              + f" {max(times) / single:>14.2f}x")
+
+if __name__ == "__main__":
+    main()
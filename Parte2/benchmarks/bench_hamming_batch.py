@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+# Verifica decode_hamming_batch (NumPy) contra decode_hamming con tramas aleatorias
+# y compara tramas/seg de ambos.
+# Uso (desde Parte2):
+#   python benchmarks/bench_hamming_batch.py
+#   python benchmarks/bench_hamming_batch.py --frames 20000 --lengths 63,127,1000
+
+import os
+import sys
+import time
+import random
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.decoders import load_decoder
+import coding
+
+def random_frames(count, lengths, rng):
+    return ["".join(rng.choice("01") for _ in range(rng.choice(lengths))) for _ in range(count)]
+
+def main():
+    ap = argparse.ArgumentParser(description="decode_hamming_batch vs. decode_hamming")
+    ap.add_argument("--frames", type=int, default=10000, help="Tramas por prueba")
+    ap.add_argument("--lengths", default="0,1,3,7,12,50,63,100,127,500",
+                    help="Largos posibles (bits), separados por coma; se mezclan en el batch")
+    ap.add_argument("--batch-sizes", default="1,10,100,1000,10000", help="Tamaños de batch a medir")
+    ap.add_argument("--seed", type=int, default=1)
+    args = ap.parse_args()
+
+    hamming = load_decoder("hamming")
+    if not coding.numpy_available():
+        print("numpy no está instalado", file=sys.stderr)
+        sys.exit(1)
+
+    rng = random.Random(args.seed)
+    lengths = [int(x) for x in args.lengths.split(",")]
+    frames = random_frames(args.frames, lengths, rng)
+
+    statuses, data_bits, fix_pos = hamming.decode_hamming_batch(frames)
+    for i, f in enumerate(frames):
+        expected = hamming.decode_hamming(f)[:3]
+        got = (statuses[i], data_bits[i], int(fix_pos[i]) or None)
+        if got != expected:
+            print(f"Diferencia en la trama {i} ({len(f)} bits): {got} != {expected}", file=sys.stderr)
+            sys.exit(1)
+    print(f"OK: {len(frames)} tramas idénticas a decode_hamming")
+
+    t0 = time.perf_counter()
+    for f in frames:
+        hamming.decode_hamming(f)
+    fps_single = len(frames) / (time.perf_counter() - t0)
+
+    print(f"{'Batch':>7} {'decode_hamming (tramas/s)':>26} {'batch NumPy (tramas/s)':>23}")
+    for size in (int(x) for x in args.batch_sizes.split(",")):
+        t0 = time.perf_counter()
+        for i in range(0, len(frames), size):
+            hamming.decode_hamming_batch(frames[i:i + size])
+        fps_batch = len(frames) / (time.perf_counter() - t0)
+        print(f"{size:>7} {fps_single:>26.0f} {fps_batch:>23.0f}")
+
+if __name__ == "__main__":
+    main()
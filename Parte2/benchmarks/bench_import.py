@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+# Mide el tiempo de arranque: import de coding y de cada módulo del núcleo, y el
+# arranque completo de cada decoder.py (Parte1 y Parte2) con un intérprete nuevo.
+# Verifica además que import coding no cargue NumPy ni los algoritmos.
+# Uso (desde Parte2):
+#   python benchmarks/bench_import.py
+#   python benchmarks/bench_import.py --runs 20
+
+import os
+import sys
+import time
+import argparse
+import subprocess
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ROOT_DIR = os.path.dirname(BASE_DIR)
+
+MODULES = ["coding", "coding.bitconv", "coding.hamming", "coding.crc", "coding.fletcher"]
+
+# Los decoders se ejecutan como módulos desde la raíz (python -m)
+DECODERS = [
+    "Parte1.HammingCode.decoder",
+    "Parte1.CRC-32.decoder",
+    "Parte1.FletcherChecksum.decoder",
+    "Parte2.algorithms.HammingCode.decoder",
+    "Parte2.algorithms.CRC-32.decoder",
+    "Parte2.algorithms.FletcherChecksum.decoder",
+]
+
+def run(args):
+    subprocess.run([sys.executable, *args], cwd=ROOT_DIR, check=True,
+                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+def best_time(args, runs):
+    """Mejor tiempo (s) de runs ejecuciones de un intérprete nuevo"""
+    best = None
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        run(args)
+        elapsed = time.perf_counter() - t0
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def check_lazy():
+    """import coding no debe cargar NumPy ni los módulos de los algoritmos"""
+    code = ("import sys, coding; "
+            "loaded = [m for m in ('numpy', 'coding.hamming', 'coding.crc', 'coding.fletcher') if m in sys.modules]; "
+            "sys.exit(', '.join(loaded))")
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT_DIR, capture_output=True, text=True)
+    return result.stderr.strip() or None
+
+def main():
+    ap = argparse.ArgumentParser(description="Tiempo de import del núcleo coding/ y de arranque de los decoders")
+    ap.add_argument("--runs", type=int, default=10, help="Ejecuciones por medición (se toma la mejor)")
+    args = ap.parse_args()
+
+    loaded = check_lazy()
+    if loaded:
+        print(f"import coding carga módulos de más: {loaded}", file=sys.stderr)
+        sys.exit(1)
+    print("OK: import coding no carga NumPy ni los algoritmos")
+
+    baseline = best_time(["-c", "pass"], args.runs)
+    print(f"Intérprete vacío: {baseline * 1e3:.1f} ms (se resta de las mediciones)")
+    print(f"{'Módulo':<46} {'import (ms)':>12}")
+    for module in MODULES:
+        t = best_time(["-c", f"import {module}"], args.runs)
+        print(f"{module:<46} {(t - baseline) * 1e3:>12.1f}")
+
+    print(f"{'Decoder (trama de 16 bits)':<46} {'arranque (ms)':>12}")
+    for module in DECODERS:
+        t = best_time(["-m", module, "0000000000000000"], args.runs)
+        print(f"{module:<46} {(t - baseline) * 1e3:>12.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -3,15 +3,24 @@ const readline = require('readline');
 const { execFileSync } = require('child_process');
 const fs = require('fs');
 
-const { asciiToBinary, applyNoise, randomAsciiString } = require('./utils/client_utils.js');
+const { asciiToBinary, applyNoise, randomAsciiString, packBits, openConnection, writeFrame, closeConnection } = require('./utils/client_utils.js');
 
 
 const algorithms = {
     "hamming": "./algorithms/HammingCode/encoder.js",
     "crc": "./algorithms/CRC-32/encoder.js",
     "fletcher": "./algorithms/FletcherChecksum/encoder.js",
+    "adler": "./algorithms/FletcherChecksum/encoder.js",
 };
 
+// Flags fijos del encoder por algoritmo (Adler-32 usa el encoder de Fletcher)
+const algorithmArgs = {
+    "adler": ['--adler'],
+};
+
+// Algoritmos de --test por defecto; adler se agrega con --algos=hamming,crc,fletcher,adler
+const defaultTestAlgos = ["hamming", "crc", "fletcher"];
+
 
 
 const rl = readline.createInterface({ input: process.stdin, output: process.stdout });
@@ -21,9 +30,9 @@ function askQuestion(query) {
     return new Promise(resolve => rl.question(query, resolve));
 }
 
-function processInput(p, asciiMsg, algo) {
+function processInput(p, asciiMsg, algo, encoderArgs = []) {
     const binMsg = asciiToBinary(asciiMsg);
-    const encoded = execFileSync('node', [algorithms[algo], binMsg]).toString().trim();
+    const encoded = execFileSync('node', [algorithms[algo], binMsg, ...(algorithmArgs[algo] || []), ...encoderArgs]).toString().trim();
     const noisy = applyNoise(encoded, p);
     const bitsFlipped = noisy.split('').reduce((acc, bit, idx) => acc + (bit !== encoded[idx] ? 1 : 0), 0);
 
@@ -40,7 +49,7 @@ async function startSending() {
             break;
         }
 
-        const algo_raw = await askQuestion("Algoritmo (Hamming/Fletcher/CRC): ")
+        const algo_raw = await askQuestion("Algoritmo (Hamming/Fletcher/CRC/Adler): ")
         const algo = algo_raw.toLowerCase();
 
         if (!algorithms[algo]) {
@@ -85,15 +94,69 @@ function sendFinish(expectedLast, runId) {
     });
 }
 
-async function runTest(totalMessages) {
+// Envía un payload en su propia conexión TCP (modo legacy, un JSON por conexión)
+function sendOneShot(payload) {
+    return new Promise((resolve, reject) => {
+        const client = new net.Socket();
+        client.connect(5000, '127.0.0.1', () => {
+            client.write(JSON.stringify(payload));
+            client.end();
+        });
+        client.on('close', resolve);
+        client.on('error', reject);
+    });
+}
+
+// Pide al servidor sus histogramas de latencia por etapa ({ type: 'stats' })
+function requestStats() {
+    return new Promise((resolve, reject) => {
+        const client = new net.Socket();
+        let data = '';
+        client.connect(5000, '127.0.0.1', () => {
+            client.write(JSON.stringify({ type: 'stats' }));
+            client.end();
+        });
+        client.on('data', chunk => { data += chunk; });
+        client.on('close', () => {
+            try {
+                resolve(JSON.parse(data));
+            } catch (e) {
+                reject(new Error("Respuesta de stats inválida"));
+            }
+        });
+        client.on('error', reject);
+    });
+}
+
+// persistent: una sola conexión con frames [largo][JSON] para todas las tramas
+// batchSize: si es > 1, agrupa las tramas en payloads { type: 'batch', frames: [...] }
+// packed: manda la trama empaquetada en base64 ({ enc, data, nbits }) en vez de '0'/'1'
+// hammingBlock: codifica Hamming por bloques (7, 15, 31 o 63) y lo indica en el payload
+// secded: Hamming extendido (bit de paridad global), el servidor descarta las tramas con dos errores
+// crcVariant: variante de CRC (crc8, crc16, ..., crc64); se indica en el payload como crc_variant
+// fletcherVariant / fletcherOrder: variante de Fletcher (fletcher8, ..., fletcher64, adler32) y orden de
+// las sumas en el checksum (sum2_sum1 o sum1_sum2); en el payload como fletcher_variant y fletcher_order
+// algos: algoritmos a probar (los mensajes se reparten en partes iguales entre ellos)
+async function runTest(totalMessages, { persistent = false, batchSize = 1, packed = false, hammingBlock = null, secded = false,
+                                         crcVariant = null, fletcherVariant = null, fletcherOrder = null,
+                                         algos = defaultTestAlgos } = {}) {
     const probs = [0.001, 0.005, 0.01];
-    const algoNames = Object.keys(algorithms);
+    const algoNames = algos;
     const msgsPerAlgo = Math.floor(totalMessages / algoNames.length);
 
     const csvHeader = "NumMensaje,Algoritmo,MensajeOriginalASCII,LargoOriginalASCII,MensajeBinario,LargoBinario,MensajeCodificado,LargoCodificado,MensajeEnviado,NoiseProb,BitsFlippeados\n";
     fs.writeFileSync('client_report.csv', csvHeader);
 
     let msgCounter = 1;
+    const conn = persistent ? await openConnection(5000, '127.0.0.1') : null;
+    const send = payload => conn ? writeFrame(conn, payload) : sendOneShot(payload);
+    let batch = [];
+    const flushBatch = async () => {
+        if (batch.length === 0) return;
+        const frames = batch;
+        batch = [];
+        await send({ type: 'batch', frames });
+    };
 
     for (const algo of algoNames) {
         const perProb = Math.floor(msgsPerAlgo / probs.length);
@@ -101,47 +164,60 @@ async function runTest(totalMessages) {
             for (let i = 0; i < perProb; i++) {
 
                 const asciiMsg = randomAsciiString(5 + Math.floor(Math.random() * 11)); // 5–15 chars
-                const { binMsg, encoded, noisy, bitsFlipped } = processInput(p, asciiMsg, algo);
+                const useBlock = algo === 'hamming' && hammingBlock;
+                const useSecded = algo === 'hamming' && secded;
+                const encoderArgs = [];
+                if (useBlock) encoderArgs.push(`--block=${hammingBlock}`);
+                if (useSecded) encoderArgs.push('--secded');
+                const useVariant = algo === 'crc' && crcVariant;
+                if (useVariant) encoderArgs.push(`--variant=${crcVariant}`);
+                const useFletcherVariant = algo === 'fletcher' && fletcherVariant;
+                if (useFletcherVariant) encoderArgs.push(`--variant=${fletcherVariant}`);
+                const useFletcherOrder = (algo === 'fletcher' || algo === 'adler') && fletcherOrder;
+                if (useFletcherOrder) encoderArgs.push(`--order=${fletcherOrder}`);
+                const { binMsg, encoded, noisy, bitsFlipped } = processInput(p, asciiMsg, algo, encoderArgs);
 
                 // Guardar en CSV
                 fs.appendFileSync('client_report.csv',
                     `${msgCounter},${algo},${asciiMsg},${asciiMsg.length},${binMsg},${binMsg.length},${encoded},${encoded.length},${noisy},${p},${bitsFlipped}\n`
                 );
 
-                // Enviar al servidor con ID - Envuelto en una promesa para poder usar await
-                await new Promise((resolve, reject) => { // Usar await con una promesa
-                    const client = new net.Socket();
-                    client.connect(5000, '127.0.0.1', () => {
-                        client.write(JSON.stringify({
-                            NumMensaje: msgCounter,
-                            algo,
-                            trama: noisy
-                        }));
-                        client.end();
-                    });
-
-                    // Resuelve la promesa cuando la conexión se cierre (éxito)
-                    client.on('close', () => {
-                        resolve();
-                    });
-
-                    // Rechaza la promesa si hay un error de conexión
-                    client.on('error', (err) => {
-                        console.error(`Error al enviar mensaje ${msgCounter} (${algo}, prob=${p}):`, err.message);
-                        reject(err); // Rechaa para que await capture el error
-                    });
-                });
+                const payload = packed
+                    ? { NumMensaje: msgCounter, algo, ...packBits(noisy) }
+                    : { NumMensaje: msgCounter, algo, trama: noisy };
+                if (useBlock) payload.block = hammingBlock;
+                if (useSecded) payload.secded = true;
+                if (useVariant) payload.crc_variant = crcVariant;
+                if (useFletcherVariant) payload.fletcher_variant = fletcherVariant;
+                if (useFletcherOrder) payload.fletcher_order = fletcherOrder;
+                try {
+                    if (batchSize > 1) {
+                        batch.push(payload);
+                        if (batch.length >= batchSize) await flushBatch();
+                    } else {
+                        await send(payload);
+                    }
+                } catch (err) {
+                    console.error(`Error al enviar mensaje ${msgCounter} (${algo}, prob=${p}):`, err.message);
+                    throw err;
+                }
 
                 console.log(`Mensaje ${msgCounter} enviado (${algo}, prob=${p}).`); // Confirmación de envío
                 msgCounter++;
             }
         }
     }
+    await flushBatch();
     console.log(`\n¡Test de ${totalMessages} mensajes completado!`);
 
     try {
         const runId = `N${totalMessages}`; 
-        await sendFinish(msgCounter - 1, runId);
+        if (conn) {
+            await writeFrame(conn, { type: 'finish', expected_last: msgCounter - 1, run_id: runId });
+            await closeConnection(conn);
+        } else {
+            await sendFinish(msgCounter - 1, runId);
+        }
         console.log(`Finish enviado (expected_last=${msgCounter - 1}).`);
     } catch (e) {
         console.error("No se pudo notificar finish al servidor:", e.message);
@@ -149,9 +225,37 @@ async function runTest(totalMessages) {
 }
 
 
-if (process.argv[2] === '--test') {
-    const total = parseInt(process.argv[3] || '100', 10);
-    runTest(total);
+const cliArgs = process.argv.slice(2);
+if (cliArgs[0] === '--test') {
+    const total = parseInt(cliArgs.find(a => /^\d+$/.test(a)) || '100', 10);
+    const batchArg = cliArgs.find(a => a.startsWith('--batch='));
+    const blockArg = cliArgs.find(a => a.startsWith('--block='));
+    const variantArg = cliArgs.find(a => a.startsWith('--crc-variant='));
+    const fletcherVariantArg = cliArgs.find(a => a.startsWith('--fletcher-variant='));
+    const fletcherOrderArg = cliArgs.find(a => a.startsWith('--fletcher-order='));
+    const algosArg = cliArgs.find(a => a.startsWith('--algos='));
+    const algos = algosArg ? algosArg.split('=')[1].split(',').filter(a => a) : defaultTestAlgos;
+    const unknown = algos.filter(a => !algorithms[a]);
+    if (unknown.length > 0 || algos.length === 0) {
+        console.error(`Algoritmos no válidos en --algos: ${unknown.join(', ') || '(vacío)'} (usar ${Object.keys(algorithms).join(', ')})`);
+        process.exit(1);
+    }
+    runTest(total, {
+        persistent: cliArgs.includes('--persistent'),
+        batchSize: batchArg ? parseInt(batchArg.split('=')[1], 10) : 1,
+        packed: cliArgs.includes('--packed'),
+        hammingBlock: blockArg ? parseInt(blockArg.split('=')[1], 10) : null,
+        secded: cliArgs.includes('--secded'),
+        crcVariant: variantArg ? variantArg.split('=')[1] : null,
+        fletcherVariant: fletcherVariantArg ? fletcherVariantArg.split('=')[1] : null,
+        fletcherOrder: fletcherOrderArg ? fletcherOrderArg.split('=')[1] : null,
+        algos,
+    });
+} else if (cliArgs[0] === '--stats') {
+    requestStats()
+        .then(stats => console.log(JSON.stringify(stats, null, 2)))
+        .catch(e => console.error("No se pudieron obtener las estadísticas:", e.message))
+        .finally(() => rl.close());
 } else {
     startSending()
 };
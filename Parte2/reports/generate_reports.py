@@ -70,6 +70,7 @@ PALETTE = {
     "hamming": "#4C78A8",   
     "crc":     "#F58518",   
     "fletcher":"#54A24B",   
+    "adler":   "#B279A2",   
     "fix":     "#54A24B",   
     "no_fix":  "#E45756",   
     "_default":"#6C757D",   
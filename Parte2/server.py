@@ -4,200 +4,540 @@ import subprocess
 import sys
 import csv
 import os
-
-from utils.server_utils import write_files, create_files
-
-algorithms = {
-    "hamming": "./algorithms/HammingCode/decoder.py",
-    "fletcher": "./algorithms/FletcherChecksum/decoder.py",
-    "crc": "./algorithms/CRC-32/decoder.py"
-}
-
-def extract_binary_line(s: str):
-    for line in s.splitlines():
-        t = line.strip()
-        if t and set(t) <= {"0", "1"}:
-            return t
-    return None
+import asyncio
+import argparse
+import signal
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from utils.server_utils import write_files, write_files_batch, create_files, FinishState, ResultSink, client_index
+from utils.decoders import (algorithms, decode_frame, decode_subprocess, decode_batch,
+                            decode_subprocess_batch, decode_grouped_timed, cache_stats,
+                            frame_options)
+from coding.bitconv import bits_to_ascii  # utils.decoders agrega la raíz del repositorio a sys.path
+from utils.framing import FrameBuffer, is_legacy, encode_frame
+from utils.packing import unpack_payload
+from utils.decode_pool import DecodePool, make_executor
+from utils.log import setup_logging, get_logger, FrameSampler
+from utils.stats import StageStats, timed_call, ANY_ALGO, DROPPED_STATUSES
+
+log = get_logger("server")
+
+HOST = '127.0.0.1'
+PORT = 5000
+RECV_SIZE = 65536
+# Cada cuánto se revisan los trabajos terminados del pool mientras no llegan conexiones
+POOL_POLL_SECONDS = 0.2
 
 def safe_binary_to_ascii(bin_str: str):
-    n = (len(bin_str) // 8) * 8
-    if n == 0:
-        return ""
-    bin_str = bin_str[:n]
-    return ''.join(chr(int(bin_str[i:i+8], 2)) for i in range(0, n, 8))
+    # Una sola conversión de toda la trama (los bits que no completan un byte se ignoran)
+    return bits_to_ascii(bin_str)
 
 def run_generate_reports(run_id=None):
-    base_dir = os.path.dirname(__file__)                 
+    base_dir = os.path.dirname(__file__)
     script  = os.path.join(base_dir, "reports", "generate_reports.py")
-    in_dir  = base_dir                                   
-    out_dir = os.path.join(base_dir, "reports", "out")   
+    in_dir  = base_dir
+    out_dir = os.path.join(base_dir, "reports", "out")
 
     os.makedirs(out_dir, exist_ok=True)
 
     cmd = [sys.executable, script, "--in", in_dir, "--out", out_dir, "--stamp"]
-    if run_id:  
+    if run_id:
         cmd += ["--run-id", str(run_id)]
 
     try:
         out = subprocess.check_output(cmd, encoding="utf-8", errors="replace", cwd=base_dir)
-        print("=== Reporte de pruebas ===")
-        print(out.strip())
-        print("==========================")
+        log.info("=== Reporte de pruebas ===\n%s\n==========================", out.strip())
     except subprocess.CalledProcessError as e:
-        print(f"Error al ejecutar generate_reports.py: {e}")
+        log.error("Error al ejecutar generate_reports.py: %s", e)
+
+def parse_args():
+    ap = argparse.ArgumentParser(description="Receptor: decodifica y verifica las tramas enviadas por client.js")
+    ap.add_argument("--test", action="store_true", help="Escribe server_report.csv y errors.csv para las pruebas")
+    ap.add_argument("--subprocess", action="store_true", help="Ruta legacy: un intérprete de Python por trama")
+    ap.add_argument("--mode", choices=["blocking", "async"], default="blocking",
+                    help="blocking: una conexión a la vez; async: muchas conexiones concurrentes (asyncio)")
+    ap.add_argument("--backlog", type=int, default=128, help="Backlog del socket de escucha")
+    ap.add_argument("--max-inflight", type=int, default=64,
+                    help="Máximo de tramas (o batches) en vuelo; con la cola llena se deja de leer del socket")
+    ap.add_argument("--workers", type=int, default=0,
+                    help="Procesos para decodificar en paralelo (0 = en el proceso del servidor)")
+    ap.add_argument("--log-level", default="INFO", choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+                    help="DEBUG muestra payload y trama; INFO el mensaje recibido; WARNING solo problemas")
+    ap.add_argument("--log-sample", type=int, default=1, help="Loguear 1 de cada N tramas")
+    ap.add_argument("--log-file", default=None, help="Archivo JSON-lines con los logs estructurados")
+    ap.add_argument("--crc-backend", choices=["table", "slicing8", "zlib"], default=None,
+                    help="Implementación de CRC-32: table (byte a byte), slicing8 (por defecto) o zlib")
+    ap.add_argument("--crc-correct", type=int, choices=[0, 1, 2], default=0,
+                    help="Corrige tramas CRC con 1 (o hasta 2) bits invertidos si no traen crc_correct")
+    ap.add_argument("--flush-rows", type=int, default=1000,
+                    help="Filas en buffer antes de escribir los CSV (--test)")
+    ap.add_argument("--flush-interval", type=float, default=1.0,
+                    help="Segundos máximos que una fila espera en buffer (--test)")
+    return ap.parse_args()
+
+args = None
 
 # Estado para finish
-max_processed_id = -1
-pending_finish = False
-finish_expected_last = None
-finish_run_id = None
+state = FinishState()
 
-TEST_MODE = len(sys.argv) > 1 and sys.argv[1] == '--test'
+# Muestreo de los logs por trama (--log-sample)
+sampler = FrameSampler(1)
+
+# Pool de procesos para decodificar (solo con --workers > 0 en modo blocking)
+pool = None
 
 report_file = 'server_report.csv'
 errors_file = 'errors.csv'
 
-if TEST_MODE:
-    create_files(report_file, errors_file)
+# Buffer de filas para los CSV (solo con --test)
+sink = None
 
-# ---------- Server socket ----------
-server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-server.bind(('127.0.0.1', 5000))
-server.listen(1)
-print("Servidor escuchando en puerto 5000...")
+# Histogramas de latencia por etapa y algoritmo
+stats = StageStats()
 
-while True:
-    conn, addr = server.accept()
-    try:
-        data = conn.recv(4096).decode()
-        if not data:
-            conn.close()
-            continue
+def frame_decoder():
+    return decode_subprocess if args.subprocess else decode_frame
 
-        try:
-            payload = json.loads(data)
-        except json.JSONDecodeError:
-            print("Payload no es JSON válido desde el cliente.")
-            conn.close()
-            continue
+def batch_decoder():
+    return decode_subprocess_batch if args.subprocess else decode_batch
 
-        # --- Manejo de FINISH ---
-        if payload.get("type") == "finish":
-            expected = payload.get("expected_last")
-            run_id   = payload.get("run_id")  # opcional
-            if isinstance(expected, int) and max_processed_id >= expected:
-                print(f" FINISH alcanzado (expected_last={expected}). Generando reportes…")
-                run_generate_reports(run_id=run_id)
-            else:
-                pending_finish = True
-                finish_expected_last = expected
-                finish_run_id = run_id 
-            conn.close()
-            continue
+def payload_algo(payload):
+    """Clave de algoritmo para las estadísticas ("batch", "finish", ... si no es una trama)"""
+    return payload.get("algo") or payload.get("type") or "?"
 
-        algo = payload.get('algo')
-        trama = payload.get('trama', '')
-        num_msg = payload.get("NumMensaje", None)
+def parse_payload(data: bytes):
+    t0 = time.perf_counter()
+    try:
+        payload = json.loads(data.decode())
+    except (UnicodeDecodeError, json.JSONDecodeError):
+        log.warning("Payload no es JSON válido desde el cliente.")
+        return None
+    return parsed_payload(payload, t0)
+
+def parsed_payload(payload, t0: float):
+    """Registra la etapa parse; None si el JSON no es un objeto (la trama se descarta)"""
+    if not isinstance(payload, dict):
+        log.warning("Payload JSON no es un objeto desde el cliente.")
+        return None
+    stats.record("parse", payload_algo(payload), time.perf_counter() - t0)
+    return payload
+
+def is_stats_request(payload):
+    return payload.get("type") == "stats"
+
+def stats_reply(framed: bool) -> bytes:
+    """Respuesta al mensaje {"type": "stats"}: con framing si la conexión lo usa"""
+    snapshot = stats.snapshot()
+    snapshot["caches"] = cache_stats()  # con --workers cada proceso tiene las suyas
+    if framed:
+        return encode_frame(snapshot)
+    return json.dumps(snapshot).encode("utf-8")
+
+def check_finish():
+    ready = state.take_ready()
+    if ready is not None:
+        expected, run_id = ready
+        log.info(" FINISH alcanzado (expected_last=%s). Generando reportes…", expected)
+        log.info("=== Latencias por etapa ===\n%s", stats.format_table())
+        for name, c in cache_stats().items():
+            log.info("Caché %s: %d hits, %d misses (%d/%d)", name, c["hits"], c["misses"], c["size"], c["maxsize"])
+        if sink is not None:
+            sink.flush()  # los reportes leen los CSV desde disco
+        run_generate_reports(run_id=run_id)
+        # La próxima corrida del cliente vuelve a escribir client_report.csv
+        client_index.reset()
+
+def handle_finish(payload):
+    state.request_finish(payload.get("expected_last"), payload.get("run_id"))  # run_id opcional
+    check_finish()
+
+def present_and_persist(payload, status, data_bits, fix_pos):
+    algo = payload.get('algo')
+    trama = payload.get('trama', '')
+    num_msg = payload.get("NumMensaje", None)
+
+    fix_status = status == "FIX"
+    stats.count_status(algo, status)
+    dropped = status in DROPPED_STATUSES
+    if dropped:
+        # Dos errores detectados (SECDED): no hay datos que presentar
         msg = None
-
-        print(payload)
-        print("===" * 20)
-
-        if algo not in algorithms:
-            print("Algoritmo no soportado")
-            conn.close()
+    else:
+        t0 = time.perf_counter()
+        msg = safe_binary_to_ascii(data_bits)
+        stats.record("present", algo, time.perf_counter() - t0)
+
+    # Los logs por trama solo se formatean si el nivel está activo y la trama entra en la muestra
+    if log.isEnabledFor(logging.INFO) and sampler.take():
+        extra = {"num_msg": num_msg, "algo": algo, "status": status, "fix_pos": fix_pos}
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("%s\n%s", payload, "===" * 20, extra=extra)
+            log.debug("Trama recibida: %s", trama, extra=extra)
+        log.info("[%s] Status: %s", algo, status, extra=extra)
+        if dropped:
+            log.info("Trama descartada: dos errores detectados", extra=extra)
+        else:
+            if fix_status:
+                log.info("Corrección %s: pos=%s", algo, fix_pos, extra=extra)
+            log.info("Mensaje recibido: %s", msg, extra=extra)
+            if num_msg is not None:
+                log.debug("%s. %s con %s", num_msg, msg, algo, extra=extra)
+
+    if args.test and num_msg is not None:
+        t0 = time.perf_counter()
+        write_files(msg, num_msg, algo, fix_status, sink)
+        stats.record("persist", algo, time.perf_counter() - t0)
+
+def prepare_frame(payload):
+    """
+    Desempaqueta la trama si viene en formato compacto, aplica --crc-correct y valida
+    sus opciones (p. ej. el bloque de Hamming). Retorna False si es inválida.
+    """
+    try:
+        unpack_payload(payload)
+        if args.crc_correct and payload.get("algo") == "crc":
+            payload.setdefault("crc_correct", args.crc_correct)
+        frame_options(payload)
+        return True
+    except (ValueError, TypeError) as ex:
+        log.warning("Trama inválida (%s): %s", payload.get("NumMensaje"), ex)
+        return False
+
+def accept_frame(payload):
+    """Valida el algoritmo de la trama. Retorna False si se descarta."""
+    if payload.get('algo') not in algorithms:
+        log.warning("Algoritmo no soportado: %s", payload.get('algo'))
+        return False
+    return prepare_frame(payload)
+
+# ---------- Batch: un payload con muchas tramas ----------
+
+def accept_batch(payload):
+    """Retorna las tramas del batch con algoritmo soportado"""
+    frames = payload.get("frames") or []
+    valid = [f for f in frames if isinstance(f, dict) and f.get("algo") in algorithms and prepare_frame(f)]
+    if len(valid) != len(frames):
+        log.warning("[batch] %d tramas descartadas (algoritmo no soportado o trama inválida)", len(frames) - len(valid))
+    return valid
+
+def present_and_persist_batch(frames, results):
+    rows = []
+    counts = {}
+    for frame, (status, data_bits, fix_pos) in zip(frames, results):
+        algo = frame["algo"]
+        counts.setdefault(algo, {}).setdefault(status, 0)
+        counts[algo][status] += 1
+        stats.count_status(algo, status)
+        if status in DROPPED_STATUSES:
+            rows.append((None, frame.get("NumMensaje"), algo, False))
             continue
-
-        fix_status = False
-
-        if algo == "hamming":
+        t0 = time.perf_counter()
+        msg = safe_binary_to_ascii(data_bits)
+        stats.record("present", algo, time.perf_counter() - t0)
+        rows.append((msg, frame.get("NumMensaje"), algo, status == "FIX"))
+
+    if log.isEnabledFor(logging.INFO):
+        for algo, by_status in counts.items():
+            detail = ", ".join(f"{k}={v}" for k, v in sorted(by_status.items()))
+            log.info("[batch] %s: %d tramas (%s)", algo, sum(by_status.values()), detail,
+                     extra={"algo": algo, "frames": by_status})
+
+    if args.test:
+        t0 = time.perf_counter()
+        write_files_batch([r for r in rows if r[1] is not None], sink)
+        # Tiempo amortizado por trama, repartido según los algoritmos del batch
+        per_frame = (time.perf_counter() - t0) / max(1, len(rows))
+        for algo, by_status in counts.items():
+            stats.record("persist", algo, per_frame, sum(by_status.values()))
+
+# ---------- Trabajos de decodificación (una trama o un batch) ----------
+
+def start_job(payload):
+    """Valida el payload y lo marca en vuelo. Retorna (tipo, datos) o None si se descarta."""
+    if payload.get("type") == "batch":
+        frames = accept_batch(payload)
+        if not frames:
+            return None
+        state.frame_started(len(frames))
+        return ("batch", frames)
+    if not accept_frame(payload):
+        return None
+    state.frame_started()
+    return ("frame", payload)
+
+def job_call(job):
+    """
+    (función, argumentos) que decodifican el trabajo; se pueden ejecutar en otro proceso.
+    El resultado viene acompañado del tiempo de decodificación medido donde se ejecutó.
+    """
+    kind, data = job
+    if kind == "batch":
+        return decode_grouped_timed, (data, batch_decoder())
+    return timed_call, (frame_decoder(), data['algo'], data.get('trama', ''), frame_options(data))
+
+def complete_job(job, get_result):
+    kind, data = job
+    try:
+        result, timing = get_result()
+        if kind == "batch":
+            for algo, (seconds, n) in timing.items():
+                stats.record("decode", algo, seconds / n, n)
+            present_and_persist_batch(data, result)
+        else:
+            stats.record("decode", data['algo'], timing)
+            present_and_persist(data, *result)
+    except Exception as ex:
+        log.exception("Error inesperado en server: %s", ex)
+    finally:
+        if kind == "batch":
+            state.batch_done([f.get("NumMensaje") for f in data])
+        else:
+            state.frame_done(data.get("NumMensaje"))
+    check_finish()
+
+# ---------- Modo blocking: una conexión a la vez ----------
+
+def drain_pool(block=True):
+    if pool is None:
+        return
+    for job, future in pool.drain(block=block):
+        complete_job(job, future.result)
+
+def handle_payload(payload):
+    # --- Manejo de FINISH ---
+    if payload.get("type") == "finish":
+        # Con el pool, las tramas encoladas deben terminar antes de evaluar el finish
+        drain_pool()
+        handle_finish(payload)
+        return
+
+    job = start_job(payload)
+    if job is None:
+        return
+    fn, fargs = job_call(job)
+    if pool is None:
+        complete_job(job, lambda: fn(*fargs))
+    else:
+        # Si la cola está llena, submit espera y no se lee más del socket
+        for ready_job, future in pool.submit(job, fn, *fargs):
+            complete_job(ready_job, future.result)
+
+def recv(conn):
+    """conn.recv midiendo la etapa recv (incluye la espera de datos del cliente)"""
+    t0 = time.perf_counter()
+    chunk = conn.recv(RECV_SIZE)
+    stats.record("recv", ANY_ALGO, time.perf_counter() - t0)
+    return chunk
+
+def read_legacy(conn, data: bytes):
+    """Modo legacy: un JSON por conexión. Se lee hasta completar el JSON o hasta EOF."""
+    while True:
+        t0 = time.perf_counter()
+        try:
+            payload = json.loads(data.decode())
+        except (UnicodeDecodeError, json.JSONDecodeError):
+            chunk = recv(conn)
+            if not chunk:
+                return parse_payload(data)
+            data += chunk
+            continue
+        return parsed_payload(payload, t0)
+
+def serve_connection(conn):
+    data = recv(conn)
+    if not data:
+        return
+
+    if is_legacy(data):
+        payload = read_legacy(conn, data)
+        if payload is None:
+            return
+        if is_stats_request(payload):
+            conn.sendall(stats_reply(framed=False))
+        else:
+            handle_payload(payload)
+        return
+
+    # Conexión persistente: muchos frames [largo][JSON] en el mismo stream
+    frames = FrameBuffer()
+    while data:
+        for body in frames.feed(data):
+            payload = parse_payload(body)
+            if payload is None:
+                continue
             try:
-                decoded_raw = subprocess.check_output(
-                    [sys.executable, algorithms[algo], "--json", trama],
-                    encoding="utf-8",
-                    errors="replace"
-                ).strip()
-
-                try:
-                    d = json.loads(decoded_raw)  # salida estructurada del decoder
-                except json.JSONDecodeError:
-                    print("[hamming] Salida no-JSON; usando ruta de texto legacy")
-                    decoded = subprocess.check_output(
-                        [sys.executable, algorithms[algo], trama],
-                        encoding="utf-8",
-                        errors="replace"
-                    ).strip()
-
-                    if decoded.startswith("ERROR"):
-                        print(decoded)
-                        msg = ""
-                    else:
-                        print(f"Trama recibida: {trama}")
-                        print(f"Decodificada: {decoded}")
-                        binary_line = extract_binary_line(decoded) or decoded.splitlines()[-1]
-                        msg = safe_binary_to_ascii(binary_line)
-                        print(f"Mensaje recibido: {msg}")
-
+                if is_stats_request(payload):
+                    conn.sendall(stats_reply(framed=True))
                 else:
-                    status = d.get("status")
-                    data_bits = d.get("data_bits", "")
+                    handle_payload(payload)
+            except Exception as ex:
+                log.exception("Error inesperado en server: %s", ex)
+        data = recv(conn)
+
+def serve_blocking():
+    server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server.bind((HOST, PORT))
+    server.listen(args.backlog)
+    log.info("Servidor escuchando en puerto %d...", PORT)
+
+    while True:
+        # Con trabajos en el pool, accept se despierta cada tanto para persistir los que ya
+        # terminaron. No se espera a todos: el pool se vacía con el finish, al llenarse
+        # (max_inflight) o al apagar el servidor, así las conexiones de una trama se solapan.
+        server.settimeout(POOL_POLL_SECONDS if pool is not None and pool.pending() else None)
+        try:
+            conn, addr = server.accept()
+        except socket.timeout:
+            drain_pool(block=False)
+            continue
+        try:
+            serve_connection(conn)
+        except Exception as ex:
+            log.exception("Error inesperado en server: %s", ex)
+        finally:
+            drain_pool(block=False)
+            conn.close()
 
-                    print(f"Trama recibida: {trama}")
-                    print(f"[hamming] Status: {status}")
+# ---------- Modo async: muchas conexiones a la vez ----------
 
-                    if status == "FIX":
-                        fix_status = True
-                        fix = d.get("fix") or {}
-                        print(f"Corrección Hamming: pos={fix.get('pos')}")
-                        # print(f"Trama corregida: {fix.get('codeword')}")
+async def recv_async(reader):
+    t0 = time.perf_counter()
+    chunk = await reader.read(RECV_SIZE)
+    stats.record("recv", ANY_ALGO, time.perf_counter() - t0)
+    return chunk
 
-                    msg = safe_binary_to_ascii(data_bits)
-                    print(f"Mensaje recibido: {msg}")
+async def read_legacy_async(reader, data: bytes):
+    while True:
+        t0 = time.perf_counter()
+        try:
+            payload = json.loads(data.decode())
+        except (UnicodeDecodeError, json.JSONDecodeError):
+            chunk = await recv_async(reader)
+            if not chunk:
+                return parse_payload(data)
+            data += chunk
+            continue
+        return parsed_payload(payload, t0)
+
+async def serve_async():
+    loop = asyncio.get_running_loop()
+    inflight = asyncio.Semaphore(args.max_inflight)
+    if args.workers > 0:
+        executor = make_executor(args.workers)
+    else:
+        executor = ThreadPoolExecutor(max_workers=args.max_inflight)
+
+    # Cada trabajo espera a que el anterior se persista: los CSV quedan en orden de llegada
+    last_persisted = loop.create_future()
+    last_persisted.set_result(None)
+
+    async def run_job(job, prev, done):
+        fn, fargs = job_call(job)
+        decoding = loop.run_in_executor(executor, fn, *fargs)
+        try:
+            await asyncio.wait([decoding])
+            await prev
+            # La escritura de CSV corre en el hilo del event loop, sin carreras
+            complete_job(job, decoding.result)
+        finally:
+            done.set_result(None)
+            inflight.release()
+
+    async def dispatch(payload):
+        """Agenda el payload y retorna su tarea (None para finish o payloads descartados)"""
+        nonlocal last_persisted
+        if payload.get("type") == "finish":
+            handle_finish(payload)
+            return None
+        # Se marca en vuelo antes de esperar turno, para que un finish no se adelante
+        job = start_job(payload)
+        if job is None:
+            return None
+        # Si ya hay max_inflight trabajos en vuelo se deja de leer del socket
+        await inflight.acquire()
+        prev, last_persisted = last_persisted, loop.create_future()
+        return asyncio.create_task(run_job(job, prev, last_persisted))
+
+    async def handle_connection(reader, writer):
+        tasks = set()
+
+        async def dispatch_and_track(payload, framed):
+            if payload is None:
+                return
+            if is_stats_request(payload):
+                writer.write(stats_reply(framed))
+                await writer.drain()
+                return
+            task = await dispatch(payload)
+            if task is not None:
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
 
-            except subprocess.CalledProcessError as e:
-                print(f"[hamming] Error al ejecutar decoder: {e}")
-                msg = ""
+        try:
+            data = await recv_async(reader)
+            if not data:
+                return
+
+            if is_legacy(data):
+                await dispatch_and_track(await read_legacy_async(reader, data), framed=False)
+                return
+
+            # Conexión persistente: muchos frames [largo][JSON] en el mismo stream
+            frames = FrameBuffer()
+            while data:
+                for body in frames.feed(data):
+                    await dispatch_and_track(parse_payload(body), framed=True)
+                data = await recv_async(reader)
+
+        except Exception as ex:
+            log.exception("Error inesperado en server: %s", ex)
+        finally:
+            # La conexión se cierra cuando sus tramas ya se procesaron
+            if tasks:
+                await asyncio.gather(*tasks)
+            writer.close()
+
+    server = await asyncio.start_server(handle_connection, HOST, PORT, backlog=args.backlog)
+    log.info("Servidor (async) escuchando en puerto %d...", PORT)
+    async with server:
+        await server.serve_forever()
+
+def main():
+    global args, pool, sink, sampler
+    args = parse_args()
+    setup_logging(args.log_level, args.log_file)
+    sampler = FrameSampler(args.log_sample)
+
+    if args.crc_backend:
+        # Por variable de entorno para que la hereden los workers y los subprocess
+        os.environ["CRC32_BACKEND"] = args.crc_backend
+
+    if args.test:
+        create_files(report_file, errors_file)
+        sink = ResultSink(report_file, errors_file, args.flush_rows, args.flush_interval)
+
+    # SIGTERM como salida limpia: se vacía el buffer de filas antes de terminar
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
 
+    try:
+        if args.mode == "async":
+            asyncio.run(serve_async())
         else:
-            # Fletcher y CRC sin el json
-            try:
-                decoded = subprocess.check_output(
-                    [sys.executable, algorithms[algo], trama],
-                    encoding="utf-8",
-                    errors="replace"
-                ).strip()
-
-                if decoded.startswith("ERROR"):
-                    print(decoded)
-                    msg = ""
-                else:
-                    print(f"Trama recibida: {trama}")
-                    print(f"Decodificada: {decoded}")
-                    binary_line = extract_binary_line(decoded) or decoded.splitlines()[-1]
-                    msg = safe_binary_to_ascii(binary_line)
-                    print(f"Mensaje recibido: {msg}")
-
-            except subprocess.CalledProcessError as e:
-                print(f"[{algo}] Error al ejecutar decoder: {e}")
-                msg = ""
-
-        if isinstance(num_msg, int):
-            max_processed_id = max(max_processed_id, num_msg)
-
-        if pending_finish and finish_expected_last is not None and max_processed_id >= finish_expected_last:
-            print(f" Alcanzado expected_last={finish_expected_last}. Generando reportes…")
-            run_generate_reports(run_id=finish_run_id)
-            pending_finish = False
-            finish_expected_last = None
-            finish_run_id = None
-
-        if TEST_MODE and num_msg is not None:
-            print(f"{num_msg}. {msg} con {algo}")
-            write_files(msg, report_file, num_msg, algo, fix_status, errors_file)
-
-    except Exception as ex:
-        print(f"Error inesperado en server: {ex}")
-
-    conn.close()
-
+            if args.workers > 0:
+                pool = DecodePool(args.workers, args.max_inflight)
+            serve_blocking()
+    except KeyboardInterrupt:
+        log.info("Servidor detenido.")
+    finally:
+        if pool is not None:
+            # Los trabajos encolados se persisten antes de cerrar los CSV
+            drain_pool()
+            pool.shutdown()
+        if sink is not None:
+            log.info("Escribiendo %d filas pendientes...", sink.pending)
+            sink.close()
+
+if __name__ == "__main__":
+    main()
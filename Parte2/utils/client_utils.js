@@ -1,3 +1,5 @@
+const net = require('net');
+
 // Función auxiliar para convertir ASCII a binario
 function asciiToBinary(str) {
     console.log("Convirtiendo mensaje a binario:");
@@ -17,6 +19,54 @@ function applyNoise(binaryStr, errorProb) {
 }
 
 
+// Formato compacto: bits empaquetados (MSB primero) en base64 + cantidad de bits
+function packBits(bits) {
+    const buf = Buffer.alloc(Math.ceil(bits.length / 8));
+    for (let i = 0; i < bits.length; i++) {
+        if (bits[i] === '1') buf[i >> 3] |= 0x80 >> (i & 7);
+    }
+    return { enc: 'b64', data: buf.toString('base64'), nbits: bits.length };
+}
+
+// Protocolo con framing: [largo u32 big-endian][JSON UTF-8]
+// Permite enviar muchas tramas por una sola conexión TCP persistente
+function encodeFrame(obj) {
+    const body = Buffer.from(JSON.stringify(obj), 'utf8');
+    const header = Buffer.alloc(4);
+    header.writeUInt32BE(body.length, 0);
+    return Buffer.concat([header, body]);
+}
+
+// Abre una conexión persistente al servidor
+function openConnection(port, host) {
+    return new Promise((resolve, reject) => {
+        const socket = new net.Socket();
+        socket.once('error', reject);
+        socket.connect(port, host, () => {
+            socket.off('error', reject);
+            resolve(socket);
+        });
+    });
+}
+
+// Escribe un frame; si el buffer del socket está lleno espera a 'drain'
+function writeFrame(socket, obj) {
+    if (socket.write(encodeFrame(obj))) {
+        return Promise.resolve();
+    }
+    return new Promise(resolve => socket.once('drain', resolve));
+}
+
+// Cierra la conexión y espera a que el servidor termine de procesarla
+function closeConnection(socket) {
+    return new Promise((resolve, reject) => {
+        socket.once('close', resolve);
+        socket.once('error', reject);
+        socket.end();
+    });
+}
+
+
 // Código para TESTS
 
 function randomAsciiString(length) {
@@ -31,4 +81,4 @@ function randomAsciiString(length) {
 
 
 
-module.exports = { asciiToBinary, applyNoise, randomAsciiString} ;
\ No newline at end of file
+module.exports = { asciiToBinary, applyNoise, randomAsciiString, packBits, encodeFrame, openConnection, writeFrame, closeConnection } ;
\ No newline at end of file
@@ -0,0 +1,58 @@
+import multiprocessing
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from utils.decoders import algorithms, load_decoder
+
+# Etapa de decodificación en varios procesos (multi-core).
+# La cola es acotada: cuando se llena, submit() espera al trabajo más antiguo,
+# así el servidor deja de leer del socket (backpressure). Los resultados se
+# entregan en el mismo orden en que se encolaron, para que los CSV sean deterministas.
+
+def _warm_up():
+    """Cada worker importa los decoders una sola vez al arrancar"""
+    for algo in algorithms:
+        load_decoder(algo)
+
+def make_executor(workers: int):
+    # "spawn": los workers se crean bajo demanda y con fork heredarían los
+    # sockets de las conexiones abiertas, que entonces nunca se cerrarían
+    ctx = multiprocessing.get_context("spawn")
+    return ProcessPoolExecutor(max_workers=workers, mp_context=ctx, initializer=_warm_up)
+
+class DecodePool:
+    def __init__(self, workers: int, max_pending: int):
+        self._executor = make_executor(workers)
+        self._pending = deque()
+        self.max_pending = max(1, max_pending)
+
+    def submit(self, item, fn, *args):
+        """
+        Encola fn(*args) asociado a item. Retorna los (item, future) que ya
+        terminaron, en orden. Si la cola está llena bloquea hasta que el
+        trabajo más antiguo termine.
+        """
+        ready = []
+        if len(self._pending) >= self.max_pending:
+            ready.append(self._pop())
+        self._pending.append((item, self._executor.submit(fn, *args)))
+        ready += self.drain(block=False)
+        return ready
+
+    def drain(self, block: bool = True):
+        """Retorna los resultados listos en orden; con block=True espera a todos"""
+        ready = []
+        while self._pending and (block or self._pending[0][1].done()):
+            ready.append(self._pop())
+        return ready
+
+    def _pop(self):
+        item, future = self._pending.popleft()
+        future.exception()  # espera a que termine sin lanzar la excepción
+        return item, future
+
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def shutdown(self):
+        self._executor.shutdown(wait=True)
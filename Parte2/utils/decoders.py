@@ -0,0 +1,232 @@
+import json
+import os
+import subprocess
+import sys
+import time
+
+from utils.log import get_logger
+
+# Registro de decoders: los algoritmos están en el paquete coding/ (raíz del repositorio),
+# se importan una sola vez y se llaman en el mismo proceso. El modo subprocess (un
+# intérprete por trama, con los decoder.py de algorithms/) se mantiene como respaldo opcional.
+
+log = get_logger("decoders")
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+ROOT_DIR = os.path.dirname(BASE_DIR)
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+import coding
+
+# Líneas de comandos de cada algoritmo (ruta subprocess, python -m desde ROOT_DIR);
+# también definen los algoritmos soportados
+algorithms = {
+    "hamming": "Parte2.algorithms.HammingCode.decoder",
+    "fletcher": "Parte2.algorithms.FletcherChecksum.decoder",
+    "crc": "Parte2.algorithms.CRC-32.decoder",
+    # Adler-32 usa el decoder de Fletcher (mismas sumas, módulo 65521) con --variant=adler32
+    "adler": "Parte2.algorithms.FletcherChecksum.decoder",
+}
+
+# Tamaño de bloque que usa el decoder de Fletcher cuando se llama sin flags
+# (variante fletcher16, salvo que el payload traiga fletcher_variant)
+FLETCHER_BLOCK_SIZE = 8
+
+def load_decoder(algo: str):
+    """Módulo de coding del algoritmo (se importa una sola vez, la primera vez que se usa)"""
+    return coding.load(algo)
+
+def cache_stats():
+    """Hits/misses de las cachés de los decoders cargados en este proceso"""
+    stats = {}
+    hamming = sys.modules.get("coding.hamming")
+    if hamming is not None:
+        stats["hamming_layout"] = hamming.layout_cache.stats()
+    crc = sys.modules.get("coding.crc")
+    if crc is not None:
+        stats["crc_syndrome"] = crc.syndrome_cache.stats()
+    return stats
+
+def extract_binary_line(s: str):
+    for line in s.splitlines():
+        t = line.strip()
+        if t and set(t) <= {"0", "1"}:
+            return t
+    return None
+
+# ---------- Opciones por trama ----------
+# Campos opcionales del payload que cambian cómo se decodifica, por algoritmo
+FRAME_OPTIONS = {
+    "hamming": ("block", "secded"),  # bloques (n, k): 7, 15, 31 o 63; secded: bit de paridad global
+    "crc": ("crc_variant", "crc_correct"),  # crc8, ..., crc64 (CRC_VARIANTS); corregir 0, 1 o 2 bits
+    "fletcher": ("fletcher_variant", "fletcher_order"),  # fletcher8, ..., adler32 (FLETCHER_VARIANTS); sum2_sum1 o sum1_sum2
+    "adler": ("fletcher_order",),
+}
+
+def frame_options(payload: dict) -> dict:
+    """
+    Opciones de decodificación presentes en el payload. Lanza ValueError si
+    alguna no es válida, para descartar la trama antes de decodificarla.
+    """
+    opts = {k: payload[k] for k in FRAME_OPTIONS.get(payload.get("algo"), ()) if payload.get(k) is not None}
+    if "block" in opts and opts["block"] not in load_decoder("hamming").BLOCK_CODES:
+        raise ValueError(f"Bloque de Hamming no soportado: {opts['block']}")
+    if "secded" in opts and not isinstance(opts["secded"], bool):
+        raise ValueError(f"secded debe ser true o false: {opts['secded']}")
+    if "crc_variant" in opts and opts["crc_variant"] not in load_decoder("crc").CRC_VARIANTS:
+        raise ValueError(f"Variante de CRC no soportada: {opts['crc_variant']}")
+    if "crc_correct" in opts and opts["crc_correct"] not in (0, 1, 2):
+        raise ValueError(f"crc_correct debe ser 0, 1 o 2: {opts['crc_correct']}")
+    if "fletcher_variant" in opts and opts["fletcher_variant"] not in load_decoder("fletcher").FLETCHER_VARIANTS:
+        raise ValueError(f"Variante de Fletcher no soportada: {opts['fletcher_variant']}")
+    if "fletcher_order" in opts and opts["fletcher_order"] not in load_decoder("fletcher").FLETCHER_ORDERS:
+        raise ValueError(f"fletcher_order debe ser sum2_sum1 o sum1_sum2: {opts['fletcher_order']}")
+    return opts
+
+# ---------- Ruta en proceso ----------
+
+def _decode_hamming(trama: str, block: int = None, secded: bool = False):
+    # Con block, pos es la lista de posiciones corregidas
+    status, data_bits, pos, _ = load_decoder("hamming").decode_hamming(trama, block=block, secded=secded)
+    return status, data_bits, pos
+
+def _decode_crc(trama: str, crc_variant: str = None, crc_correct: int = 0):
+    # Con crc_correct, FIX trae la lista de posiciones corregidas
+    status, data_bits, pos, _ = load_decoder("crc").decode_crc(trama, variant=crc_variant, correct=crc_correct)
+    if status == "ERROR":
+        return status, "", None
+    return status, data_bits, pos
+
+def _decode_fletcher(trama: str, fletcher_variant: str = None, fletcher_order: str = None):
+    # El verificador de cada (variante, orden) se arma una vez y queda cacheado en el decoder
+    status, data_bits, _ = load_decoder("fletcher").fletcher_verifier(fletcher_variant, fletcher_order).verify(trama)
+    if status != "OK":
+        return status, "", None
+    return status, data_bits, None
+
+def _decode_adler(trama: str, fletcher_order: str = None):
+    return _decode_fletcher(trama, "adler32", fletcher_order)
+
+DECODERS = {
+    "hamming": _decode_hamming,
+    "crc": _decode_crc,
+    "fletcher": _decode_fletcher,
+    "adler": _decode_adler,
+}
+
+def decode_frame(algo: str, trama: str, options: dict = None):
+    """
+    Decodifica una trama en el mismo proceso.
+    Retorna (status, data_bits, fix_pos)
+    status: "OK", "FIX", "DROP", "DOUBLE" (Hamming SECDED con dos errores) o "ERROR"
+    data_bits: bits de datos sin redundancia ("" si se descarta)
+    fix_pos: posición corregida (Hamming; lista de posiciones en modo bloques y en CRC con corrección) o None
+    options: opciones de frame_options(payload)
+    """
+    return DECODERS[algo](trama, **(options or {}))
+
+def crc_segment(bits: str):
+    """(CRC-32, bytes) de un segmento de bits, para executor.map (igual a coding.crc.crc32_segment)"""
+    return load_decoder("crc").crc32_segment(bits)
+
+def fletcher_segment(bits: str, block_size: int = FLETCHER_BLOCK_SIZE, adler: bool = False):
+    """(sum1, sum2, bloques) de un segmento, para unirlos con fletcher_join (executor.map)"""
+    return load_decoder("fletcher").fletcher_segment(bits, block_size, adler)
+
+# Desde este tamaño un grupo de Hamming se decodifica con NumPy (si está instalado);
+# con menos tramas el costo fijo de armar las matrices no se recupera
+HAMMING_NUMPY_MIN_BATCH = 256
+
+def _decode_hamming_numpy(tramas):
+    statuses, data_bits, fix_pos = load_decoder("hamming").decode_hamming_batch(tramas)
+    return [(s, d, p or None) for s, d, p in zip(statuses.tolist(), data_bits.tolist(), fix_pos.tolist())]
+
+def decode_batch(algo: str, tramas, options: dict = None):
+    """Decodifica un grupo de tramas del mismo algoritmo (y mismas opciones) en una sola llamada"""
+    if (algo == "hamming" and not any((options or {}).values()) and len(tramas) >= HAMMING_NUMPY_MIN_BATCH
+            and coding.numpy_available()):
+        return _decode_hamming_numpy(tramas)
+    fn = DECODERS[algo]
+    options = options or {}
+    return [fn(t, **options) for t in tramas]
+
+def decode_grouped(frames, batch_fn=decode_batch):
+    """
+    Agrupa las tramas por algoritmo, decodifica cada grupo con una llamada a
+    batch_fn y retorna los resultados en el orden original de frames.
+    """
+    return decode_grouped_timed(frames, batch_fn)[0]
+
+def decode_grouped_timed(frames, batch_fn=decode_batch):
+    """Como decode_grouped, pero retorna también {algo: (segundos, tramas)} de cada grupo"""
+    groups = {}
+    for i, frame in enumerate(frames):
+        options = frame_options(frame)
+        key = (frame["algo"], tuple(sorted(options.items())))
+        groups.setdefault(key, []).append(i)
+
+    results = [None] * len(frames)
+    timings = {}
+    for (algo, options), idxs in groups.items():
+        t0 = time.perf_counter()
+        decoded = batch_fn(algo, [frames[i].get("trama", "") for i in idxs], dict(options))
+        seconds, count = timings.get(algo, (0.0, 0))
+        timings[algo] = (seconds + time.perf_counter() - t0, count + len(idxs))
+        for i, r in zip(idxs, decoded):
+            results[i] = r
+    return results, timings
+
+# ---------- Ruta legacy: un subprocess por trama ----------
+
+def _run_decoder(algo: str, *args: str) -> str:
+    return subprocess.check_output(
+        [sys.executable, "-m", algorithms[algo], *args],
+        cwd=ROOT_DIR,
+        encoding="utf-8",
+        errors="replace"
+    ).strip()
+
+def _parse_text_output(decoded: str):
+    if decoded.startswith("ERROR"):
+        return "ERROR", "", None
+    first = decoded.splitlines()[0].strip() if decoded else ""
+    status = first if first in ("OK", "FIX", "DROP", "DOUBLE") else "OK"
+    binary_line = extract_binary_line(decoded) or decoded.splitlines()[-1]
+    return status, binary_line, None
+
+def decode_subprocess(algo: str, trama: str, options: dict = None):
+    """Misma interfaz que decode_frame, pero ejecutando decoder.py en un proceso aparte"""
+    options = options or {}
+    try:
+        if algo == "hamming":
+            flags = [f"--block={options['block']}"] if options.get("block") else []
+            if options.get("secded"):
+                flags.append("--secded")
+            decoded_raw = _run_decoder(algo, "--json", *flags, trama)
+            try:
+                d = json.loads(decoded_raw)  # salida estructurada del decoder
+            except json.JSONDecodeError:
+                log.warning("[hamming] Salida no-JSON; usando ruta de texto legacy")
+                return _parse_text_output(_run_decoder(algo, *flags, trama))
+            fix = d.get("fix") or {}
+            return d.get("status"), d.get("data_bits", ""), fix.get("pos")
+
+        if algo in ("fletcher", "adler"):
+            variant = "adler32" if algo == "adler" else options.get("fletcher_variant")
+            flags = [f"--variant={variant}"] if variant else []
+            if options.get("fletcher_order"):
+                flags.append(f"--order={options['fletcher_order']}")
+            return _parse_text_output(_run_decoder(algo, *flags, trama))
+
+        flags = [f"--variant={options['crc_variant']}"] if options.get("crc_variant") else []
+        if options.get("crc_correct"):
+            flags.append(f"--correct={options['crc_correct']}")
+        return _parse_text_output(_run_decoder(algo, *flags, trama))
+
+    except subprocess.CalledProcessError as e:
+        log.error("[%s] Error al ejecutar decoder: %s", algo, e)
+        return "ERROR", "", None
+
+def decode_subprocess_batch(algo: str, tramas, options: dict = None):
+    return [decode_subprocess(algo, t, options) for t in tramas]
@@ -0,0 +1,47 @@
+import json
+import struct
+
+# Protocolo con framing: [largo u32 big-endian][JSON UTF-8]
+# Permite enviar muchas tramas por una sola conexión TCP persistente.
+# El modo legacy (un JSON por conexión) se detecta porque empieza con '{'.
+
+HEADER = struct.Struct(">I")
+MAX_FRAME_SIZE = 16 * 1024 * 1024  # 16 MiB
+
+def encode_frame(obj) -> bytes:
+    body = json.dumps(obj, ensure_ascii=False).encode("utf-8")
+    return HEADER.pack(len(body)) + body
+
+def is_legacy(first_chunk: bytes) -> bool:
+    """Una conexión legacy manda directamente el JSON, sin prefijo de largo"""
+    return first_chunk.lstrip()[:1] == b"{"
+
+class FrameBuffer:
+    """Acumula bytes del socket y separa los frames completos de forma incremental"""
+
+    def __init__(self, max_frame_size: int = MAX_FRAME_SIZE):
+        self._buf = bytearray()
+        self._max = max_frame_size
+
+    def feed(self, data: bytes):
+        """Agrega datos y retorna la lista de cuerpos (bytes) de los frames completos"""
+        self._buf += data
+        frames = []
+        offset = 0
+        size = len(self._buf)
+        while size - offset >= HEADER.size:
+            (length,) = HEADER.unpack_from(self._buf, offset)
+            if length > self._max:
+                raise ValueError(f"Frame de {length} bytes excede el máximo ({self._max})")
+            end = offset + HEADER.size + length
+            if end > size:
+                break
+            frames.append(bytes(self._buf[offset + HEADER.size:end]))
+            offset = end
+        if offset:
+            del self._buf[:offset]
+        return frames
+
+    def pending(self) -> int:
+        """Bytes recibidos que todavía no forman un frame completo"""
+        return len(self._buf)
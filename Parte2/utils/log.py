@@ -0,0 +1,61 @@
+import json
+import logging
+import sys
+
+# Logging del servidor y los decoders.
+# - Consola con el mismo formato de antes (solo el mensaje)
+# - Muestreo: los logs por trama se emiten 1 de cada N tramas
+# - Archivo JSON-lines opcional con los campos estructurados de cada registro
+
+LOGGER_NAME = "lab2"
+
+# Campos extra (logger.x(..., extra={...})) que se copian al JSON
+STRUCTURED_FIELDS = ("num_msg", "algo", "status", "fix_pos", "frames")
+
+def get_logger(name: str = None) -> logging.Logger:
+    return logging.getLogger(f"{LOGGER_NAME}.{name}" if name else LOGGER_NAME)
+
+class JsonLinesFormatter(logging.Formatter):
+    def format(self, record):
+        entry = {
+            "ts": round(record.created, 6),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        for field in STRUCTURED_FIELDS:
+            if hasattr(record, field):
+                entry[field] = getattr(record, field)
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False)
+
+class FrameSampler:
+    """Decide si se loguea una trama: 1 de cada every (every <= 1 loguea todas)"""
+    def __init__(self, every: int = 1):
+        self.every = max(1, every)
+        self._count = 0
+
+    def take(self) -> bool:
+        self._count += 1
+        if self._count >= self.every:
+            self._count = 0
+            return True
+        return False
+
+def setup_logging(level: str = "INFO", json_file: str = None) -> logging.Logger:
+    logger = get_logger()
+    logger.setLevel(getattr(logging, level.upper(), logging.INFO))
+    logger.propagate = False
+    logger.handlers.clear()
+
+    console = logging.StreamHandler(sys.stdout)
+    console.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(console)
+
+    if json_file:
+        fh = logging.FileHandler(json_file, encoding="utf-8")
+        fh.setFormatter(JsonLinesFormatter())
+        logger.addHandler(fh)
+
+    return logger
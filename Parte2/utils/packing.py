@@ -0,0 +1,36 @@
+import base64
+
+# Formato compacto para las tramas: bits empaquetados (MSB primero) en base64.
+#   {"algo": "crc", "enc": "b64", "data": "<base64>", "nbits": 123}
+# en lugar de {"algo": "crc", "trama": "0101..."}; ocupa ~1/6 del string de '0'/'1'.
+# El servidor lo desempaqueta a la cadena '0'/'1' que usan los decoders.
+
+PACKED_ENCODING = "b64"
+
+def pack_bits(bits: str):
+    """'0'/'1' -> (base64, nbits). Los bits sobrantes del último byte van en 0."""
+    nbits = len(bits)
+    if nbits == 0:
+        return "", 0
+    padded = bits + "0" * (-nbits % 8)
+    raw = int(padded, 2).to_bytes(len(padded) // 8, "big")
+    return base64.b64encode(raw).decode("ascii"), nbits
+
+def unpack_bits(data: str, nbits: int) -> str:
+    """(base64, nbits) -> '0'/'1'. Lanza ValueError si el base64 o nbits no son válidos."""
+    raw = base64.b64decode(data, validate=True)
+    if nbits < 0 or nbits > len(raw) * 8:
+        raise ValueError(f"nbits={nbits} no cabe en {len(raw)} bytes")
+    if not raw:
+        return ""
+    return format(int.from_bytes(raw, "big"), f"0{len(raw) * 8}b")[:nbits]
+
+def unpack_payload(payload: dict) -> dict:
+    """
+    Si la trama viene empaquetada la deja en payload["trama"] como '0'/'1'.
+    Lanza ValueError o TypeError si los campos no son válidos.
+    """
+    if payload.get("enc") != PACKED_ENCODING:
+        return payload
+    payload["trama"] = unpack_bits(payload.pop("data", ""), int(payload.get("nbits", 0)))
+    return payload
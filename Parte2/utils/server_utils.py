@@ -3,9 +3,16 @@ import subprocess
 import sys
 import csv
 import os
+import time
+import atexit
+import threading
+
+from utils.log import get_logger
+
+log = get_logger("server")
 
 def create_files(report_file, errors_file):
-    print("Escribiendo archivos de reporte...")
+    log.info("Escribiendo archivos de reporte...")
     if not os.path.exists(report_file):
         with open(report_file, 'w', newline='', encoding="utf-8") as f:
             writer = csv.writer(f)
@@ -27,27 +34,239 @@ def create_files(report_file, errors_file):
             writer.writerow(["NumMensaje","Real","Falso"])
 
 
-def write_files(msg, report_file, num_msg, algo, fix_status, errors_file):
-    # Leer el mensaje original desde client_report.csv
-    with open('client_report.csv', newline='', encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        if num_msg:
-            orig_row = next((r for r in reader if int(r["NumMensaje"]) == num_msg), None)
-            if orig_row:
-                print(f"Mensaje original: {orig_row}")
-                success = (orig_row["MensajeOriginalASCII"] == msg)
-                if msg is None:
-                    msg_string = "None"
-                else:
-                    msg_string = msg
-                with open(report_file, 'a', newline='', encoding="utf-8") as f:
-                    writer = csv.writer(f)
-                    writer.writerow([num_msg, algo, msg_string, fix_status, success])
-                if not success and msg is not None:
-                    with open(errors_file, 'a', newline='', encoding="utf-8") as f:
-                        writer = csv.writer(f)
-                        writer.writerow([num_msg, orig_row["MensajeOriginalASCII"], msg])
-        else:
-            with open(errors_file, 'a', newline='', encoding="utf-8") as f:
-                writer = csv.writer(f)
-                writer.writerow([None, None, None])
\ No newline at end of file
+def build_rows(msg, num_msg, algo, fix_status, orig_row):
+    """Fila de server_report.csv y fila de errors.csv (o None) comparando con el original"""
+    success = (orig_row["MensajeOriginalASCII"] == msg)
+    if msg is None:
+        msg_string = "None"
+    else:
+        msg_string = msg
+    report_row = [num_msg, algo, msg_string, fix_status, success]
+    error_row = None
+    if not success and msg is not None:
+        error_row = [num_msg, orig_row["MensajeOriginalASCII"], msg]
+    return report_row, error_row
+
+class ResultSink:
+    """
+    Buffer de filas para server_report.csv y errors.csv. Mantiene ambos archivos
+    abiertos y escribe por lotes: al juntar max_rows filas, cada flush_interval
+    segundos y al cerrar (finish o apagado del servidor).
+    """
+    def __init__(self, report_file, errors_file, max_rows=1000, flush_interval=1.0):
+        self.max_rows = max_rows
+        self.flush_interval = flush_interval
+        self._lock = threading.Lock()
+        self._report_rows = []
+        self._error_rows = []
+        self._report_f = open(report_file, 'a', newline='', encoding="utf-8")
+        self._errors_f = open(errors_file, 'a', newline='', encoding="utf-8")
+        self._report_w = csv.writer(self._report_f)
+        self._errors_w = csv.writer(self._errors_f)
+        self._closed = threading.Event()
+        self._last_flush = time.monotonic()
+
+        # Flush por tiempo aunque no lleguen más tramas
+        self._timer = threading.Thread(target=self._flush_periodically, daemon=True)
+        self._timer.start()
+        atexit.register(self.close)
+
+    @property
+    def pending(self) -> int:
+        """Filas en el buffer que todavía no se escriben a disco"""
+        return len(self._report_rows) + len(self._error_rows)
+
+    def add(self, report_rows=(), error_rows=()):
+        with self._lock:
+            self._report_rows.extend(report_rows)
+            self._error_rows.extend(error_rows)
+            full = self.pending >= self.max_rows
+        if full:
+            self.flush()
+
+    def flush(self):
+        with self._lock:
+            if self._report_f.closed:
+                return
+            if self._report_rows:
+                self._report_w.writerows(self._report_rows)
+                self._report_f.flush()
+                self._report_rows = []
+            if self._error_rows:
+                self._errors_w.writerows(self._error_rows)
+                self._errors_f.flush()
+                self._error_rows = []
+            self._last_flush = time.monotonic()
+
+    def _flush_periodically(self):
+        while not self._closed.wait(self.flush_interval):
+            if self.pending and time.monotonic() - self._last_flush >= self.flush_interval:
+                self.flush()
+
+    def close(self):
+        if self._report_f.closed:
+            return
+        self._closed.set()
+        self.flush()
+        with self._lock:
+            self._report_f.close()
+            self._errors_f.close()
+
+class ClientIndex:
+    """
+    Índice en memoria de client_report.csv por NumMensaje. Se carga una vez y
+    luego solo se leen las filas que el cliente agregó desde el último offset.
+    Se vacía al terminar cada corrida (finish) y cuando el archivo se volvió a
+    crear: otro inode, más corto que lo ya leído o con otro comienzo (el inode
+    se puede reutilizar y el cliente lo trunca en el lugar).
+    """
+    PREFIX_BYTES = 256
+
+    def __init__(self, path='client_report.csv'):
+        self.path = path
+        self.reset()
+
+    def reset(self):
+        self._rows = {}
+        self._fields = None
+        self._offset = 0
+        self._inode = None
+        self._mtime = None
+        self._prefix = b""
+
+    def _read_prefix(self):
+        with open(self.path, 'rb') as f:
+            return f.read(min(self._offset, self.PREFIX_BYTES))
+
+    def _stat(self):
+        """os.stat del archivo; si se volvió a crear, vacía el índice. None si no existe."""
+        try:
+            st = os.stat(self.path)
+            rewritten = st.st_ino != self._inode or st.st_size < self._offset
+            if not rewritten and st.st_mtime_ns != self._mtime and self._prefix:
+                # Escrito desde la última revisión: lo ya indexado no debe haber cambiado
+                rewritten = self._read_prefix() != self._prefix
+        except OSError:
+            return None
+        if rewritten:
+            # El cliente volvió a crear el archivo (nueva corrida)
+            self.reset()
+            self._inode = st.st_ino
+        self._mtime = st.st_mtime_ns
+        return st
+
+    def refresh(self, st=None):
+        """Indexa las líneas completas agregadas al archivo desde la última lectura"""
+        st = st or self._stat()
+        if st is None or st.st_size == self._offset:
+            return
+        size = st.st_size
+
+        with open(self.path, 'rb') as f:
+            f.seek(self._offset)
+            data = f.read(size - self._offset)
+        end = data.rfind(b"\n") + 1  # la última línea puede estar a medio escribir
+        if end == 0:
+            return
+        self._offset += end
+        if len(self._prefix) < self.PREFIX_BYTES:
+            self._prefix = self._read_prefix()
+
+        lines = data[:end].decode("utf-8").splitlines()
+        if self._fields is None:
+            self._fields = next(csv.reader(lines[:1]), None)
+            lines = lines[1:]
+        for values in csv.reader(lines):
+            if not values:
+                continue
+            row = dict(zip(self._fields, values))
+            self._rows[int(row["NumMensaje"])] = row
+
+    def get(self, num_msg):
+        # El archivo se revisa en cada búsqueda: una fila cacheada puede ser de una corrida anterior
+        st = self._stat()
+        row = self._rows.get(num_msg)
+        if row is None:
+            self.refresh(st)
+            row = self._rows.get(num_msg)
+        return row
+
+    def __len__(self):
+        return len(self._rows)
+
+client_index = ClientIndex('client_report.csv')
+
+def write_files(msg, num_msg, algo, fix_status, sink):
+    # Buscar el mensaje original de client_report.csv en el índice
+    if num_msg:
+        orig_row = client_index.get(num_msg)
+        if orig_row:
+            log.debug("Mensaje original: %s", orig_row)
+            report_row, error_row = build_rows(msg, num_msg, algo, fix_status, orig_row)
+            sink.add([report_row], [error_row] if error_row else [])
+    else:
+        sink.add(error_rows=[[None, None, None]])
+
+def write_files_batch(results, sink):
+    """
+    Escribe de una sola vez los resultados de un batch.
+    results: lista de (msg, num_msg, algo, fix_status)
+    """
+    report_rows = []
+    error_rows = []
+    for msg, num_msg, algo, fix_status in results:
+        if not num_msg:
+            error_rows.append([None, None, None])
+            continue
+        orig_row = client_index.get(num_msg)
+        if orig_row:
+            report_row, error_row = build_rows(msg, num_msg, algo, fix_status, orig_row)
+            report_rows.append(report_row)
+            if error_row:
+                error_rows.append(error_row)
+    sink.add(report_rows, error_rows)
+
+class FinishState:
+    """
+    Estado para finish. Las tramas pueden terminar fuera de orden (modo async),
+    así que el reporte solo se genera cuando ya se procesó expected_last y no
+    quedan tramas en vuelo.
+    """
+    def __init__(self):
+        self.max_processed_id = -1
+        self.pending_finish = False
+        self.finish_expected_last = None
+        self.finish_run_id = None
+        self.in_flight = 0
+
+    def frame_started(self, count=1):
+        self.in_flight += count
+
+    def frame_done(self, num_msg):
+        self.in_flight -= 1
+        if isinstance(num_msg, int):
+            self.max_processed_id = max(self.max_processed_id, num_msg)
+
+    def batch_done(self, num_msgs):
+        self.in_flight -= len(num_msgs)
+        ids = [n for n in num_msgs if isinstance(n, int)]
+        if ids:
+            self.max_processed_id = max(self.max_processed_id, max(ids))
+
+    def request_finish(self, expected_last, run_id=None):
+        self.pending_finish = True
+        self.finish_expected_last = expected_last
+        self.finish_run_id = run_id
+
+    def take_ready(self):
+        """Si el finish pendiente ya se cumplió, lo consume y retorna (expected_last, run_id)"""
+        expected = self.finish_expected_last
+        if not (self.pending_finish and isinstance(expected, int)):
+            return None
+        if self.max_processed_id < expected or self.in_flight > 0:
+            return None
+        run_id = self.finish_run_id
+        self.pending_finish = False
+        self.finish_expected_last = None
+        self.finish_run_id = None
+        return expected, run_id
@@ -0,0 +1,134 @@
+import math
+import time
+from bisect import bisect_left
+
+# Histogramas de latencia por etapa del servidor y por algoritmo.
+# - Etapas: recv (socket), parse (JSON), decode, present (bits -> ASCII), persist (CSV)
+# - Buckets logarítmicos fijos: registrar una muestra es un bisect y una suma,
+#   los percentiles tienen un error máximo de ~10%
+# - Se consultan con un mensaje {"type": "stats"} y se resumen al llegar el finish
+# - Además se cuentan las tramas por algoritmo y status: las DOUBLE (dos errores en
+#   Hamming SECDED) se descartan antes de presentarlas, las demás son útiles o no
+
+STAGES = ("recv", "parse", "decode", "present", "persist")
+
+# Clave de algoritmo para etapas donde todavía no se conoce (recv)
+ANY_ALGO = "*"
+
+# Status de tramas que el servidor descarta sin presentarlas ni compararlas
+DROPPED_STATUSES = ("DOUBLE",)
+
+# Status de tramas con datos entregados (goodput)
+GOOD_STATUSES = ("OK", "FIX")
+
+def _make_bounds(start_us=1.0, stop_us=1e8, factor=1.1):
+    bounds = []
+    b = start_us
+    while b < stop_us:
+        bounds.append(b)
+        b *= factor
+    return bounds
+
+# Límite superior de cada bucket en microsegundos (1 µs ... 100 s)
+BUCKET_BOUNDS_US = _make_bounds()
+
+class LatencyHistogram:
+    def __init__(self):
+        self.counts = [0] * (len(BUCKET_BOUNDS_US) + 1)  # el último bucket es el desborde
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float, n: int = 1):
+        """Registra n muestras de la misma duración (n > 1 para tiempos amortizados de un batch)"""
+        us = seconds * 1e6
+        self.counts[bisect_left(BUCKET_BOUNDS_US, us)] += n
+        self.count += n
+        self.total += seconds * n
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, q: float) -> float:
+        """Percentil q (0..1) en segundos: límite superior del bucket, acotado al máximo"""
+        if self.count == 0:
+            return 0.0
+        target = max(1, math.ceil(q * self.count))
+        seen = 0
+        for i, c in enumerate(self.counts):
+            seen += c
+            if seen >= target:
+                if i >= len(BUCKET_BOUNDS_US):
+                    return self.max
+                return min(BUCKET_BOUNDS_US[i] / 1e6, self.max)
+        return self.max
+
+    def summary(self) -> dict:
+        ms = lambda s: round(s * 1e3, 4)
+        return {
+            "count": self.count,
+            "mean_ms": ms(self.total / self.count) if self.count else 0.0,
+            "p50_ms": ms(self.percentile(0.50)),
+            "p95_ms": ms(self.percentile(0.95)),
+            "p99_ms": ms(self.percentile(0.99)),
+            "max_ms": ms(self.max),
+        }
+
+class StageStats:
+    """
+    Un histograma por (etapa, algoritmo). Se registra siempre desde el mismo hilo
+    (el loop del servidor o el hilo del event loop), así que no usa lock.
+    """
+    def __init__(self):
+        self._hists = {}
+        self._frames = {}  # algo -> {status: tramas}
+        self.started = time.time()
+
+    def record(self, stage: str, algo: str, seconds: float, n: int = 1):
+        hist = self._hists.get((stage, algo))
+        if hist is None:
+            hist = self._hists[(stage, algo)] = LatencyHistogram()
+        hist.record(seconds, n)
+
+    def count_status(self, algo: str, status: str, n: int = 1):
+        by_status = self._frames.setdefault(algo, {})
+        by_status[status] = by_status.get(status, 0) + n
+
+    def frame_counts(self) -> dict:
+        """{algo: {status: tramas, ..., "total", "good", "dropped"}}"""
+        counts = {}
+        for algo, by_status in sorted(self._frames.items()):
+            c = dict(sorted(by_status.items()))
+            c["total"] = sum(by_status.values())
+            c["good"] = sum(by_status.get(s, 0) for s in GOOD_STATUSES)
+            c["dropped"] = sum(by_status.get(s, 0) for s in DROPPED_STATUSES)
+            counts[algo] = c
+        return counts
+
+    def snapshot(self) -> dict:
+        """
+        {"uptime_s": ..., "stages": {etapa: {algo: {count, mean_ms, p50_ms, p95_ms, p99_ms, max_ms}}},
+         "frames": frame_counts()}
+        """
+        stages = {}
+        for (stage, algo), hist in sorted(self._hists.items(), key=lambda kv: (STAGES.index(kv[0][0]), kv[0][1])):
+            stages.setdefault(stage, {})[algo] = hist.summary()
+        return {"uptime_s": round(time.time() - self.started, 3), "stages": stages, "frames": self.frame_counts()}
+
+    def format_table(self) -> str:
+        """Resumen en texto, una fila por etapa y algoritmo, y las tramas por status"""
+        snapshot = self.snapshot()
+        lines = [f"{'etapa':<8} {'algo':<9} {'count':>8} {'p50_ms':>9} {'p95_ms':>9} {'p99_ms':>9} {'max_ms':>9}"]
+        for stage, by_algo in snapshot["stages"].items():
+            for algo, s in by_algo.items():
+                lines.append(f"{stage:<8} {algo:<9} {s['count']:>8} {s['p50_ms']:>9.3f} "
+                             f"{s['p95_ms']:>9.3f} {s['p99_ms']:>9.3f} {s['max_ms']:>9.3f}")
+        for algo, c in snapshot["frames"].items():
+            detail = ", ".join(f"{k}={v}" for k, v in c.items() if k not in ("total", "good", "dropped"))
+            lines.append(f"tramas {algo}: {c['total']} ({detail}); útiles {c['good']}, descartadas {c['dropped']}")
+        return "\n".join(lines)
+
+def timed_call(fn, *args):
+    """Ejecuta fn(*args) y retorna (resultado, segundos). Se puede enviar a otro proceso."""
+    t0 = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - t0
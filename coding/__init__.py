@@ -0,0 +1,33 @@
+# Núcleo compartido de los algoritmos de detección y corrección de errores.
+# Los módulos se importan la primera vez que se usan (coding.crc, coding.load("crc")),
+# así "import coding" no carga tablas ni NumPy:
+#   bitconv   conversión de bits a bytes/palabras
+#   hamming   código de Hamming (palabra, bloques, SECDED, lotes con NumPy)
+#   crc       CRC-32 y variantes, combinación y corrección
+#   fletcher  Fletcher y Adler-32
+# Los decoder.py de Parte1 y Parte2 son líneas de comandos sobre estos módulos.
+
+import importlib
+
+from ._lazy import numpy, numpy_available
+
+__all__ = ["bitconv", "hamming", "crc", "fletcher", "ALGORITHMS", "load", "numpy", "numpy_available"]
+
+# Algoritmo (como viene en el payload) -> módulo de coding
+ALGORITHMS = {
+    "hamming": "hamming",
+    "crc": "crc",
+    "fletcher": "fletcher",
+    "adler": "fletcher",  # Adler-32 usa las sumas de Fletcher
+}
+
+_SUBMODULES = ("bitconv", "hamming", "crc", "fletcher")
+
+def load(algo: str):
+    """Módulo del algoritmo (se importa la primera vez)"""
+    return importlib.import_module(f"{__name__}.{ALGORITHMS[algo]}")
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,49 @@
+# Verificación por pedazos, compartida por CRC y Fletcher: la trama [datos][checksum]
+# llega en pedazos de bits de cualquier largo y se procesa con memoria constante.
+
+# Caracteres que se leen de stdin por pedazo con "-"
+CHUNK_CHARS = 1 << 16
+
+class IncrementalVerifier:
+    """
+    Base de Crc32Verifier y FletcherVerifier: update(chunk) procesa los bloques
+    completos y solo guarda los últimos checksum_bits bits (que pueden ser el
+    checksum recibido) más los que no completan un bloque. Las subclases definen
+    consume(bits) y compare(checksum_str); finalize() retorna (status, info).
+    """
+    checksum_name = "checksum"
+
+    def __init__(self, checksum_bits: int, block_bits: int):
+        self.checksum_bits = checksum_bits
+        self.block_bits = block_bits
+        self.nbits = 0      # bits recibidos en total
+        self._pending = ""
+
+    def update(self, chunk: str):
+        self.nbits += len(chunk)
+        pending = self._pending + chunk
+        # Se procesan bloques completos dejando al menos checksum_bits sin procesar
+        ready = max(0, len(pending) - self.checksum_bits) // self.block_bits * self.block_bits
+        if ready:
+            self.consume(pending[:ready])
+            pending = pending[ready:]
+        self._pending = pending
+
+    def finalize(self):
+        if self.nbits < self.checksum_bits:
+            return "ERROR", f"Mensaje demasiado corto para contener {self.checksum_name}"
+        if len(self._pending) != self.checksum_bits:
+            return "ERROR", f"Los datos no son múltiplo de {self.block_bits} bits"
+        return self.compare(self._pending)
+
+def verify_bits_file(f, verifier: IncrementalVerifier, chunk_chars: int = CHUNK_CHARS):
+    """Verifica una trama leída de f por pedazos (sin guardarla completa). Retorna (status, info)."""
+    while True:
+        chunk = f.read(chunk_chars)
+        if not chunk:
+            break
+        chunk = "".join(chunk.split())
+        if chunk.strip("01"):
+            return "ERROR", "Contenido no binario (solo 0/1)"
+        verifier.update(chunk)
+    return verifier.finalize()
@@ -0,0 +1,24 @@
+# NumPy es opcional y cuesta ~100 ms importarlo: se importa la primera vez que un
+# kernel lo necesita (lotes de Hamming, tramas de Fletcher con muchos bloques), no al
+# importar coding. Así las líneas de comandos arrancan sin pagarlo.
+
+import importlib.util
+
+_numpy = False  # False: todavía no se intentó importar
+
+def numpy():
+    """El módulo numpy, o None si no está instalado (se importa una sola vez)"""
+    global _numpy
+    if _numpy is False:
+        try:
+            import numpy as np
+        except ImportError:
+            np = None
+        _numpy = np
+    return _numpy
+
+def numpy_available() -> bool:
+    """Si numpy está instalado, sin importarlo"""
+    if _numpy is not False:
+        return _numpy is not None
+    return importlib.util.find_spec("numpy") is not None
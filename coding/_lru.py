@@ -0,0 +1,45 @@
+# LRU acotado compartido por las cachés de los algoritmos (layouts de Hamming,
+# tablas de síndromes de CRC)
+
+import threading
+from collections import OrderedDict
+
+class LRUCache:
+    """
+    LRU acotado y thread-safe: get(*clave) arma el valor con build(*clave) la primera
+    vez que se pide y lo reutiliza después. Cuenta hits y misses para las estadísticas.
+    """
+
+    def __init__(self, build, maxsize: int):
+        self.build = build
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._values = OrderedDict()
+        self._lock = threading.Lock()  # el servidor async decodifica desde varios hilos
+
+    def get(self, *key):
+        with self._lock:
+            value = self._values.get(key)
+            if value is not None:
+                self.hits += 1
+                self._values.move_to_end(key)
+                return value
+            self.misses += 1
+        value = self.build(*key)  # fuera del lock: puede tardar (tramas grandes)
+        with self._lock:
+            self._values[key] = value
+            self._values.move_to_end(key)
+            while len(self._values) > self.maxsize:
+                self._values.popitem(last=False)
+        return value
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses,
+                    "size": len(self._values), "maxsize": self.maxsize}
+
+    def clear(self):
+        with self._lock:
+            self._values.clear()
+            self.hits = self.misses = 0
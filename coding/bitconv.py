@@ -0,0 +1,57 @@
+# Conversión de strings binarios ('0'/'1') a bytes, compartida por los algoritmos de coding/ y el servidor.
+# Toda la trama se convierte con un solo int(bits, 2).to_bytes(...), sin partirla en
+# strings de 8/16/32 caracteres. Los bits que no completan una palabra se ignoran.
+
+import sys
+from array import array
+
+# Tipo de array por ancho de palabra (el itemsize de 'I' y 'L' depende de la plataforma)
+_WORD_TYPECODES = {
+    16: next(c for c in "HIL" if array(c).itemsize == 2),
+    32: next(c for c in "ILQ" if array(c).itemsize == 4),
+}
+
+# Dígito hexadecimal (ASCII) -> valor del nibble, para palabras de 4 bits
+_HEX_NIBBLES = bytes.maketrans(b"0123456789abcdef", bytes(range(16)))
+
+def bits_to_bytes(bits: str) -> bytes:
+    """Bytes (big-endian) de los len(bits) // 8 primeros bytes completos de bits"""
+    n = len(bits) // 8
+    if n == 0:
+        return b""
+    if len(bits) != n * 8:
+        bits = bits[:n * 8]
+    return int(bits, 2).to_bytes(n, "big")
+
+def bits_to_words(bits: str, width: int):
+    """
+    Palabras de width bits (4, 8, 16 o 32) como secuencia de enteros: bytes para
+    4 y 8 bits, array para 16 y 32. Se puede recorrer e indexar como una lista.
+    """
+    if width == 8:
+        return bits_to_bytes(bits)
+    n = len(bits) // width
+    if width == 4:
+        if n == 0:
+            return b""
+        # Cada dígito hexadecimal es una palabra de 4 bits
+        return format(int(bits[:n * 4], 2), f"0{n}x").encode("ascii").translate(_HEX_NIBBLES)
+    if width not in _WORD_TYPECODES:
+        raise ValueError(f"Ancho de palabra no soportado: {width}")
+    if len(bits) != n * width:
+        bits = bits[:n * width]
+    words = array(_WORD_TYPECODES[width], bits_to_bytes(bits))
+    if sys.byteorder == "little":
+        words.byteswap()  # los bytes vienen en big-endian
+    return words
+
+def bits_to_ascii(bits: str) -> str:
+    """Texto de los bytes completos de bits, un carácter por byte (chr(0..255))"""
+    return bits_to_bytes(bits).decode("latin-1")
+
+def is_binary(s: str) -> bool:
+    return len(s) > 0 and all(c in "01" for c in s)
+
+def text_to_binary(text: str) -> str:
+    """Bits (8 por carácter) de un texto ASCII"""
+    return ''.join(f'{ord(c):08b}' for c in text)
@@ -0,0 +1,64 @@
+# Lectura de tramas para las líneas de comandos (decoder.py de Parte1 y Parte2)
+
+import json
+import sys
+
+from .bitconv import is_binary
+
+def read_bits_file(path: str) -> str:
+    """Lee un archivo y retorna su contenido binario (la primera línea no vacía)"""
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            s = "".join(line.strip().split())
+            if s:
+                return s
+    return ""
+
+def read_bits_stdin() -> str:
+    data = sys.stdin.read()
+    return "".join(data.strip().split())
+
+def parse_stream_line(line: str):
+    """Línea del modo --stream: bits sueltos o un objeto JSON. Retorna (bits, objeto)."""
+    line = line.strip()
+    if line.startswith("{"):
+        obj = json.loads(line)
+        if not isinstance(obj, dict):
+            raise ValueError("se esperaba un objeto JSON")
+        return str(obj.get("trama", "")), obj
+    return "".join(line.split()), {}
+
+def stream_field(obj: dict, key: str, default, types: tuple):
+    """Campo opcional de una línea JSON de --stream (null = ausente). ValueError si es de otro tipo."""
+    value = obj.get(key)
+    if value is None:
+        return default
+    # bool es subclase de int: true/false solo valen donde se espera un bool
+    if not isinstance(value, types) or (isinstance(value, bool) and bool not in types):
+        names = " o ".join({bool: "true/false", int: "entero", str: "texto"}[t] for t in types)
+        raise ValueError(f"{key} debe ser {names}: {json.dumps(value)}")
+    return value
+
+def run_stream(decode_fn, algo: str, inp=sys.stdin, out=sys.stdout):
+    """
+    Proceso de larga vida (--stream): una trama por línea en inp, un resultado JSON por línea en out.
+    decode_fn(bits, objeto) decodifica una trama binaria con los campos del JSON de la línea y
+    retorna el resultado (dict); si los bits no son binarios o la línea no es válida se escribe
+    un ERROR con algo. El "id" de la línea se copia al resultado.
+    """
+    for line in inp:
+        if not line.strip():
+            continue
+        obj = {}
+        try:
+            bits, obj = parse_stream_line(line)
+            if is_binary(bits):
+                result = decode_fn(bits, obj)
+            else:
+                result = {"algo": algo, "status": "ERROR", "error": "contenido no binario (solo 0/1)"}
+        except (ValueError, TypeError, KeyError) as e:  # JSON inválido o campos de otro tipo
+            result = {"algo": algo, "status": "ERROR", "error": f"Línea inválida: {e}"}
+        if "id" in obj:
+            result["id"] = obj["id"]
+        out.write(json.dumps(result, ensure_ascii=False) + "\n")
+        out.flush()
@@ -0,0 +1,399 @@
+# CRC - cálculo y verificación: CRC-32 (tabla, slicing-by-8 o zlib), variantes
+# parametrizables, combinación de segmentos y corrección por síndromes.
+# La línea de comandos está en Parte2/algorithms/CRC-32/decoder.py.
+
+import os
+import struct
+import zlib
+
+from ._incremental import CHUNK_CHARS, IncrementalVerifier, verify_bits_file
+from ._lru import LRUCache
+from .bitconv import bits_to_bytes
+
+def create_crc_table():
+    poly = 0xedb88320
+    table = []
+    for i in range(256):
+        c = i
+        for j in range(8):
+            if c & 1:
+                c = poly ^ (c >> 1)
+            else:
+                c = c >> 1
+        table.append(c & 0xffffffff)
+    return table
+
+crc_table = create_crc_table()
+
+def crc32(data, crc: int = 0):
+    """CRC-32 de data; crc es el CRC de los bytes anteriores (para continuar un cálculo)"""
+    crc ^= 0xffffffff
+    for byte in data:
+        crc = crc_table[(crc ^ byte) & 0xff] ^ (crc >> 8)
+    return crc ^ 0xffffffff
+
+# ---------- Slicing-by-8 ----------
+# tables[k][b] es el CRC de b seguido de k bytes en 0: con 8 tablas se procesan
+# 8 bytes por iteración (dos enteros de 32 bits) en vez de uno.
+
+def create_slicing_tables(count: int = 8):
+    tables = [crc_table]
+    for _ in range(count - 1):
+        prev = tables[-1]
+        tables.append([(c >> 8) ^ crc_table[c & 0xff] for c in prev])
+    return tables
+
+slicing_tables = create_slicing_tables()
+
+_bytes8 = struct.Struct("8B")
+
+# Con menos bytes el costo fijo (memoryview, unpack) no se recupera: se usa crc32
+SLICING_MIN_BYTES = 16
+
+def crc32_slicing8(data: bytes, crc: int = 0) -> int:
+    """Mismo resultado que crc32(data, crc), 8 bytes por iteración"""
+    if len(data) < SLICING_MIN_BYTES:
+        return crc32(data, crc)
+    t0, t1, t2, t3, t4, t5, t6, t7 = slicing_tables
+    crc ^= 0xffffffff
+    end = len(data) - len(data) % 8
+    for b0, b1, b2, b3, b4, b5, b6, b7 in _bytes8.iter_unpack(memoryview(data)[:end]):
+        # Los 4 primeros bytes se combinan con el CRC (little-endian), los otros 4 van directo
+        crc = (t7[b0 ^ (crc & 0xff)] ^ t6[b1 ^ ((crc >> 8) & 0xff)] ^ t5[b2 ^ ((crc >> 16) & 0xff)] ^ t4[b3 ^ (crc >> 24)]
+               ^ t3[b4] ^ t2[b5] ^ t1[b6] ^ t0[b7])
+    for byte in data[end:]:
+        crc = t0[(crc ^ byte) & 0xff] ^ (crc >> 8)
+    return crc ^ 0xffffffff
+
+# ---------- Backends ----------
+# table: la implementación original byte a byte; slicing8: tablas de 8 bytes;
+# zlib: zlib.crc32 (en C). Todos reciben bytes alineados y dan el mismo CRC;
+# el segundo argumento opcional es el CRC de los bytes anteriores.
+CRC_BACKENDS = {
+    "table": crc32,
+    "slicing8": crc32_slicing8,
+    "zlib": zlib.crc32,
+}
+
+crc_backend = "slicing8"
+_crc_fn = crc32_slicing8
+
+def set_crc_backend(name: str):
+    """Cambia el backend usado por verify_crc. Lanza ValueError si no existe."""
+    global crc_backend, _crc_fn
+    if name not in CRC_BACKENDS:
+        raise ValueError(f"Backend de CRC no soportado: {name} (usar {', '.join(CRC_BACKENDS)})")
+    crc_backend, _crc_fn = name, CRC_BACKENDS[name]
+
+set_crc_backend(os.environ.get("CRC32_BACKEND", crc_backend))
+
+# ---------- CRC parametrizable ----------
+# Cualquier CRC de 8 a 64 bits descrito por (width, poly, init, xorout, refin, refout),
+# con la notación del catálogo de CRCs: poly sin el bit x^width y sin reflejar.
+# CRC-32 (la variante por defecto) sigue usando el backend elegido arriba.
+
+def reflect(value: int, width: int) -> int:
+    """Invierte el orden de los width bits más bajos de value"""
+    return int(format(value, f"0{width}b")[::-1], 2)
+
+class CrcEngine:
+    """Un CRC con parámetros fijos. La tabla de 256 entradas se arma la primera vez que se usa."""
+
+    def __init__(self, width: int, poly: int, init: int = 0, xorout: int = 0,
+                 refin: bool = False, refout: bool = False):
+        if not 8 <= width <= 64:
+            raise ValueError(f"Ancho de CRC no soportado: {width} (8 a 64 bits)")
+        self.width = width
+        self.mask = (1 << width) - 1
+        self.poly = poly & self.mask
+        self.init = init & self.mask
+        self.xorout = xorout & self.mask
+        self.refin = refin
+        self.refout = refout
+        self._table = None
+
+    def table(self):
+        if self._table is None:
+            width, mask = self.width, self.mask
+            table = []
+            if self.refin:
+                # Bit menos significativo primero: polinomio reflejado
+                poly = reflect(self.poly, width)
+                for i in range(256):
+                    c = i
+                    for _ in range(8):
+                        c = (c >> 1) ^ poly if c & 1 else c >> 1
+                    table.append(c)
+            else:
+                top = 1 << (width - 1)
+                for i in range(256):
+                    c = i << (width - 8)
+                    for _ in range(8):
+                        c = ((c << 1) ^ self.poly) & mask if c & top else (c << 1) & mask
+                    table.append(c)
+            self._table = table
+        return self._table
+
+    def compute(self, data: bytes) -> int:
+        table = self.table()
+        if self.refin:
+            crc = reflect(self.init, self.width)
+            for byte in data:
+                crc = table[(crc ^ byte) & 0xff] ^ (crc >> 8)
+        else:
+            crc = self.init
+            shift, mask = self.width - 8, self.mask
+            for byte in data:
+                crc = table[((crc >> shift) ^ byte) & 0xff] ^ ((crc << 8) & mask)
+        if self.refin != self.refout:
+            crc = reflect(crc, self.width)
+        return crc ^ self.xorout
+
+_engines = {}
+
+def crc_engine(width: int, poly: int, init: int = 0, xorout: int = 0,
+               refin: bool = False, refout: bool = False) -> CrcEngine:
+    """CrcEngine cacheado por juego de parámetros"""
+    key = (width, poly, init, xorout, refin, refout)
+    engine = _engines.get(key)
+    if engine is None:
+        engine = _engines[key] = CrcEngine(*key)
+    return engine
+
+DEFAULT_VARIANT = "crc32"
+
+# Variantes por nombre (campo crc_variant del payload); check es el CRC de b"123456789"
+CRC_VARIANTS = {
+    "crc8":       dict(width=8,  poly=0x07, init=0x00, xorout=0x00, refin=False, refout=False, check=0xf4),
+    "crc16":      dict(width=16, poly=0x1021, init=0xffff, xorout=0x0000, refin=False, refout=False, check=0x29b1),
+    "crc16-arc":  dict(width=16, poly=0x8005, init=0x0000, xorout=0x0000, refin=True, refout=True, check=0xbb3d),
+    "crc32":      dict(width=32, poly=0x04c11db7, init=0xffffffff, xorout=0xffffffff, refin=True, refout=True,
+                       check=0xcbf43926),
+    "crc32c":     dict(width=32, poly=0x1edc6f41, init=0xffffffff, xorout=0xffffffff, refin=True, refout=True,
+                       check=0xe3069283),
+    "crc64":      dict(width=64, poly=0x42f0e1eba9ea3693, init=(1 << 64) - 1, xorout=(1 << 64) - 1,
+                       refin=True, refout=True, check=0x995dc9bbdf1939fa),
+    "crc64-ecma": dict(width=64, poly=0x42f0e1eba9ea3693, init=0, xorout=0, refin=False, refout=False,
+                       check=0x6c40df5f0b497347),
+}
+
+def crc_variant(name: str) -> CrcEngine:
+    """CrcEngine de una variante por nombre. Lanza ValueError si no existe."""
+    params = CRC_VARIANTS.get(name)
+    if params is None:
+        raise ValueError(f"Variante de CRC no soportada: {name} (usar {', '.join(CRC_VARIANTS)})")
+    return crc_engine(**{k: v for k, v in params.items() if k != "check"})
+
+def variant_crc_fn(name: str = None):
+    """(función bytes -> CRC, bits del CRC) de una variante; CRC-32 usa el backend activo"""
+    if name is None or name == DEFAULT_VARIANT:
+        return _crc_fn, 32
+    engine = crc_variant(name)
+    return engine.compute, engine.width
+
+# ---------- Combinación de CRCs ----------
+# crc(A + B) = crc(A) * x^(8 * len(B)) mod P  xor  crc(B), en la representación
+# reflejada del polinomio (como crc32_combine de zlib). Permite calcular el CRC de
+# segmentos por separado (por ejemplo en varios procesos) y unirlos.
+
+def _multmodp(a: int, b: int) -> int:
+    """a * b módulo el polinomio de CRC-32 (bits reflejados: x^0 es el bit 31)"""
+    m = 1 << 31
+    p = 0
+    while True:
+        if a & m:
+            p ^= b
+            if (a & (m - 1)) == 0:
+                break
+        m >>= 1
+        b = (b >> 1) ^ 0xedb88320 if b & 1 else b >> 1
+    return p
+
+def _x2n_table():
+    """x^(2^k) mod P para k = 0..31"""
+    table = [1 << 30]  # x^1
+    for _ in range(31):
+        table.append(_multmodp(table[-1], table[-1]))
+    return table
+
+_x2n = _x2n_table()
+
+def _x8nmodp(n: int) -> int:
+    """x^(8 n) mod P: desplazar un CRC n bytes"""
+    p = 1 << 31  # x^0
+    k = 3
+    while n:
+        if n & 1:
+            p = _multmodp(_x2n[k & 31], p)
+        n >>= 1
+        k += 1
+    return p
+
+def crc32_combine(crc_a: int, crc_b: int, len_b: int) -> int:
+    """CRC-32 de A + B a partir de crc(A), crc(B) y el largo de B en bytes"""
+    return _multmodp(_x8nmodp(len_b), crc_a) ^ crc_b
+
+def crc32_segment(bits: str):
+    """(CRC-32, bytes) de un segmento de bits múltiplo de 8, con el backend activo"""
+    data = bits_to_bytes(bits)
+    return _crc_fn(data), len(data)
+
+def crc32_join(parts) -> int:
+    """CRC-32 de la concatenación a partir de los (CRC, bytes) de cada segmento, en orden"""
+    crc = 0
+    for seg_crc, seg_len in parts:
+        crc = crc32_combine(crc, seg_crc, seg_len)
+    return crc
+
+def crc32_segments(segments) -> int:
+    """
+    CRC-32 de la concatenación de segmentos de bits (cada uno múltiplo de 8).
+    En paralelo: crc32_join(executor.map(crc32_segment, segments)).
+    """
+    return crc32_join(map(crc32_segment, segments))
+
+# ---------- Corrección de errores ----------
+# El síndrome (CRC calculado xor CRC recibido) de un error depende solo de las
+# posiciones de los bits invertidos y del largo de la trama, no de los datos. Por
+# cada largo se arma una tabla síndrome -> posiciones, así corregir 1 (o 2) bits
+# cuesta una búsqueda después de calcular el CRC.
+
+# Máximo de bits de la trama para tabular errores dobles (la tabla crece con n^2)
+CRC_DOUBLE_MAX_BITS = 512
+
+def _single_bit_syndromes(engine: CrcEngine, nbits: int):
+    """Síndrome de invertir cada bit (0..nbits-1) de una trama de nbits = datos + CRC"""
+    width, mask, table = engine.width, engine.mask, engine.table()
+    nbytes = (nbits - width) // 8
+    if engine.refin:
+        shift = lambda c: table[c & 0xff] ^ (c >> 8)
+    else:
+        shift = lambda c: (table[(c >> (width - 8)) & 0xff] ^ (c << 8)) & mask
+    # Un bit en el último byte de datos (el bit k del string es el valor 0x80 >> k);
+    # cada byte en 0 que le sigue "desplaza" el síndrome
+    current = [table[0x80 >> k] for k in range(8)]
+    data = [0] * (nbytes * 8)
+    for j in reversed(range(nbytes)):
+        data[j * 8:j * 8 + 8] = current
+        current = [shift(c) for c in current]
+    if engine.refin != engine.refout:
+        data = [reflect(c, width) for c in data]
+    # Un bit del CRC recibido cambia exactamente ese bit del síndrome
+    return data + [1 << (width - 1 - j) for j in range(width)]
+
+def build_syndrome_table(engine: CrcEngine, nbits: int, max_errors: int = 1) -> dict:
+    """
+    {síndrome: posiciones (base 0)} para errores de 1 bit y, con max_errors=2 y
+    nbits <= CRC_DOUBLE_MAX_BITS, de 2 bits. Los síndromes que corresponden a más
+    de un patrón de error quedan en None: no se pueden corregir.
+    """
+    single = _single_bit_syndromes(engine, nbits)
+    found = {}
+    for i, syn in enumerate(single):
+        found[syn] = None if syn in found else (i,)
+    if max_errors >= 2 and nbits <= CRC_DOUBLE_MAX_BITS:
+        for i in range(nbits):
+            si = single[i]
+            for j in range(i + 1, nbits):
+                syn = si ^ single[j]
+                found[syn] = None if syn in found else (i, j)
+    found.pop(0, None)
+    return found
+
+def variant_syndrome_table(nbits: int, variant: str, max_errors: int):
+    """build_syndrome_table para la variante por nombre (clave de syndrome_cache)"""
+    return build_syndrome_table(crc_variant(variant), nbits, max_errors)
+
+# Tablas de síndromes por (bits de la trama, variante, errores), acotado a 32 tablas
+syndrome_cache = LRUCache(variant_syndrome_table, maxsize=32)
+
+# ---------- Verificación incremental ----------
+
+class Crc32Verifier(IncrementalVerifier):
+    """
+    Verifica una trama que llega en pedazos de bits de cualquier largo, con memoria
+    constante (ver IncrementalVerifier): va calculando el CRC de los bytes completos.
+    finalize() retorna (status, info) como verify_crc.
+    """
+    checksum_name = "CRC"
+
+    def __init__(self):
+        super().__init__(32, 8)
+        self.crc = 0        # CRC de los bytes de datos ya procesados
+
+    def consume(self, bits: str):
+        self.crc = _crc_fn(bits_to_bytes(bits), self.crc)
+
+    def compare(self, received_crc_str: str):
+        received_crc = int(received_crc_str, 2)
+        if self.crc == received_crc:
+            return "OK", "CRCs coinciden"
+        return "ERROR", f"CRCs no coinciden: calculado {self.crc}; recibido {received_crc}"
+
+def verify_crc(received_message: str, verbose: bool = False, variant: str = None):
+    """
+    Verifica un mensaje con CRC32 (o con la variante indicada, ver CRC_VARIANTS)
+    Retorna (status, original_data, info)
+    status: "OK", "ERROR" 
+    original_data: datos originales sin CRC
+    info: información adicional para debug
+    """
+    status, original_data, _, info = decode_crc(received_message, verbose, variant)
+    return status, original_data, info
+
+def decode_crc(received_message: str, verbose: bool = False, variant: str = None, correct: int = 0):
+    """
+    Como verify_crc, pero con correct=1 (o 2) corrige errores de 1 (o hasta 2) bits
+    con la tabla de síndromes del largo de la trama.
+    Retorna (status, original_data, posiciones corregidas (base 1) o None, info)
+    status: "OK", "FIX" o "ERROR"
+    """
+    compute, checksum_bits = variant_crc_fn(variant)
+    if len(received_message) < checksum_bits:
+        return "ERROR", "", None, "Mensaje demasiado corto para contener CRC"
+    
+    data_part = received_message[:-checksum_bits]
+    received_crc_str = received_message[-checksum_bits:]
+    received_crc = int(received_crc_str, 2)
+    if verbose:
+        print(f"Mensaje recibido: {received_message}")
+        print(f"Longitud total: {len(received_message)} bits")
+        print(f"Parte de datos: {data_part} ({len(data_part)} bits)")
+        print(f"CRC recibido: {received_crc_str} ({received_crc})")
+    
+    # Convertir datos a bytes
+    if len(data_part) % 8 != 0:
+        return "ERROR", "", None, "Los datos no son múltiplo de 8 bits"
+    
+    data_bytes = bits_to_bytes(data_part)
+    
+    if verbose:
+        print(f"Bytes de datos: {list(data_bytes)}")
+        print(f"Bytes en hex: {[hex(b) for b in data_bytes]}")
+    
+    # Calcular CRC de los datos recibidos
+    calculated_crc = compute(data_bytes)
+    if verbose:
+        detail = f"backend {crc_backend}" if compute is _crc_fn else f"variante {variant}"
+        print(f"CRC calculado: {calculated_crc} ({detail})")
+    # Comparar CRCs
+    if calculated_crc == received_crc:
+        return "OK", data_part, None, "CRCs coinciden"
+
+    info = f"CRCs no coinciden: calculado {calculated_crc}; recibido {received_crc}"
+    if correct:
+        table = syndrome_cache.get(len(received_message), variant or DEFAULT_VARIANT, correct)
+        positions = table.get(calculated_crc ^ received_crc)
+        if positions:
+            bits = bytearray(received_message, "ascii")
+            for pos in positions:
+                bits[pos] ^= 1  # '0' <-> '1'
+            fixed = [pos + 1 for pos in positions]
+            if verbose:
+                print(f"Síndrome {calculated_crc ^ received_crc:#x}: se corrigen los bits {fixed}")
+            return "FIX", bits[:len(data_part)].decode("ascii"), fixed, f"{info}; corregidos los bits {fixed}"
+    return "ERROR", data_part, None, info
+
+def verify_crc_file(f, chunk_chars: int = CHUNK_CHARS):
+    """Verifica una trama CRC-32 leída de f por pedazos. Retorna (status, info)."""
+    return verify_bits_file(f, Crc32Verifier(), chunk_chars)
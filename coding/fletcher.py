@@ -0,0 +1,351 @@
+# Fletcher checksum y Adler-32 - cálculo y verificación: sumas en forma cerrada
+# (módulo diferido o NumPy), estado incremental combinable y variantes.
+# La línea de comandos está en Parte2/algorithms/FletcherChecksum/decoder.py.
+
+from itertools import accumulate
+
+from ._incremental import CHUNK_CHARS, IncrementalVerifier, verify_bits_file
+from ._lazy import numpy
+from .bitconv import bits_to_words, bits_to_ascii
+
+def binary_to_text(binary_str: str) -> str:
+    return bits_to_ascii(binary_str)
+
+def bytes_to_blocks(binary_str: str, block_size: int):
+    """Convierte string binario a una secuencia de enteros (bloques completos de block_size bits)"""
+    return bits_to_words(binary_str, block_size)
+
+def fletcher16_8(data):
+    """Fletcher 16 sobre bloques de 8 bits"""
+    sum1, sum2 = fletcher_checksum(data, 8)
+    # El checksum final es sum2 << 8 | sum1, pero en 16 bits
+    return sum1, sum2, (sum2 << 8) | sum1
+
+# ---------- Fletcher rápido ----------
+# Con n bloques b_0..b_{n-1}: sum1 = Σ b_i y sum2 = Σ (n - i) * b_i (mod 2^w - 1),
+# que es lo mismo que aplicar el módulo en cada paso, así que no hace falta el loop.
+# - Python: sum2 como suma de las sumas acumuladas (itertools.accumulate, en C),
+#   reduciendo módulo cada FLETCHER_DEFER_BLOCKS[w] bloques para que los enteros no
+#   pasen de 63 bits
+# - NumPy (trama de FLETCHER_NUMPY_MIN_BLOCKS bloques o más): los bloques en una
+#   matriz de tramos de FLETCHER_NUMPY_CHUNK[w] bloques; sum1 y sum2 por tramo son
+#   una suma y un producto con los pesos (k - i), sin desbordar int64
+
+def _defer_blocks(block_size: int, limit: int = 1 << 63) -> int:
+    """Mayor k (potencia de 2, hasta 2^20) con k * (k + 3) / 2 * (2^w - 1) < limit"""
+    k = 1
+    while k < 1 << 20 and (2 * k) * (2 * k + 3) // 2 * ((1 << block_size) - 1) < limit:
+        k *= 2
+    return k
+
+FLETCHER_DEFER_BLOCKS = {w: _defer_blocks(w) for w in (4, 8, 16, 32)}
+FLETCHER_NUMPY_CHUNK = {w: min(_defer_blocks(w), 1 << 16) for w in (4, 8, 16, 32)}
+FLETCHER_NUMPY_MIN_BLOCKS = 256  # con menos bloques el costo fijo de NumPy no se recupera
+
+_NUMPY_DTYPES = {4: "uint8", 8: "uint8", 16: "uint16", 32: "uint32"}
+
+def fletcher_sums_deferred(data, block_size: int, modulus: int = None):
+    """(sum1, sum2) en Python, con el módulo cada FLETCHER_DEFER_BLOCKS[block_size] bloques"""
+    modulus = modulus or (1 << block_size) - 1
+    k = FLETCHER_DEFER_BLOCKS[block_size]
+    sum1 = sum2 = 0
+    for start in range(0, len(data), k):
+        chunk = data[start:start + k]
+        # Cada bloque del tramo suma a sum2 el sum1 previo más la suma acumulada del tramo
+        sum2 = (sum2 + len(chunk) * sum1 + sum(accumulate(chunk))) % modulus
+        sum1 = (sum1 + sum(chunk)) % modulus
+    return sum1, sum2
+
+def fletcher_sums_numpy(data, block_size: int, modulus: int = None):
+    """(sum1, sum2) con NumPy; data es un buffer (bytes/array) o una secuencia de enteros"""
+    np = numpy()
+    modulus = modulus or (1 << block_size) - 1
+    try:
+        blocks = np.frombuffer(data, dtype=_NUMPY_DTYPES[block_size])
+    except TypeError:
+        blocks = np.asarray(data, dtype=_NUMPY_DTYPES[block_size])
+    n = len(blocks)
+    if n == 0:
+        return 0, 0
+    k = min(FLETCHER_NUMPY_CHUNK[block_size], n)
+    # Ceros al principio no cambian sum1 ni sum2: se completa el último tramo por delante
+    chunks = -(-n // k)
+    padded = np.zeros(chunks * k, dtype=np.int64)
+    padded[chunks * k - n:] = blocks
+    matrix = padded.reshape(chunks, k)
+    weights = np.arange(k, 0, -1, dtype=np.int64)
+    c1 = (matrix.sum(axis=1) % modulus).tolist()
+    c2 = ((matrix @ weights) % modulus).tolist()
+    # El tramo c tiene (chunks - 1 - c) tramos después: cada uno repite su sum1 k veces
+    sum1 = sum(c1) % modulus
+    sum2 = sum(b + (chunks - 1 - c) * k * a for c, (a, b) in enumerate(zip(c1, c2))) % modulus
+    return sum1, sum2
+
+def fletcher_checksum(data, block_size: int, modulus: int = None):
+    """
+    Calcula Fletcher checksum: (sum1, sum2), igual a fletcher_checksum_reference.
+    modulus por defecto es 2^block_size - 1 (Adler-32 usa 65521 con bloques de 8 bits).
+    """
+    if len(data) >= FLETCHER_NUMPY_MIN_BLOCKS and numpy() is not None:
+        return fletcher_sums_numpy(data, block_size, modulus)
+    return fletcher_sums_deferred(data, block_size, modulus)
+
+def fletcher_checksum_reference(data, block_size: int):
+    """Calcula Fletcher checksum (implementación original, un módulo por bloque)"""
+    modulus = (1 << block_size) - 1  # 2^block_size - 1
+    sum1 = 0  
+    sum2 = 0  
+    for byte_val in data:
+        sum1 = (sum1 + byte_val) % modulus
+        sum2 = (sum2 + sum1) % modulus
+    return sum1, sum2
+
+# ---------- Estado incremental ----------
+# Con las sumas de dos tramos A y B (B de n bloques), las de A seguido de B son
+#   sum1 = sum1_A + sum1_B - init
+#   sum2 = sum2_A + sum2_B + n * (sum1_A - init)
+# donde init es el valor inicial de sum1 (0 en Fletcher, 1 en Adler-32). Así una
+# trama se puede sumar por pedazos, o por segmentos en varios procesos y unirlos.
+
+ADLER_MODULUS = 65521  # Adler-32: mayor primo menor que 2^16, bloques de 8 bits
+
+class FletcherState:
+    """
+    Sumas de Fletcher (o Adler-32) de los bloques procesados hasta ahora.
+    update(blocks) agrega bloques, digest() retorna (sum1, sum2) y
+    combine(other, len_other) retorna el estado de estos bloques seguidos de los de other.
+    """
+
+    def __init__(self, block_size: int = 8, modulus: int = None, init: int = 0, sum_bits: int = None):
+        self.block_size = block_size
+        self.modulus = modulus or (1 << block_size) - 1
+        self.init = init
+        self.sum_bits = sum_bits or block_size  # bits de cada suma en el checksum
+        self.sum1 = init % self.modulus
+        self.sum2 = 0
+        self.length = 0  # bloques procesados
+
+    def params(self):
+        return self.block_size, self.modulus, self.init, self.sum_bits
+
+    def copy(self):
+        state = FletcherState(*self.params())
+        state.sum1, state.sum2, state.length = self.sum1, self.sum2, self.length
+        return state
+
+    def update(self, blocks):
+        """Agrega bloques (enteros de block_size bits, p. ej. bytes_to_blocks). Retorna self."""
+        sum1, sum2 = fletcher_checksum(blocks, self.block_size, self.modulus)
+        n = len(blocks)
+        self.sum2 = (self.sum2 + n * self.sum1 + sum2) % self.modulus
+        self.sum1 = (self.sum1 + sum1) % self.modulus
+        self.length += n
+        return self
+
+    def digest(self):
+        return self.sum1, self.sum2
+
+    def checksum_bits(self, order: str = None) -> str:
+        """Checksum como bits, en el orden de la trama: [sum2][sum1] (o [sum1][sum2] con order="sum1_sum2")"""
+        sum1, sum2 = format(self.sum1, f"0{self.sum_bits}b"), format(self.sum2, f"0{self.sum_bits}b")
+        return sum1 + sum2 if order == "sum1_sum2" else sum2 + sum1
+
+    def combine(self, other: "FletcherState", len_other: int = None):
+        """Estado de la concatenación; len_other son los bloques de other (por defecto other.length)"""
+        if other.params() != self.params():
+            raise ValueError("No se pueden combinar estados de checksums distintos")
+        if len_other is None:
+            len_other = other.length
+        state = self.copy()
+        state.sum1 = (self.sum1 + other.sum1 - self.init) % self.modulus
+        state.sum2 = (self.sum2 + other.sum2 + len_other * (self.sum1 - self.init)) % self.modulus
+        state.length = self.length + len_other
+        return state
+
+# ---------- Variantes ----------
+# La variante (tamaño de bloque y modo) y el orden de sum1/sum2 en el checksum viajan
+# explícitos: "fletcher_variant"/"fletcher_order" en el payload, --variant=/--order=
+# en la línea de comandos. Cada combinación se resuelve una vez a un ChecksumVerifier
+# cacheado, sin depender del largo de la trama.
+
+FLETCHER_VARIANTS = {
+    "fletcher8": {"block_size": 4},
+    "fletcher16": {"block_size": 8},
+    "fletcher32": {"block_size": 16},
+    "fletcher64": {"block_size": 32},
+    "adler32": {"block_size": 8, "modulus": ADLER_MODULUS, "init": 1, "sum_bits": 16},
+}
+DEFAULT_VARIANT = "fletcher16"
+
+# Orden de las sumas en el checksum; el de siempre es [sum2][sum1] (sum2 << w | sum1)
+FLETCHER_ORDERS = ("sum2_sum1", "sum1_sum2")
+DEFAULT_ORDER = "sum2_sum1"
+
+def variant_for_block_size(block_size: int) -> str:
+    """Variante de Fletcher de bloques de block_size bits (checksum de 2 * block_size bits)"""
+    for name, spec in FLETCHER_VARIANTS.items():
+        if spec["block_size"] == block_size and "modulus" not in spec:
+            return name
+    raise ValueError(f"El tamaño de bloque debe ser 4, 8, 16 o 32 bits (recibido {block_size})")
+
+def variant_state(variant: str = None) -> FletcherState:
+    """Estado inicial de la variante (FLETCHER_VARIANTS). Lanza ValueError si no existe."""
+    spec = FLETCHER_VARIANTS.get(variant or DEFAULT_VARIANT)
+    if spec is None:
+        raise ValueError(f"Variante de Fletcher no soportada: {variant}")
+    return FletcherState(**spec)
+
+def adler32_state() -> FletcherState:
+    """Estado de Adler-32: bloques de 8 bits, módulo 65521, sum1 empieza en 1, sumas de 16 bits"""
+    return variant_state("adler32")
+
+def new_state(block_size: int = 8, adler: bool = False) -> FletcherState:
+    return adler32_state() if adler else variant_state(variant_for_block_size(block_size))
+
+def fletcher_segment(bits: str, block_size: int = 8, adler: bool = False):
+    """(sum1, sum2, bloques) de un segmento de bits múltiplo de block_size"""
+    state = new_state(block_size, adler).update(bytes_to_blocks(bits, block_size))
+    return state.sum1, state.sum2, state.length
+
+def fletcher_join(parts, block_size: int = 8, adler: bool = False) -> FletcherState:
+    """
+    Estado de la concatenación a partir de los (sum1, sum2, bloques) de cada segmento,
+    en orden. En paralelo: fletcher_join(executor.map(fletcher_segment, segmentos)).
+    """
+    state = new_state(block_size, adler)
+    for sum1, sum2, length in parts:
+        segment = new_state(block_size, adler)
+        segment.sum1, segment.sum2, segment.length = sum1, sum2, length
+        state = state.combine(segment)
+    return state
+
+class FletcherVerifier(IncrementalVerifier):
+    """
+    Como Crc32Verifier: verifica una trama que llega en pedazos de bits de cualquier
+    largo con memoria constante, sumando los bloques completos en state.
+    finalize() retorna (status, info) como verify_fletcher.
+    """
+
+    def __init__(self, state: FletcherState, order: str = DEFAULT_ORDER):
+        super().__init__(2 * state.sum_bits, state.block_size)
+        self.state = state
+        self.order = order
+
+    def consume(self, bits: str):
+        self.state.update(bytes_to_blocks(bits, self.block_bits))
+
+    def compare(self, received_checksum_str: str):
+        return compare_checksum(self.state, received_checksum_str, self.order)
+
+def split_checksum(received_checksum_str: str, sum_bits: int, order: str = DEFAULT_ORDER):
+    """(sum1, sum2) recibidos, como strings de bits, según el orden del checksum"""
+    first, second = received_checksum_str[:sum_bits], received_checksum_str[sum_bits:]
+    return (first, second) if order == "sum1_sum2" else (second, first)
+
+def compare_checksum(state: FletcherState, received_checksum_str: str, order: str = DEFAULT_ORDER):
+    """Compara las sumas del estado con el checksum recibido. Retorna (status, info)."""
+    received_sum1, received_sum2 = (int(b, 2) for b in split_checksum(received_checksum_str, state.sum_bits, order))
+    calculated_sum1, calculated_sum2 = state.digest()
+    if calculated_sum1 == received_sum1 and calculated_sum2 == received_sum2:
+        return "OK", "Checksums coinciden"
+    return "ERROR", f"Checksums no coinciden: calculado sum1={calculated_sum1}, sum2={calculated_sum2}; recibido sum1={received_sum1}, sum2={received_sum2}"
+
+class ChecksumVerifier:
+    """
+    Verificador de una variante y un orden de checksum, armado una sola vez
+    (ver fletcher_verifier). verify(trama) retorna (status, data_part, info).
+    """
+
+    def __init__(self, variant: str = None, order: str = None):
+        self.variant = variant or DEFAULT_VARIANT
+        self.order = order or DEFAULT_ORDER
+        if self.order not in FLETCHER_ORDERS:
+            raise ValueError(f"Orden de checksum no soportado: {self.order}")
+        self.params = variant_state(self.variant).params()
+        self.block_size, self.modulus, _, self.sum_bits = self.params
+        self.checksum_bits = 2 * self.sum_bits
+
+    def new_state(self) -> FletcherState:
+        return FletcherState(*self.params)
+
+    def verify(self, received_message: str, verbose: bool = False):
+        if verbose:
+            return verify_checksum(received_message, self.new_state(), True, self.order)
+        data_len = len(received_message) - self.checksum_bits
+        if data_len < 0:
+            return "ERROR", "", "Mensaje demasiado corto para contener checksum"
+        if data_len % self.block_size:
+            return "ERROR", "", f"Los datos no son múltiplo de {self.block_size} bits"
+        data_part = received_message[:data_len]
+        state = self.new_state().update(bytes_to_blocks(data_part, self.block_size))
+        status, info = compare_checksum(state, received_message[data_len:], self.order)
+        return status, data_part, info
+
+_verifiers = {}
+
+def fletcher_verifier(variant: str = None, order: str = None) -> ChecksumVerifier:
+    """ChecksumVerifier de la variante y el orden (cacheado). Lanza ValueError si no son válidos."""
+    key = (variant or DEFAULT_VARIANT, order or DEFAULT_ORDER)
+    verifier = _verifiers.get(key)
+    if verifier is None:
+        verifier = _verifiers[key] = ChecksumVerifier(*key)
+    return verifier
+
+def verify_fletcher(received_message: str, block_size: int = 16, verbose: bool = False):
+    return fletcher_verifier(variant_for_block_size(block_size)).verify(received_message, verbose)
+
+def verify_checksum(received_message: str, state: FletcherState, verbose: bool = False, order: str = DEFAULT_ORDER):
+    """
+    Verifica un mensaje [datos][checksum] con las sumas de state (Fletcher o Adler-32)
+    Retorna (status, data_part, info)
+    """
+    block_size = state.block_size
+    # Los últimos 2 * sum_bits bits son el checksum
+    checksum_bits = state.sum_bits * 2
+    if len(received_message) < checksum_bits:
+        return "ERROR", "", "Mensaje demasiado corto para contener checksum"
+    
+    data_part = received_message[:-checksum_bits]
+    received_checksum_str = received_message[-checksum_bits:]
+    if verbose:
+        received_sum1_str, received_sum2_str = split_checksum(received_checksum_str, state.sum_bits, order)
+        received_sum2 = int(received_sum2_str, 2)
+        received_sum1 = int(received_sum1_str, 2)
+        print(f"Mensaje recibido: {received_message}")
+        print(f"Longitud total: {len(received_message)} bits")
+        print(f"Parte de datos: {data_part} ({len(data_part)} bits)")
+        print(f"Checksum recibido: sum1={received_sum1_str} ({received_sum1}), sum2={received_sum2_str} ({received_sum2})")
+    
+    # Convertir datos a bloques
+    if len(data_part) % block_size != 0:
+        return "ERROR", "", f"Los datos no son múltiplo de {block_size} bits"
+    
+    data_blocks = bytes_to_blocks(data_part, block_size)
+    
+    if verbose:
+        print(f"Bloques de datos: {list(data_blocks)}")
+        print(f"Bloques en hex: {[hex(b) for b in data_blocks]}")
+        print_steps(data_blocks, state)
+    
+    # Calcular checksum de los datos recibidos
+    state.update(data_blocks)
+    if verbose:
+        print(f"Checksum calculado: sum1={state.sum1}, sum2={state.sum2}")
+    # Comparar checksums
+    status, info = compare_checksum(state, received_checksum_str, order)
+    return status, data_part, info
+
+def print_steps(data_blocks, state: FletcherState):
+    """Detalle de verificación: sum1 y sum2 después de cada bloque (modo --verbose)"""
+    width = state.sum_bits
+    print(f"  Detalle de verificación (bloques de {state.block_size} bits, módulo {state.modulus}):")
+    print("    Dato   Sum1   Sum2")
+    sum1_step, sum2_step = state.sum1, state.sum2
+    for block in data_blocks:
+        sum1_step = (sum1_step + block) % state.modulus
+        sum2_step = (sum2_step + sum1_step) % state.modulus
+        print(f"    {format(block, f'0{state.block_size}b')} ({block})   {format(sum1_step, f'0{width}b')} ({sum1_step})   {format(sum2_step, f'0{width}b')} ({sum2_step})")
+
+def verify_fletcher_file(f, state: FletcherState, chunk_chars: int = CHUNK_CHARS, order: str = DEFAULT_ORDER):
+    """Verifica una trama leída de f por pedazos con las sumas de state. Retorna (status, info)."""
+    return verify_bits_file(f, FletcherVerifier(state, order), chunk_chars)
@@ -0,0 +1,465 @@
+# Código de Hamming - decodificación: una palabra, bloques (n, k), SECDED y lotes con NumPy.
+# La línea de comandos está en Parte2/algorithms/HammingCode/decoder.py.
+
+from ._lazy import numpy
+from ._lru import LRUCache
+
+def is_pow2(x: int) -> bool:
+    return x > 0 and (x & (x - 1)) == 0
+
+def infer_r_from_n(n: int) -> int:
+    r = 0
+    while (1 << r) < (n + 1):
+        r += 1
+    return r
+
+def _popcount(x: int) -> int:
+    return bin(x).count("1")
+
+# int.bit_count existe desde Python 3.10
+popcount = getattr(int, "bit_count", _popcount)
+
+class HammingLayout:
+    """Todo lo que depende solo del largo n de la trama; se calcula una vez por largo"""
+
+    def __init__(self, n: int):
+        self.n = n
+        self.r = infer_r_from_n(n)
+
+        # Máscara de cada bit de paridad p = 2^i sobre la trama como entero:
+        # el bit de la posición pos (1..n) es el bit n - pos del entero
+        self.masks = []
+        for i in range(self.r):
+            p = 1 << i
+            # Patrón por posición 0..n: p ceros, p unos, ... (pos & p != 0)
+            pattern = ("0" * p + "1" * p) * ((n + 1) // (2 * p) + 1)
+            self.masks.append(int(pattern[1:n + 1], 2))
+
+        # Índices [inicio, fin) de los bloques de datos: entre 2^k y 2^(k+1) (sin incluirlos)
+        self.data_slices = []
+        p = 2
+        while p <= n:
+            self.data_slices.append((p, min(2 * p - 1, n)))
+            p *= 2
+
+        # Índices (base 0) de las posiciones de datos
+        self.data_idx = [pos - 1 for pos in range(1, n + 1) if not is_pow2(pos)]
+
+        # Síndrome -> posición a corregir (0 si es OK o si apunta fuera de la trama: DROP)
+        self.syndrome_table = [s if s <= n else 0 for s in range(1 << self.r)]
+
+        self._check_matrix = None
+
+    def check_matrix(self):
+        """
+        (H, pesos, índices de datos) para NumPy: H es r x n con H[i, pos-1] = bit i
+        de pos y los pesos 2^i arman el síndrome. Se calcula la primera vez que se usa.
+        """
+        if self._check_matrix is None:
+            np = numpy()
+            positions = np.arange(1, self.n + 1)
+            H = ((positions[None, :] >> np.arange(self.r)[:, None]) & 1).astype(np.int32)
+            weights = (1 << np.arange(self.r)).astype(np.int64)
+            self._check_matrix = (H, weights, np.array(self.data_idx, dtype=np.intp))
+        return self._check_matrix
+
+# HammingLayout por largo, acotado a 64 largos
+layout_cache = LRUCache(HammingLayout, maxsize=64)
+
+def decode_hamming_fast(codeword: str):
+    """
+    Misma salida que decode_hamming, tratando la trama como un solo entero:
+    síndrome con máscaras de paridad y popcount, datos con slices entre potencias de 2.
+    """
+    n = len(codeword)
+    layout = layout_cache.get(n)
+    syndrome = 0
+    if n:
+        value = int(codeword, 2)
+        for i, mask in enumerate(layout.masks):
+            if popcount(value & mask) & 1:
+                syndrome |= 1 << i
+
+    fixed_pos = None
+    fixed_code = None
+    code = codeword
+
+    if syndrome == 0:
+        status = "OK"
+    elif layout.syndrome_table[syndrome]:
+        flipped = "1" if code[syndrome - 1] == "0" else "0"
+        code = code[:syndrome - 1] + flipped + code[syndrome:]
+        fixed_pos = syndrome
+        fixed_code = code
+        status = "FIX"
+    else:
+        status = "DROP"
+
+    message = "".join([code[a:b] for a, b in layout.data_slices])
+    return status, message, fixed_pos, fixed_code
+
+def decode_hamming_batch(frames):
+    """
+    Decodifica muchas tramas a la vez con NumPy. Agrupa por largo en matrices uint8,
+    calcula todos los síndromes como (bits @ H^T) mod 2 y corrige con indexación.
+    Retorna (statuses, data_bits, fix_pos) como arrays alineados con frames;
+    fix_pos es 0 cuando no hubo corrección (las posiciones empiezan en 1).
+    """
+    np = numpy()
+    if np is None:
+        raise ImportError("decode_hamming_batch requiere numpy")
+    frames = list(frames)
+    count = len(frames)
+    statuses = np.empty(count, dtype="<U4")
+    data_bits = np.empty(count, dtype=object)
+    fix_pos = np.zeros(count, dtype=np.int64)
+
+    groups = {}
+    for i, f in enumerate(frames):
+        if f.count("0") + f.count("1") == len(f):
+            groups.setdefault(len(f), []).append(i)
+        else:
+            # Entradas que no son solo 0/1: misma salida que decode_hamming
+            status, msg, pos, _ = decode_hamming_reference(f)
+            statuses[i], data_bits[i], fix_pos[i] = status, msg, pos or 0
+
+    for n, idxs in groups.items():
+        idxs = np.array(idxs)
+        if n == 0:
+            statuses[idxs] = "OK"
+            data_bits[idxs] = ""
+            continue
+        H, weights, data_idx = layout_cache.get(n).check_matrix()
+        joined = "".join(frames[i] for i in idxs).encode("ascii")
+        bits = (np.frombuffer(joined, dtype=np.uint8) - ord("0")).reshape(len(idxs), n)
+
+        syndrome = ((bits @ H.T) & 1) @ weights
+        fixable = (syndrome > 0) & (syndrome <= n)
+        rows = np.flatnonzero(fixable)
+        bits[rows, syndrome[rows] - 1] ^= 1
+
+        statuses[idxs] = np.where(syndrome == 0, "OK", np.where(fixable, "FIX", "DROP"))
+        fix_pos[idxs] = np.where(fixable, syndrome, 0)
+
+        m = len(data_idx)
+        text = (bits[:, data_idx] + ord("0")).astype(np.uint8).tobytes().decode("ascii")
+        data_bits[idxs] = [text[j * m:(j + 1) * m] for j in range(len(idxs))]
+
+    return statuses, data_bits, fix_pos
+
+# ---------- Hamming por bloques ----------
+# La trama se parte en bloques de n bits, cada uno un código de Hamming (n, k) que
+# corrige su propio error. El último bloque puede ser más corto (código acortado
+# con los k' < k bits de datos que sobran), igual que lo arma el encoder.
+
+BLOCK_CODES = {7: 4, 15: 11, 31: 26, 63: 57}
+
+# Hasta este largo (bits) las copias de la trama se apilan con una multiplicación;
+# en tramas más largas la multiplicación cuesta más que r shifts
+STACK_MUL_MAX_BITS = 256
+
+class BlockCode:
+    """
+    Decodificación de todos los bloques (n, k) de una trama a la vez, con la trama
+    como un solo entero: un campo de n bits por bloque (el primero en el campo más
+    alto) y el último bloque acortado rellenado con ceros al final, que no cambian
+    su síndrome. Las r copias de la trama, cada una con la máscara de un bit de
+    paridad, se apilan en un solo entero y un plegado con shifts (x ^= x >> 1,
+    x ^= x >> 2, ...) deja en el bit más bajo de cada campo el XOR de sus bits:
+    el bit i del síndrome de cada bloque. Si todos son 0 no se recorre ningún bloque.
+    """
+
+    def __init__(self, n: int):
+        layout = layout_cache.get(n)
+        self.n = n
+        self.r = layout.r
+        self.masks = layout.masks
+        # El plegado deja en cada bit el XOR de una ventana de 2^r = n + 1 bits. Con la
+        # trama corrida 1 bit, la ventana que termina en el bit más bajo de cada campo
+        # es el campo más la posición 1 del bloque siguiente. Solo la máscara de paridad 1
+        # contiene la posición 1, así que ahí se quita y se suma aparte.
+        self.first_pos = 1 << (n - 1)
+        self.fold_masks = [layout.masks[0] & ~self.first_pos] + layout.masks[1:]
+        self.fold_shifts = [1 << i for i in range(self.r)]
+        # Columnas de paridad (posiciones 2^i, base 0), de mayor a menor para borrarlas
+        self.parity_offsets = [(1 << i) - 1 for i in reversed(range(self.r))]
+        self._frame_masks = {}
+
+    def frame_masks(self, count: int):
+        """
+        Máscaras de una trama de count campos: (offsets de cada copia, multiplicador que
+        apila las copias, máscaras apiladas, bits bajos de los campos de todas las copias,
+        bits bajos de una copia, posición 1 corrida 1 bit).
+        Cada copia ocupa count * n + 1 bits: la trama corrida 1 bit.
+        """
+        cached = self._frame_masks.get(count)
+        if cached is None:
+            width = count * self.n + 1
+            lsb = int(("0" * (self.n - 1) + "1") * count, 2)
+            offsets = [i * width for i in range(self.r)]
+            # m * lsb repite m en cada campo
+            stacked = sum(((m * lsb) << 1) << off for m, off in zip(self.fold_masks, offsets))
+            lsb_all = sum(lsb << off for off in offsets)
+            repeat = sum(1 << off for off in offsets)
+            cached = (offsets, repeat, stacked, lsb_all, lsb, (self.first_pos * lsb) << 1)
+            if len(self._frame_masks) < 256:
+                self._frame_masks[count] = cached
+        return cached
+
+    def syndromes(self, value: int, count: int, pad: int = 0):
+        """
+        Lista de (índice de bloque, síndrome) de los count campos con síndrome distinto de 0.
+        value es la trama sin rellenar; pad, los ceros que le faltan al último bloque.
+        """
+        n = self.n
+        if count == 1:
+            # Un solo bloque: conteo de bits por máscara, como en decode_hamming_fast
+            value <<= pad
+            syndrome = 0
+            for i, mask in enumerate(self.masks):
+                if popcount(value & mask) & 1:
+                    syndrome |= 1 << i
+            return [(0, syndrome)] if syndrome else []
+
+        offsets, repeat, stacked, lsb_all, lsb, first_mask = self._frame_masks.get(count) or self.frame_masks(count)
+        shifted = value << (pad + 1)  # relleno y el bit extra de la ventana, en un solo shift
+        if count * n <= STACK_MUL_MAX_BITS:
+            x = shifted * repeat
+        else:
+            x = shifted
+            for off in offsets[1:]:
+                x |= shifted << off
+        x &= stacked
+        for shift in self.fold_shifts:
+            x ^= x >> shift
+        x ^= (shifted & first_mask) >> n  # posición 1, en la primera copia
+        x &= lsb_all
+        if not x:
+            return []
+
+        # Bit i del síndrome de cada bloque: de la copia i al bit i de su campo
+        packed = 0
+        for i, off in enumerate(offsets):
+            packed |= ((x >> off) & lsb) << i
+        found = []
+        fields = format(packed, f"0{count * n}b")
+        i = fields.find("1")
+        while i != -1:
+            idx = i // n
+            found.append((idx, int(fields[idx * n:(idx + 1) * n], 2)))
+            i = fields.find("1", (idx + 1) * n)
+        return found
+
+    def data_bits(self, bits: bytearray) -> str:
+        """
+        Borra (en el mismo bytearray) las columnas de paridad de todos los bloques y
+        retorna los datos. En un último bloque acortado solo se borran las que alcanza.
+        """
+        period = self.n
+        for offset in self.parity_offsets:
+            del bits[offset::period]
+            period -= 1
+        return bits.decode("ascii")
+
+    def decode(self, codeword: str):
+        """
+        Decodifica todos los bloques de codeword. Retorna (datos, posiciones corregidas,
+        trama corregida o None, True si el último bloque acortado no se puede corregir).
+        """
+        n = self.n
+        length = len(codeword)
+        if not length:
+            return "", [], None, False
+        count = -(-length // n)
+        tail = length - (count - 1) * n  # largo del último bloque (n si está completo)
+        found = self.syndromes(int(codeword, 2), count, n - tail)
+        bits = bytearray(codeword, "ascii")
+        fixes = []
+        dropped = False
+        for idx, syndrome in found:
+            if idx == count - 1 and syndrome > tail:
+                # El síndrome apunta fuera del bloque acortado: no se corrige
+                dropped = True
+                continue
+            pos = idx * n + syndrome
+            bits[pos - 1] ^= 1  # '0' <-> '1'
+            fixes.append(pos)
+        fixed_code = bits.decode("ascii") if fixes else None
+        return self.data_bits(bits), fixes, fixed_code, dropped
+
+_block_codes = {}
+
+def block_code(n: int) -> BlockCode:
+    if n not in BLOCK_CODES:
+        raise ValueError(f"Bloque no soportado: {n} (usar {', '.join(map(str, BLOCK_CODES))})")
+    code = _block_codes.get(n)
+    if code is None:
+        code = _block_codes[n] = BlockCode(n)
+    return code
+
+def _combine_blocks(codeword: str, parts, fixes, dropped: bool):
+    """Arma (status, datos, posiciones corregidas, trama corregida) de la trama completa"""
+    fixed_code = None
+    if fixes:
+        bits = bytearray(codeword, "ascii")
+        for pos in fixes:
+            bits[pos - 1] ^= 1  # '0' <-> '1'
+        fixed_code = bits.decode("ascii")
+    status = "DROP" if dropped else ("FIX" if fixes else "OK")
+    return status, "".join(parts), fixes or None, fixed_code
+
+def decode_hamming_blocks(codeword: str, n: int):
+    """
+    Decodifica una trama de bloques (n, k). Cada bloque corrige hasta un error.
+    Retorna (status, datos, posiciones corregidas (base 1, en la trama) o None, trama corregida).
+    status: OK, FIX si se corrigió algún bloque, DROP si el bloque final acortado no se puede corregir.
+    """
+    code = _block_codes.get(n) or block_code(n)  # block_code valida n
+    data, fixes, fixed_code, dropped = code.decode(codeword)
+    status = "DROP" if dropped else ("FIX" if fixes else "OK")
+    return status, data, fixes or None, fixed_code
+
+def decode_hamming_blocks_reference(codeword: str, n: int, verbose: bool = False):
+    """decode_hamming_blocks bloque por bloque con la implementación original (para --verbose)"""
+    block_code(n)  # valida n
+    parts = []
+    fixes = []
+    dropped = False
+    for start in range(0, len(codeword), n):
+        if verbose:
+            print(f"--- Bloque {start // n + 1} (bits {start + 1}-{min(start + n, len(codeword))}) ---")
+        status, data, pos, _ = decode_hamming_reference(codeword[start:start + n], verbose)
+        parts.append(data)
+        if status == "FIX":
+            fixes.append(start + pos)
+        elif status == "DROP":
+            dropped = True
+    return _combine_blocks(codeword, parts, fixes, dropped)
+
+# ---------- Hamming extendido (SECDED) ----------
+# Al final de la palabra va un bit de paridad global (XOR de todos los bits anteriores).
+# Corrige un error y detecta dos: con síndrome distinto de 0 y paridad global par
+# hubo dos errores, y en vez de "corregir" el bit equivocado se retorna DOUBLE.
+
+def decode_hamming_secded(codeword: str, verbose: bool = False, fast: bool = True):
+    """
+    Decodifica una palabra de Hamming extendido. Retorna (status, datos, posición corregida, trama corregida).
+    status: OK, FIX (un error, puede ser el bit de paridad global), DOUBLE (dos errores, sin datos)
+    o DROP (el síndrome apunta fuera de la palabra).
+    """
+    if not codeword:
+        return "OK", "", None, None
+    body = codeword[:-1]
+    status, data, pos, fixed_code = decode_hamming_fast(body) if fast else decode_hamming_reference(body, verbose)
+    odd = codeword.count("1") & 1
+    if verbose:
+        print(f"Paridad global: {'impar' if odd else 'par'}")
+
+    if not odd:
+        if status == "OK":
+            return status, data, None, None
+        # Síndrome distinto de 0 con paridad global par: dos errores, no se corrige
+        if verbose:
+            print("Dos errores detectados (síndrome != 0, paridad global par)")
+        return "DOUBLE", "", None, None
+    if status == "OK":
+        # Solo falla la paridad global: el error está en el último bit
+        flipped = "1" if codeword[-1] == "0" else "0"
+        return "FIX", data, len(codeword), body + flipped
+    if status == "FIX":
+        return status, data, pos, fixed_code + codeword[-1]
+    return status, data, pos, fixed_code
+
+def decode_hamming_secded_blocks(codeword: str, n: int, verbose: bool = False, fast: bool = True):
+    """
+    Bloques (n + 1, k) de Hamming extendido, decodificados uno por uno.
+    Si algún bloque tiene dos errores la trama completa es DOUBLE.
+    """
+    block_code(n)  # valida n
+    width = n + 1
+    parts = []
+    fixes = []
+    statuses = set()
+    for start in range(0, len(codeword), width):
+        if verbose:
+            print(f"--- Bloque {start // width + 1} (bits {start + 1}-{min(start + width, len(codeword))}) ---")
+        status, data, pos, _ = decode_hamming_secded(codeword[start:start + width], verbose, fast)
+        statuses.add(status)
+        parts.append(data)
+        if status == "FIX":
+            fixes.append(start + pos)
+    if "DOUBLE" in statuses:
+        return "DOUBLE", "", None, None
+    return _combine_blocks(codeword, parts, fixes, "DROP" in statuses)
+
+def decode_hamming(codeword: str, verbose: bool=False, block: int=None, secded: bool=False):
+    """
+    Decodifica la trama como un solo código de Hamming o, con block=n, como bloques (n, k).
+    Con secded=True cada palabra lleva además el bit de paridad global (ver decode_hamming_secded).
+    Retorna (status, datos, posición corregida, trama corregida); en modo bloques la
+    posición corregida es la lista de posiciones.
+    """
+    fast = not verbose and codeword.count("0") + codeword.count("1") == len(codeword)
+    if secded:
+        if block:
+            return decode_hamming_secded_blocks(codeword, block, verbose, fast)
+        return decode_hamming_secded(codeword, verbose, fast)
+    if block:
+        if fast:
+            return decode_hamming_blocks(codeword, block)
+        return decode_hamming_blocks_reference(codeword, block, verbose)
+    # Ruta rápida; la original se mantiene para --verbose y entradas que no son solo 0/1
+    if fast:
+        return decode_hamming_fast(codeword)
+    return decode_hamming_reference(codeword, verbose)
+
+def decode_hamming_reference(codeword: str, verbose: bool=False):
+    n = len(codeword)
+    r = infer_r_from_n(n)
+
+    # La posición del array empieza en 1
+    code = [0] * (n + 1) 
+    for i, ch in enumerate(codeword, start=1):
+        code[i] = int(ch)
+
+    syndrome = 0 # código de error
+    if verbose:
+        print(f"n={n}, r={r}")
+        print("Trama recibida:", codeword)
+
+    for i in range(r):
+        p = 1 << i
+        parity = 0
+        for pos in range(1, n + 1):
+            if pos & p:
+                parity ^= code[pos]
+        if parity != 0:
+            syndrome |= p
+
+    if verbose:
+        print(f"Síndrome (dec)={syndrome}, (bin)={syndrome:0{r}b}")
+
+    fixed_pos = None
+    fixed_code = None
+
+    if syndrome == 0:
+        status = "OK"
+    elif 1 <= syndrome <= n:
+        code[syndrome] ^= 1  
+        fixed_pos = syndrome
+        fixed_code = "".join(str(bit) for bit in code[1:])
+        if verbose:
+            print(f"Se corrige bit en posición {syndrome}.")
+            print(f"Trama corregida: {fixed_code}")
+        status = "FIX"
+    else:
+        status = "DROP"
+
+    # Extraer solo datos (posiciones que NO son potencias de 2)
+    data_bits = []
+    for pos in range(1, n + 1):
+        if not is_pow2(pos):
+            data_bits.append(str(code[pos]))
+    message = "".join(data_bits)
+
+    return status, message, fixed_pos, fixed_code